@@ -0,0 +1,110 @@
+"""
+결과 저장 포맷별 쓰기/읽기 속도 측정
+
+fixtures의 인재 카드를 반복해서 N행을 만든 뒤
+JSON / Excel / CSV / Parquet / Arrow로 저장하고 pandas로 다시 읽는 시간을 비교합니다.
+(Parquet/Arrow는 pyarrow, 읽기 측정은 pandas 필요)
+
+사용법:
+    python -m benchmarks.bench_export [행 수]
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from src.exporter import EXPORTERS, ExcelExporter, StreamingExcelExporter
+from src.parser import PersonDataParser
+
+FIXTURE_PATH = "data/fixtures/result_page1.html"
+BASE_URL = "https://www.jobkorea.co.kr"
+
+
+def make_rows(count: int) -> list:
+    """fixture 카드를 반복해 count행 생성 (번호는 1부터 다시 매김)"""
+    html = Path(FIXTURE_PATH).read_text(encoding="utf-8")
+    with contextlib.redirect_stdout(io.StringIO()):
+        people = PersonDataParser(BASE_URL).parse_html(html)
+    return [dict(people[i % len(people)], 번호=i + 1) for i in range(count)]
+
+
+def write_json(rows: list, path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(rows, f, ensure_ascii=False, indent=2)
+
+
+def write_excel(rows: list, path: str):
+    with StreamingExcelExporter(path) as exporter:
+        exporter.write(rows)
+
+
+def read_json(path: str):
+    return pd.read_json(path)
+
+
+def read_excel(path: str):
+    return pd.read_excel(path)
+
+
+def read_csv(path: str):
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+def read_parquet(path: str):
+    return pd.read_parquet(path)
+
+
+def read_arrow(path: str):
+    return pd.read_feather(path)
+
+
+FORMATS = {
+    "json": (write_json, read_json),
+    "xlsx": (write_excel, read_excel),
+    "csv": (lambda rows, path: EXPORTERS["csv"](path).save(rows), read_csv),
+    "parquet": (lambda rows, path: EXPORTERS["parquet"](path).save(rows), read_parquet),
+    "arrow": (lambda rows, path: EXPORTERS["arrow"](path).save(rows), read_arrow),
+}
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rows = make_rows(count)
+    print(f"📦 {count:,}행 ({len(ExcelExporter.COLUMNS)}열)\n")
+    print(f"{'포맷':<8} {'쓰기(초)':>10} {'읽기(초)':>10} {'크기(MB)':>10} {'읽기 행/초':>14}")
+    print("-" * 58)
+
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt, (write, read) in FORMATS.items():
+            path = os.path.join(tmp, f"bench.{fmt}")
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    write_sec, _ = timed(write, rows, path)
+                read_sec, frame = timed(read, path)
+            except ImportError as e:
+                print(f"{fmt:<8} 건너뜀 ({e.name} 없음)")
+                continue
+
+            ok = ok and len(frame) == count
+            size_mb = os.path.getsize(path) / 1024 / 1024
+            print(f"{fmt:<8} {write_sec:>10.3f} {read_sec:>10.3f} {size_mb:>10.2f} {count / read_sec:>14,.0f}")
+
+    print(f"\n✅ 모든 포맷에서 {count:,}행을 다시 읽었습니다" if ok else "\n❌ 행 수가 다른 포맷이 있습니다")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+파싱 엔진별 처리 속도 측정
+
+data/fixtures/result_page*.html (JobKoreaScraper._process_html이 저장하는 형식)을
+엔진별로 파싱하여 records/sec를 출력하고, 결과가 bs4 엔진과 동일한지 확인합니다.
+
+사용법:
+    python -m benchmarks.bench_parser [반복 횟수]
+"""
+import sys
+import time
+from pathlib import Path
+
+from src.parser import PersonDataParser
+from src.parser_engines import available_engines
+
+FIXTURE_DIR = Path("data/fixtures")
+BASE_URL = "https://www.jobkorea.co.kr"
+
+
+def load_fixtures():
+    """녹화된 결과 페이지 로드"""
+    return {path.name: path.read_text(encoding="utf-8") for path in sorted(FIXTURE_DIR.glob("result_page*.html"))}
+
+
+def bench_engine(engine: str, pages: dict, repeat: int) -> dict:
+    """엔진 1개로 모든 페이지를 repeat번 파싱"""
+    parser = PersonDataParser(BASE_URL, engine=engine)
+    records = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages.values():
+            records += len(parser.parse_html(html))
+    elapsed = time.perf_counter() - started
+    return {"engine": engine, "records": records, "elapsed": elapsed, "records_per_sec": records / elapsed}
+
+
+def check_parity(engines: list, pages: dict) -> bool:
+    """모든 엔진의 결과가 bs4 엔진과 같은지 확인"""
+    baseline = PersonDataParser(BASE_URL, engine="bs4")
+    same = True
+    for engine in engines:
+        parser = PersonDataParser(BASE_URL, engine=engine)
+        for name, html in pages.items():
+            if parser.parse_html(html) != baseline.parse_html(html):
+                print(f"❌ {engine}: {name} 결과가 bs4와 다릅니다")
+                same = False
+    return same
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    pages = load_fixtures()
+    if not pages:
+        print(f"❌ 픽스처가 없습니다: {FIXTURE_DIR}/result_page*.html")
+        return 1
+
+    engines = available_engines()
+    print(f"📄 픽스처 {len(pages)}개, 반복 {repeat}회, 엔진: {', '.join(engines)}\n")
+
+    if "bs4" in engines and check_parity(engines, pages):
+        print("✅ 모든 엔진의 결과가 bs4와 동일합니다\n")
+
+    results = [bench_engine(engine, pages, repeat) for engine in engines]
+    baseline = next((r for r in results if r["engine"] == "bs4"), results[0])
+
+    print(f"{'엔진':<8} {'레코드':>8} {'시간(초)':>10} {'records/sec':>14} {'배율':>7}")
+    print("-" * 52)
+    for r in results:
+        speedup = r["records_per_sec"] / baseline["records_per_sec"]
+        print(f"{r['engine']:<8} {r['records']:>8} {r['elapsed']:>10.3f} {r['records_per_sec']:>14.1f} {speedup:>6.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
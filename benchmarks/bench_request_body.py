@@ -0,0 +1,70 @@
+"""
+검색 요청 본문 생성 속도 측정
+
+기존 방식: 페이지마다 payload 전체를 json.dumps + URL 인코딩
+현재 방식: PayloadManager.create_search_body (검색 조건별 1회 인코딩 후 페이지 필드만 삽입)
+
+사용법:
+    python -m benchmarks.bench_request_body [반복 횟수]
+"""
+import contextlib
+import io
+import json
+import sys
+import time
+from urllib.parse import urlencode
+
+from src.payload_manager import PayloadManager
+
+TEMPLATE_PATH = "data/payload_template.json"
+SEARCH_OPTIONS = {
+    "job_name": ["인사담당자", "보험영업", "영업관리"],
+    "areas": ["서울", "경기"],
+    "education": ["대졸"],
+    "ages": (26, 35),
+    "job_status": ["구직중"],
+}
+
+
+def full_serialize(manager: PayloadManager, page: int) -> bytes:
+    """기존 방식 (requests에 data={"searchCondition": json.dumps(...)} 전달)"""
+    payload = manager.create_payload(page, 100, saveno=715204386, **SEARCH_OPTIONS)
+    return urlencode({"searchCondition": json.dumps(payload, ensure_ascii=False)}).encode("ascii")
+
+
+def cached_body(manager: PayloadManager, page: int) -> bytes:
+    """현재 방식"""
+    return manager.create_search_body(page, 100, saveno=715204386, **SEARCH_OPTIONS)
+
+
+def measure(func, manager: PayloadManager, repeat: int) -> float:
+    """요청 1건당 평균 시간(초)"""
+    started = time.perf_counter()
+    for page in range(1, repeat + 1):
+        func(manager, page)
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    manager = PayloadManager(TEMPLATE_PATH)
+
+    # 선택 결과 출력은 측정에서 제외
+    with contextlib.redirect_stdout(io.StringIO()):
+        same = all(full_serialize(manager, page) == cached_body(manager, page) for page in (1, 2, 37))
+        full = measure(full_serialize, manager, repeat)
+        cached = measure(cached_body, manager, repeat)
+
+    body_size = len(cached_body(manager, 1))
+    print(f"📦 본문 크기: {body_size / 1024:.1f} KB, 반복 {repeat}회")
+    print(f"{'✅' if same else '❌'} 두 방식의 본문이 {'동일합니다' if same else '다릅니다'}\n")
+    print(f"{'방식':<24} {'요청당(µs)':>12}")
+    print("-" * 38)
+    print(f"{'json.dumps + urlencode':<24} {full * 1e6:>12.1f}")
+    print(f"{'create_search_body':<24} {cached * 1e6:>12.1f}")
+    print(f"\n⚡ {full / cached:.0f}배 빠름")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+이력서 상세 파싱 속도 측정
+
+data/fixtures/resume_view*.html (이력서 보기 페이지를 저장한 HTML)을 파싱하여 resumes/sec를 출력하고,
+엔진별 ResumeParser 결과가 bs4 엔진과 동일한지 확인합니다.
+
+비교 대상:
+- 기존 방식: 자기소개서/자격증을 각각 전체 HTML로 BeautifulSoup 파싱 (2회, 두 영역만 추출)
+- ResumeParser (엔진별): 한 번만 파싱하여 자기소개서/경력/학력/자격증/어학 모두 추출
+
+사용법:
+    python -m benchmarks.bench_resume_parser [반복 횟수]
+"""
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from src.parser_engines import available_engines
+from src.resume_parser import ResumeParser
+
+FIXTURE_DIR = Path("data/fixtures")
+
+
+def load_fixtures():
+    """저장된 이력서 페이지 로드"""
+    return {path.name: path.read_text(encoding="utf-8") for path in sorted(FIXTURE_DIR.glob("resume_view*.html"))}
+
+
+def legacy_two_parses(html: str) -> dict:
+    """기존 방식: 영역마다 전체 HTML을 따로 파싱"""
+    intro_soup = BeautifulSoup(html, "html.parser")
+    intro = intro_soup.select("div.base.introduction ul.list-introduction > li.item")
+    cert_soup = BeautifulSoup(html, "html.parser")
+    certs = cert_soup.select("div.base.certificate div.list-certificate div.item")
+    return {"자기소개서": len(intro), "자격증": len(certs)}
+
+
+def bench(label: str, parse, pages: dict, repeat: int) -> dict:
+    """parse(html)를 모든 페이지에 repeat번 호출"""
+    count = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages.values():
+            parse(html)
+            count += 1
+    elapsed = time.perf_counter() - started
+    return {"label": label, "resumes": count, "elapsed": elapsed, "resumes_per_sec": count / elapsed}
+
+
+def check_parity(engines: list, pages: dict) -> bool:
+    """모든 엔진의 결과가 bs4 엔진과 같은지 확인"""
+    baseline = ResumeParser("bs4")
+    same = True
+    for engine in engines:
+        parser = ResumeParser(engine)
+        for name, html in pages.items():
+            if parser.parse(html) != baseline.parse(html):
+                print(f"❌ {engine}: {name} 결과가 bs4와 다릅니다")
+                same = False
+    return same
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    pages = load_fixtures()
+    if not pages:
+        print(f"❌ 픽스처가 없습니다: {FIXTURE_DIR}/resume_view*.html")
+        return 1
+
+    engines = available_engines()
+    size = sum(len(html.encode("utf-8")) for html in pages.values())
+    print(f"📄 픽스처 {len(pages)}개 ({size / 1024:.0f}KB), 반복 {repeat}회, 엔진: {', '.join(engines)}\n")
+
+    if "bs4" in engines and check_parity(engines, pages):
+        print("✅ 모든 엔진의 결과가 bs4와 동일합니다\n")
+
+    results = [bench("기존 방식 (2회 파싱)", legacy_two_parses, pages, repeat)]
+    results += [bench(f"ResumeParser ({engine})", ResumeParser(engine).parse, pages, repeat) for engine in engines]
+    baseline = results[0]
+
+    print(f"{'방식':<24} {'이력서':>8} {'시간(초)':>10} {'resumes/sec':>14} {'배율':>7}")
+    print("-" * 68)
+    for r in results:
+        speedup = r["resumes_per_sec"] / baseline["resumes_per_sec"]
+        print(f"{r['label']:<24} {r['resumes']:>8} {r['elapsed']:>10.3f} {r['resumes_per_sec']:>14.1f} {speedup:>6.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
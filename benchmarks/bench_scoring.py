@@ -0,0 +1,122 @@
+"""
+인재 채점 속도 측정 (전체 데이터 재채점)
+
+data/fixtures/result_page*.html의 검색 결과와 resume_view*.html의 이력서 상세를 섞어
+N행(기본 100,000행)의 레코드를 만들고, 규칙 파일(data/scoring_rules)의 규칙별로 다시 채점하는 시간을 출력합니다.
+제목에는 행 번호를 붙여 모든 행이 서로 다른 텍스트를 갖게 합니다 (캐시가 제목에는 적용되지 않는 조건).
+
+비교 대상:
+- 캐시 없음: 레코드마다 모든 구성 요소를 다시 평가하고 필드를 Aho–Corasick 매처로 다시 훑기
+- CandidateScorer: 같은 텍스트의 키워드 그룹과 (구성 요소, 필드 텍스트)별 점수를 채점기에 캐시
+- BatchScorer: DataFrame 열 단위 벡터 연산 (src/batch_scoring.py), 프로세스 1개 / workers개
+  (BatchScorer 점수가 CandidateScorer와 모두 같은지도 확인)
+
+사용법:
+    python -m benchmarks.bench_scoring [행 수] [프로세스 수]
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from src.batch_scoring import BatchScorer
+from src.parser import PersonDataParser
+from src.resume_parser import parse_resume_detail
+from src.scoring import CandidateScorer
+from src.scoring_rules import RuleSetRegistry
+
+FIXTURE_DIR = Path("data/fixtures")
+BASE_URL = "https://www.jobkorea.co.kr"
+
+
+# 이력서 상세 목록이 딕셔너리가 아니라 문자열 목록인 레코드 (grade.js bagJoin()이 받는 형식, 채점 중 오류가 없어야 함)
+PLAIN_DETAIL = {
+    "경력상세": ["삼성생명 보험설계사 3년", "신규 고객 120명 유치"],
+    "학력상세": ["한국대학교 경영학과 학사"],
+    "자격증": ["AFPK", None],
+    "어학": ["TOEIC 910"],
+    "자기소개서": ["고객과 소통하며 신뢰를 쌓았습니다"],
+}
+
+
+def build_records(count: int) -> list:
+    """픽스처 레코드를 반복하여 count행 생성 (10행 중 1행에 이력서 상세, 1행에 문자열 목록 상세 포함)"""
+    parser = PersonDataParser(BASE_URL)
+    people = [p for path in sorted(FIXTURE_DIR.glob("result_page*.html")) for p in parser.parse_html(path.read_text(encoding="utf-8"))]
+    details = [parse_resume_detail(path.read_text(encoding="utf-8")).to_dict() for path in sorted(FIXTURE_DIR.glob("resume_view*.html"))]
+    records = []
+    for i in range(count):
+        person = dict(people[i % len(people)])
+        person["제목"] = f"{person.get('제목') or ''} #{i}"
+        if details and i % 10 == 0:
+            person.update(details[i // 10 % len(details)])
+        elif i % 10 == 5:
+            person.update(PLAIN_DETAIL)
+        records.append(person)
+    return records
+
+
+class _NoCache(dict):
+    """저장하지 않는 캐시"""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+def score_uncached(scorer: CandidateScorer, records: list):
+    """캐시 없이 채점 (매 레코드마다 텍스트 전체를 다시 훑음)"""
+    scorer._group_cache = _NoCache()
+    scorer._component_cache = _NoCache()
+    scorer.score_batch(records)
+
+
+def bench(label: str, run, rows: int) -> dict:
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    return {"label": label, "rows": rows, "elapsed": elapsed, "rows_per_sec": rows / elapsed}
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    if not list(FIXTURE_DIR.glob("result_page*.html")):
+        print(f"❌ 픽스처가 없습니다: {FIXTURE_DIR}/result_page*.html")
+        return 1
+
+    records = build_records(count)
+    frame = pd.DataFrame(records, dtype=object)
+    started = time.perf_counter()
+    registry = RuleSetRegistry(check_interval=0)
+    loaded = time.perf_counter() - started
+    started = time.perf_counter()
+    registry.reload()
+    checked = time.perf_counter() - started
+    print(f"📄 {count:,}행, 규칙: {', '.join(registry.names())}")
+    print(f"   규칙 읽기 + 컴파일 {loaded * 1000:.1f}ms, 변경 확인(변경 없음) {checked * 1000:.2f}ms\n")
+
+    results = []
+    for name in registry.names():
+        rules = registry.get(name).rules
+        results.append(bench(f"{name} (캐시 없음)", lambda: score_uncached(CandidateScorer(rules), records), count))
+        results.append(bench(f"{name}", lambda: CandidateScorer(rules).score_batch(records), count))
+        results.append(bench(f"{name} (BatchScorer)", lambda: BatchScorer(rules).score(frame), count))
+        if workers > 1:
+            chunk_size = -(-count // workers)
+            results.append(bench(
+                f"{name} (BatchScorer x{workers})", lambda: BatchScorer(rules).score(frame, workers=workers, chunk_size=chunk_size), count
+            ))
+        if BatchScorer(rules).score(frame).tolist() != [person["점수"] for person in records]:
+            print(f"❌ {name}: BatchScorer 점수가 CandidateScorer와 다릅니다")
+
+    print(f"{'규칙':<36} {'행':>9} {'시간(초)':>10} {'rows/sec':>12}")
+    print("-" * 72)
+    for r in results:
+        print(f"{r['label']:<36} {r['rows']:>9,} {r['elapsed']:>10.2f} {r['rows_per_sec']:>12,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+HTTP 전송 방식별 검색 요청 속도 / 전송량 / 연결 수 측정
+
+로컬 스텁 서버에 녹화된 검색 결과 페이지를 요청하여 다음을 비교합니다.
+- 요청마다 새 세션 (연결 재사용 없음, 압축 없음)
+- 세션 1개 재사용 (압축 없음)
+- transport.create_session (공유 연결 풀 + gzip)
+- 여러 계정(스레드)이 각자 세션을 쓰면서 연결 풀 공유
+- HTTP/2 어댑터 (httpx[http2] 설치 시, 스텁 서버는 평문 HTTP라 HTTP/1.1로 동작)
+
+사용법:
+    python -m benchmarks.bench_transport [요청 수]
+"""
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from src.api_client import FORM_HEADERS
+from src.payload_manager import PayloadManager
+from src.stub_server import StubSearchServer
+from src.transport import Http2Adapter, create_session, httpx
+
+IDENTITY = {"Accept-Encoding": "identity"}
+
+
+def run(label: str, requests_count: int, post, workers: int = 1):
+    """post(page) → 응답 본문 크기를 requests_count번 호출하고 결과 출력"""
+    pages = [page % 3 + 1 for page in range(requests_count)]
+    with StubSearchServer("data/fixtures") as stub:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            decoded = sum(executor.map(lambda page: post(stub.api_url, page), pages))
+        elapsed = time.perf_counter() - started
+
+        print(f"{label:<28} {elapsed:8.3f}초 {requests_count / elapsed:8.1f}회/초 "
+              f"{stub.bytes_sent / 1024:10.0f}KB {decoded / 1024:10.0f}KB {stub.connection_count:6d}")
+
+
+def main():
+    requests_count = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    payload_manager = PayloadManager("data/payload_template.json")
+    bodies = {page: payload_manager.create_search_body(page, 100, saveno=715204386) for page in (1, 2, 3)}
+
+    def new_session_each(url, page):
+        with requests.Session() as session:
+            return len(session.post(url, data=bodies[page], headers={**FORM_HEADERS, **IDENTITY}).content)
+
+    reused = requests.Session()
+
+    def reused_session(url, page):
+        return len(reused.post(url, data=bodies[page], headers={**FORM_HEADERS, **IDENTITY}).content)
+
+    pooled = create_session()
+
+    def pooled_gzip(url, page):
+        return len(pooled.post(url, data=bodies[page], headers=FORM_HEADERS).content)
+
+    account_sessions = {}
+
+    def per_account_shared_pool(url, page):
+        import threading
+        session = account_sessions.setdefault(threading.get_ident(), create_session())
+        return len(session.post(url, data=bodies[page], headers=FORM_HEADERS).content)
+
+    print(f"검색 요청 {requests_count}회 (요청 본문 {len(bodies[1]) / 1024:.0f}KB)\n")
+    print(f"{'방식':<28} {'시간':>9} {'속도':>11} {'전송량':>12} {'해제 후':>10} {'연결':>6}")
+    run("요청마다 새 세션", requests_count, new_session_each)
+    run("세션 재사용", requests_count, reused_session)
+    run("공유 연결 풀 + gzip", requests_count, pooled_gzip)
+    run("공유 연결 풀 + gzip (4계정)", requests_count, per_account_shared_pool, workers=4)
+
+    if httpx is not None:
+        http2 = requests.Session()
+        http2.mount("http://", Http2Adapter())
+
+        def http2_adapter(url, page):
+            return len(http2.post(url, data=bodies[page], headers={**FORM_HEADERS, "Accept-Encoding": "gzip"}).content)
+
+        run("httpx 어댑터 + gzip", requests_count, http2_adapter)
+    else:
+        print("(httpx[http2] 미설치 - HTTP/2 어댑터 측정 생략)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+재생 서버 부하 테스트 (run_all_accounts 전체 흐름의 처리량)
+
+실제 잡코리아에 요청하지 않고 ReplayServer(src/replay.py)를 상대로 로그인 → 검색 → 저장(→ 이력서 추출)까지 실행합니다.
+운영 기준(계정 8개 × 3페이지 × 100명)의 --scale배 계정으로 실행하므로 10~100배 규모의 처리량/오류 처리를 확인할 수 있습니다.
+
+- 응답: --archive로 녹화한 아카이브 (없으면 data/fixtures), 검색 결과는 --pages 페이지까지 녹화 페이지를 반복
+- 서버 조건: --latency/--latency-jitter초 지연, --error-rate 비율로 503 응답 (클라이언트는 재시도)
+- 요청 속도 제한/세션 캐시는 끄고, 재시도 대기 시간은 짧게 설정 (서버 처리량만 보이도록)
+- --resumes N: 수집한 이력서링크 N개를 ResumeFetcher로 추출 (이력서 HTTP 추출 처리량)
+
+사용법:
+    python -m benchmarks.load_test --scale 10 --workers 8 --latency 0.1 --error-rate 0.01
+    python -m benchmarks.load_test --archive recordings/session.jsonl.gz --scale 100 --streaming --resumes 2000
+"""
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from main import run_all_accounts
+from src.auth import JobKoreaAuth
+from src.config import JobKoreaConfig
+from src.replay import ReplayServer
+from src.resume_fetcher import ResumeFetcher
+from stub_parallel_run import build_workbook
+
+BASE_ACCOUNTS = 8
+BASE_PAGES = 3
+UNLIMITED_RATE = 1_000_000.0
+
+
+def replay_overrides(server: ReplayServer) -> dict:
+    """재생 서버로 요청하는 JobKoreaConfig 설정"""
+    return {
+        "API_URL": server.api_url,
+        "LOGIN_URL": server.login_url,
+        "BASE_URL": server.url,  # 이력서링크도 재생 서버로
+        "USE_AUTO_LOGIN": True,
+        "SESSION_CACHE_DIR": None,
+        "RATE_LIMIT_HOST_RATE": UNLIMITED_RATE,
+        "RATE_LIMIT_HOST_BURST": UNLIMITED_RATE,
+        "RATE_LIMIT_ACCOUNT_RATE": UNLIMITED_RATE,
+        "RATE_LIMIT_ACCOUNT_BURST": UNLIMITED_RATE,
+        "RATE_LIMIT_SHARED_DIR": None,
+        "RETRY_BASE_DELAY": 0.05,
+        "RETRY_MAX_DELAY": 0.5,
+    }
+
+
+def fetch_resumes(server: ReplayServer, output_dir: Path, count: int, workers: int, verbose: bool = False):
+    """수집 결과의 이력서링크 count개를 HTTP로 추출하고 처리량 출력"""
+    people = []
+    for path in sorted(output_dir.glob("*_summary.json")):
+        people.extend(json.loads(path.read_text(encoding="utf-8")))
+    resumes = [person for person in people if person.get("이력서링크")][:count]
+    if not resumes:
+        print("⚠️  추출할 이력서링크가 없습니다")
+        return
+
+    config = JobKoreaConfig(username="load_test", password="pw")
+    for key, value in replay_overrides(server).items():
+        setattr(config, key, value)
+    auth = JobKoreaAuth(config.USERNAME, config.PASSWORD, config=config)
+    with contextlib.redirect_stdout(io.StringIO()):
+        session = auth.login()
+    fetcher = ResumeFetcher(session, relogin=lambda: False)
+    with contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO()):
+        results, fallback = fetcher.fetch_all(resumes, workers=workers)
+    fetcher.latency.print_summary(f"이력서 추출 (브라우저로 넘긴 이력서 {len(fallback)}개)")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="재생 서버를 상대로 run_all_accounts 처리량 측정")
+    arg_parser.add_argument("--archive", help="녹화된 아카이브 (없으면 data/fixtures)")
+    arg_parser.add_argument("--scale", type=int, default=1, help=f"운영 기준({BASE_ACCOUNTS}계정)의 몇 배 계정으로 실행할지")
+    arg_parser.add_argument("--pages", type=int, default=BASE_PAGES, help="계정별 검색 페이지 수")
+    arg_parser.add_argument("--page-size", type=int, default=100)
+    arg_parser.add_argument("--workers", type=int, default=4, help="동시에 실행할 계정 수")
+    arg_parser.add_argument("--latency", type=float, default=0.05)
+    arg_parser.add_argument("--latency-jitter", type=float, default=0.0)
+    arg_parser.add_argument("--error-rate", type=float, default=0.0)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--async", dest="use_async", action="store_true", help="계정별 비동기 수집")
+    arg_parser.add_argument("--streaming", action="store_true", help="페이지마다 바로 저장")
+    arg_parser.add_argument("--resumes", type=int, default=0, help="추출할 이력서 수 (0이면 생략)")
+    arg_parser.add_argument("--resume-workers", type=int, default=8)
+    arg_parser.add_argument("--output-dir", help="결과 저장 디렉토리 (없으면 임시 디렉토리)")
+    arg_parser.add_argument("--verbose", action="store_true", help="계정/요청별 로그 출력")
+    args = arg_parser.parse_args()
+
+    account_count = BASE_ACCOUNTS * args.scale
+    server = ReplayServer(
+        args.archive,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        page_count=args.pages,
+        require_login=True,
+        seed=args.seed
+    )
+    with tempfile.TemporaryDirectory() as tmp, server:
+        output_dir = Path(args.output_dir or tmp)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        excel_path = Path(tmp) / "load_test_accounts.xlsx"
+        build_workbook(excel_path, account_count)
+        print(f"🚀 {account_count}계정 × {args.pages}페이지 (운영 기준의 {args.scale}배), 병렬 {args.workers}개\n")
+
+        log = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        started = time.perf_counter()
+        with log:
+            summary = run_all_accounts(
+                excel_path=str(excel_path),
+                start_page=1,
+                end_page=args.pages,
+                page_size=args.page_size,
+                delay=0.0,
+                output_dir=str(output_dir),
+                workers=args.workers,
+                config_overrides=replay_overrides(server),
+                use_async=args.use_async,
+                streaming=args.streaming
+            )
+        elapsed = time.perf_counter() - started
+
+        if summary is None:
+            print("❌ 실행할 계정이 없습니다")
+            return 1
+        summary.print_summary()
+        print(f"📈 인재 {summary.total_people / elapsed:,.0f}명/초, 서버 요청 {server.request_count / elapsed:,.1f}회/초 "
+              f"(전송 {server.bytes_sent / 1024 / 1024:,.1f}MB, 연결 {server.connection_count}개)")
+        print(f"   서버 응답: {dict(sorted(server.counts.items()))}")
+
+        if args.resumes:
+            fetch_resumes(server, output_dir, args.resumes, args.resume_workers, args.verbose)
+        return 0 if summary.fail_count == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,382 @@
+"""
+성능 회귀 추적용 벤치마크 모음
+
+저장소에 포함된 실제 데이터로 주요 처리 경로의 작업 1회당 시간을 측정하고,
+결과를 benchmarks/results/<커밋>.json에 저장합니다. 이전 결과가 있으면 항목별 변화율을 함께 출력합니다.
+
+사용 데이터:
+- data/payload_template.json: 검색 조건 payload 템플릿
+- detailsearchajax/*.json, test/*.json: 실제 검색 조건 payload (약 340~460KB)
+- detailsearchajaxCurl/*Page.txt: 브라우저에서 복사한 검색 요청 (curl)
+- data/fixtures/result_page*.html, resume_view*.html: 검색 결과 / 이력서 페이지
+
+측정 항목 (그룹):
+- payload: 템플릿 로드, 검색 조건 payload 생성, 요청 본문 생성, 녹화된 payload 인코딩/curl 본문 해석
+- parse: 검색 결과 HTML 파싱(엔진별), 이력서 상세 파싱(엔진별), 최근활동 텍스트 해석
+- export: JSON / 엑셀(스트리밍) / CSV 저장
+- scoring: CandidateScorer, BatchScorer
+
+측정 방식(asv/pytest-benchmark와 같은 방식): 준비(setup)는 측정에서 제외하고,
+한 라운드가 min_time초 이상이 되도록 반복 횟수를 정한 뒤 rounds번 측정한 작업 1회당 시간의 중앙값을 기록합니다.
+
+사용법:
+    python -m benchmarks.run_all                      # 전체 측정 + 저장 + 직전 결과와 비교
+    python -m benchmarks.run_all -k parse scoring     # 이름에 parse 또는 scoring이 들어간 항목만
+    python -m benchmarks.run_all --compare 6f12183    # 지정한 커밋의 결과와 비교
+    python -m benchmarks.run_all --threshold 0.15     # 15% 이상 느려진 항목을 회귀로 표시 (종료 코드 1)
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+import pandas as pd
+
+from src.batch_scoring import BatchScorer
+from src.exporter import CsvExporter, StreamingExcelExporter, StreamingJsonExporter
+from src.parser import PersonDataParser
+from src.parser_engines import available_engines
+from src.payload_manager import PayloadManager
+from src.resume_parser import ResumeParser
+from src.scoring import CandidateScorer
+
+RESULTS_DIR = Path("benchmarks/results")
+TEMPLATE_PATH = "data/payload_template.json"
+FIXTURE_DIR = Path("data/fixtures")
+BASE_URL = "https://www.jobkorea.co.kr"
+SEARCH_OPTIONS = {
+    "job_name": ["인사담당자", "보험영업", "영업관리"],
+    "areas": ["서울", "경기"],
+    "education": ["대졸"],
+    "ages": (26, 35),
+    "job_status": ["구직중"],
+}
+EXPORT_ROWS = 2000
+SCORING_ROWS = 5000
+
+# 측정 항목: (이름, 그룹, 준비 함수) - 준비 함수는 측정할 함수(인자 없음)를 반환
+# (임시 파일 등 정리할 자원이 있으면 측정할 함수를 넘겨주는 컨텍스트 매니저를 반환, 측정이 끝나면 정리)
+Case = Tuple[str, str, Callable[[], Callable[[], object]]]
+
+
+# ---------- 데이터 ----------
+
+def _quiet(func, *args, **kwargs):
+    """선택 결과/저장 완료 등 출력 없이 실행"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+def recorded_payloads() -> List[dict]:
+    """detailsearchajax/*.json, test/*.json (빈 파일 제외)"""
+    paths = sorted(Path("detailsearchajax").glob("*.json")) + sorted(Path("test").glob("*.json"))
+    return [json.loads(text) for text in (path.read_text(encoding="utf-8") for path in paths) if text.strip()]
+
+
+def recorded_curl_bodies() -> List[str]:
+    """detailsearchajaxCurl/*Page.txt의 --data-raw 요청 본문"""
+    bodies = []
+    for path in sorted(Path("detailsearchajaxCurl").glob("*Page.txt")):
+        match = re.search(r"--data-raw '([^']*)'", path.read_text(encoding="utf-8"))
+        if match:
+            bodies.append(match.group(1))
+    return bodies
+
+
+def result_pages() -> List[str]:
+    return [path.read_text(encoding="utf-8") for path in sorted(FIXTURE_DIR.glob("result_page*.html"))]
+
+
+def resume_pages() -> List[str]:
+    return [path.read_text(encoding="utf-8") for path in sorted(FIXTURE_DIR.glob("resume_view*.html"))]
+
+
+def people(count: int) -> List[Dict]:
+    """검색 결과 픽스처 인재를 반복해 count명 생성"""
+    parser = PersonDataParser(BASE_URL)
+    found = [person for html in result_pages() for person in _quiet(parser.parse_html, html)]
+    return [dict(found[i % len(found)], 번호=i + 1) for i in range(count)]
+
+
+# ---------- 측정 항목 ----------
+
+def case_template_load():
+    # 템플릿은 처음 사용할 때 로드하므로 로드 + 인덱스 생성을 직접 호출
+    return lambda: PayloadManager(TEMPLATE_PATH)._load_template()
+
+
+def case_payload_build():
+    manager = PayloadManager(TEMPLATE_PATH)
+
+    def run():
+        # 검색 조건 캐시를 비워 조건 컴파일(경로 복사 + 선택)까지 측정
+        manager.clear_cache()
+        return _quiet(manager.create_payload, 1, 100, saveno=715204386, **SEARCH_OPTIONS)
+
+    return run
+
+
+def case_payload_page():
+    manager = PayloadManager(TEMPLATE_PATH)
+    _quiet(manager.create_search_body, 1, 100, saveno=715204386, **SEARCH_OPTIONS)
+    pages = iter(range(2, 10 ** 9))
+    return lambda: manager.create_search_body(next(pages), 100, saveno=715204386, **SEARCH_OPTIONS)
+
+
+def case_payload_encode_recorded():
+    payloads = recorded_payloads()
+    return lambda: [PayloadManager.encode_body(payload) for payload in payloads]
+
+
+def case_payload_decode_curl():
+    bodies = recorded_curl_bodies()
+    return lambda: [json.loads(parse_qs(body)["searchCondition"][0]) for body in bodies]
+
+
+def case_activity_parse():
+    texts = [part.strip() for person in people(250) for part in (person.get("최근활동") or "").split(",")]
+    return lambda: [PersonDataParser._parse_activity_minutes(text) for text in texts]
+
+
+def make_html_parse(engine: str):
+    def case():
+        parser = PersonDataParser(BASE_URL, engine=engine)
+        pages = result_pages()
+        return lambda: [parser.parse_html(html) for html in pages]
+    return case
+
+
+def make_resume_parse(engine: str):
+    def case():
+        parser = ResumeParser(engine)
+        pages = resume_pages()
+        return lambda: [parser.parse(html) for html in pages]
+    return case
+
+
+def make_export(exporter: str):
+    @contextlib.contextmanager
+    def case():
+        rows = people(EXPORT_ROWS)
+        with tempfile.TemporaryDirectory(prefix="bench_export_") as directory:
+            path = os.path.join(directory, f"out.{exporter}")
+
+            def run():
+                if exporter == "json":
+                    with StreamingJsonExporter(path) as out:
+                        out.write(rows)
+                elif exporter == "xlsx":
+                    with StreamingExcelExporter(path) as out:
+                        out.write(rows)
+                else:
+                    CsvExporter(path).save(rows)
+
+            yield lambda: _quiet(run)
+    return case
+
+
+def case_scoring_candidate():
+    rows = people(SCORING_ROWS)
+
+    def run():
+        # 채점기를 매번 새로 만들어 캐시가 빈 상태(재채점 1회)로 측정
+        return CandidateScorer().score_batch([dict(row) for row in rows])
+
+    return run
+
+
+def case_scoring_batch():
+    frame = pd.DataFrame(people(SCORING_ROWS), dtype=object)
+    return lambda: BatchScorer().score(frame)
+
+
+def all_cases() -> List[Case]:
+    engines = available_engines()
+    return [
+        ("payload.template_load", "payload", case_template_load),
+        ("payload.build", "payload", case_payload_build),
+        ("payload.page_body", "payload", case_payload_page),
+        ("payload.encode_recorded", "payload", case_payload_encode_recorded),
+        ("payload.decode_curl", "payload", case_payload_decode_curl),
+        *[(f"parse.html[{engine}]", "parse", make_html_parse(engine)) for engine in engines],
+        *[(f"parse.resume[{engine}]", "parse", make_resume_parse(engine)) for engine in engines],
+        ("parse.activity", "parse", case_activity_parse),
+        ("export.json", "export", make_export("json")),
+        ("export.xlsx", "export", make_export("xlsx")),
+        ("export.csv", "export", make_export("csv")),
+        ("scoring.candidate", "scoring", case_scoring_candidate),
+        ("scoring.batch", "scoring", case_scoring_batch),
+    ]
+
+
+# ---------- 측정 ----------
+
+def measure(func: Callable[[], object], rounds: int, min_time: float) -> Dict:
+    """작업 1회당 시간 (rounds번 측정, 라운드마다 min_time초 이상 반복)"""
+    func()  # 준비 운동 (지연 import, 캐시 워밍업)
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or number >= 10 ** 6:
+            break
+        number *= 2 if elapsed * 2 >= min_time else 10
+
+    samples = [elapsed / number]
+    for _ in range(rounds - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - started) / number)
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "rounds": rounds,
+        "number": number,
+    }
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run_suite(patterns: Optional[List[str]] = None, rounds: int = 5, min_time: float = 0.2) -> Dict:
+    """측정 항목을 실행하여 결과 딕셔너리 반환"""
+    results = {}
+    for name, group, setup in all_cases():
+        if patterns and not any(pattern in name for pattern in patterns):
+            continue
+        with contextlib.ExitStack() as resources:
+            func = _quiet(setup)
+            if isinstance(func, contextlib.AbstractContextManager):
+                func = _quiet(resources.enter_context, func)
+            stats = measure(func, rounds, min_time)
+        stats["group"] = group
+        results[name] = stats
+        print(f"   {name:<28} {format_time(stats['median']):>10}  (±{stats['stdev'] / stats['median'] * 100 if stats['median'] else 0:.0f}%, {stats['number']}회 x {rounds})")
+
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD") or "unknown",
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "benchmarks": results,
+    }
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+# ---------- 저장 / 비교 ----------
+
+def save_result(result: Dict) -> Path:
+    """
+    benchmarks/results/<커밋>.json (작업 트리에 수정 사항이 있으면 <커밋>-dirty.json)
+
+    같은 커밋의 결과가 이미 있으면 이번에 측정한 항목만 덮어씀 (-k로 일부만 다시 측정한 경우)
+    """
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    path = RESULTS_DIR / f"{result['commit']}{'-dirty' if result['dirty'] else ''}.json"
+    if path.exists():
+        saved = json.loads(path.read_text(encoding="utf-8"))
+        result = {**result, "benchmarks": {**saved.get("benchmarks", {}), **result["benchmarks"]}}
+    path.write_text(json.dumps(result, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def load_previous(current: Path, ref: Optional[str] = None) -> Optional[Dict]:
+    """비교할 결과 (ref 커밋의 결과, 없으면 가장 최근에 저장된 다른 결과)"""
+    if ref:
+        path = RESULTS_DIR / f"{ref}.json"
+        if not path.exists():
+            commit = _git("rev-parse", "--short", ref)
+            path = RESULTS_DIR / f"{commit}.json"
+        return json.loads(path.read_text(encoding="utf-8")) if path.exists() else None
+
+    others = [path for path in RESULTS_DIR.glob("*.json") if path != current]
+    if not others:
+        return None
+    latest = max(others, key=lambda path: json.loads(path.read_text(encoding="utf-8")).get("date", ""))
+    return json.loads(latest.read_text(encoding="utf-8"))
+
+
+def compare(result: Dict, previous: Dict, threshold: float) -> List[str]:
+    """항목별 변화율 출력, threshold 이상 느려진 항목 이름 반환"""
+    print(f"\n📊 {previous['commit']}{' (dirty)' if previous.get('dirty') else ''} ({previous['date']}) 대비")
+    print(f"   {'항목':<28} {'이전':>10} {'현재':>10} {'변화':>8}")
+    regressions = []
+    for name, stats in result["benchmarks"].items():
+        before = previous["benchmarks"].get(name)
+        if not before:
+            print(f"   {name:<28} {'-':>10} {format_time(stats['median']):>10} {'new':>8}")
+            continue
+        change = stats["median"] / before["median"] - 1
+        mark = ""
+        if change >= threshold:
+            mark = " ⚠️"
+            regressions.append(name)
+        elif change <= -threshold:
+            mark = " ⚡"
+        print(f"   {name:<28} {format_time(before['median']):>10} {format_time(stats['median']):>10} {change * 100:>+7.0f}%{mark}")
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="저장소 데이터로 주요 처리 경로 성능 측정")
+    arg_parser.add_argument("-k", nargs="*", dest="patterns", help="이름에 포함된 문자열로 항목 선택")
+    arg_parser.add_argument("--rounds", type=int, default=5)
+    arg_parser.add_argument("--min-time", type=float, default=0.2, help="라운드당 최소 측정 시간(초)")
+    arg_parser.add_argument("--compare", default=None, help="비교할 커밋 (기본: 가장 최근 결과)")
+    arg_parser.add_argument("--threshold", type=float, default=0.2, help="회귀로 표시할 변화율 (0.2 = 20%% 느려짐)")
+    arg_parser.add_argument("--no-save", action="store_true", help="결과를 저장하지 않음")
+    args = arg_parser.parse_args()
+
+    print(f"⏱️  벤치마크 (라운드 {args.rounds}회, 라운드당 {args.min_time}초 이상)")
+    result = run_suite(args.patterns, rounds=args.rounds, min_time=args.min_time)
+    if not result["benchmarks"]:
+        print("❌ 선택된 항목이 없습니다")
+        return 1
+
+    path = None
+    if not args.no_save:
+        path = save_result(result)
+        print(f"\n💾 저장: {path}")
+
+    previous = load_previous(path, args.compare)
+    if previous is None:
+        if args.compare:
+            print(f"⚠️  비교할 결과가 없습니다: {args.compare}")
+        return 0
+    regressions = compare(result, previous, args.threshold)
+    if regressions:
+        print(f"\n⚠️  {args.threshold * 100:.0f}% 이상 느려진 항목: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
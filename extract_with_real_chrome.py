@@ -1,102 +1,50 @@
 """
 실제 실행 중인 Chrome에 연결하여 자기소개서 추출
 """
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+from playwright.async_api import async_playwright
+import asyncio
 import json
 import time
 from pathlib import Path
 from src.account_manager import AccountManager
 from src.auth import JobKoreaAuth
+from src.session_cache import SessionCache
+from src.dedup import DedupIndex
+from src.config import JobKoreaConfig
+from src.rate_limiter import get_rate_limiter
+from src.resource_blocker import ResourceBlocker
+from src.resume_extractor import ResumeWorkerPool
+from src.resume_parser import ResumeDetail
+from src.scoring import CandidateScorer
+from src.resume_fetcher import ResumeFetcher
+from src.retry import RetryPolicy
 
 
 
-def extract_introduction_from_page(page):
-    """현재 페이지에서 자기소개서 추출"""
-    html = page.content()
-    soup = BeautifulSoup(html, 'html.parser')
-
-    intro_section = soup.select_one("div.base.introduction")
-    if not intro_section:
-        return None
-
-    items = intro_section.select("ul.list-introduction > li.item")
-    if not items:
-        return None
-
-    data = []
-    for idx, li in enumerate(items, 1):
-        title_elem = li.select_one("div.header")
-        title = title_elem.get_text(strip=True) if title_elem else None
-
-        body_elem = li.select_one("div.content#pfl_original") or li.select_one("div.content")
-        if body_elem:
-            body_text = body_elem.get_text(separator="\n", strip=True)
-            if body_text.startswith("- 자기소개서-"):
-                body_text = body_text.replace("- 자기소개서-", "", 1).strip()
-        else:
-            body_text = None
-
-        data.append({
-            "index": idx,
-            "title": title,
-            "body_text": body_text,
-        })
-
-    return data
-
-
-def extract_certificates_from_page(page):
-    """현재 페이지에서 자격증 정보 추출"""
-    html = page.content()
-    soup = BeautifulSoup(html, 'html.parser')
-
-    cert_section = soup.select_one("div.base.certificate")
-    if not cert_section:
-        return None
-
-    # > 제거: 직접 자식이 아니라 하위 요소 전체 검색
-    items = cert_section.select("div.list-certificate div.item")
-    if not items:
-        return None
-
-    data = []
-    for item in items:
-        # 취득일
-        date_elem = item.select_one("div.date")
-        date = date_elem.get_text(strip=True) if date_elem else None
-
-        # 자격증명
-        name_elem = item.select_one("div.content-header div.name")
-        name = name_elem.get_text(strip=True) if name_elem else None
-
-        # 발행기관
-        agency_elem = item.select_one("div.content-header div.agency")
-        agency = agency_elem.get_text(strip=True) if agency_elem else None
-
-        if name:  # 자격증명이 있을 때만 추가
-            data.append({
-                "취득일": date,
-                "자격증명": name,
-                "발행기관": agency,
-            })
-
-    return data if data else None
-
-
-def login_and_get_cookies(username: str, password: str):
+def login(username: str, password: str):
     """
-    잡코리아 로그인하여 쿠키 반환
+    잡코리아 로그인하여 (인증 객체, 로그인 세션) 반환 (실패 시 (인증 객체, None))
     """
     print(f"🔐 잡코리아 로그인 시도: {username}")
-    auth = JobKoreaAuth(username, password)
+    auth = JobKoreaAuth(
+        username,
+        password,
+        cache=SessionCache.from_config(JobKoreaConfig),
+        rate_limiter=get_rate_limiter(JobKoreaConfig),
+        config=JobKoreaConfig
+    )
     session = auth.login()
 
     if not session:
         print("❌ 로그인 실패!")
-        return None
+        return auth, None
 
-    # requests 쿠키를 Playwright 형식으로 변환
+    print(f"✅ 로그인 성공! {len(session.cookies)}개 쿠키 획득\n")
+    return auth, session
+
+
+def to_playwright_cookies(session) -> list:
+    """requests 쿠키를 Playwright 형식으로 변환"""
     cookies = []
     for cookie_name, cookie_value in session.cookies.items():
         cookies.append({
@@ -105,14 +53,28 @@ def login_and_get_cookies(username: str, password: str):
             "domain": ".jobkorea.co.kr",
             "path": "/"
         })
-
-    print(f"✅ 로그인 성공! {len(cookies)}개 쿠키 획득\n")
     return cookies
 
 
-def extract_all_resumes(summary_json_path: str, max_count: int = None):
+def extract_all_resumes(
+    summary_json_path: str,
+    max_count: int = None,
+    workers: int = 4,
+    http_workers: int = 8,
+    browser_fallback: bool = True
+):
     """
-    실행 중인 Chrome에 연결하여 자기소개서 일괄 추출
+    이력서 상세(자기소개서/경력/학력/자격증/어학) 일괄 추출
+
+    먼저 로그인 세션으로 이력서 페이지를 직접 요청하고(브라우저 없이),
+    서버에서 렌더링되지 않았거나 실패한 이력서만 실행 중인 Chrome에 연결하여 추출합니다.
+
+    Args:
+        summary_json_path: 검색 결과 JSON (이력서링크 포함)
+        max_count: 처리할 최대 이력서 수 (None이면 전체)
+        workers: 브라우저로 처리할 때 동시에 사용할 탭 수
+        http_workers: 직접 요청할 때 동시에 진행할 요청 수
+        browser_fallback: False면 브라우저를 사용하지 않음 (직접 요청에 실패한 이력서는 오류로 기록)
     """
     # 이력서 목록 로드
     with open(summary_json_path, 'r', encoding='utf-8') as f:
@@ -120,6 +82,12 @@ def extract_all_resumes(summary_json_path: str, max_count: int = None):
 
     print(f"📋 총 {len(resumes)}개 이력서 발견")
 
+    # 같은 이력서를 두 번 열지 않도록 이력서번호 기준 중복 제외
+    dedup_index = DedupIndex()
+    resumes = dedup_index.add_new(resumes)
+    if dedup_index.duplicate_count:
+        print(f"   🔁 중복 {dedup_index.duplicate_count}개 제외 → {len(resumes)}개")
+
     if max_count:
         resumes = resumes[:max_count]
         print(f"   → {max_count}개만 처리합니다.\n")
@@ -141,27 +109,66 @@ def extract_all_resumes(summary_json_path: str, max_count: int = None):
     username = credentials['username']
     password = credentials['password']
 
-    # 로그인하여 쿠키 획득
-    cookies = login_and_get_cookies(username, password)
-    if not cookies:
+    # 로그인하여 세션 획득
+    auth, session = login(username, password)
+    if not session:
         return []
 
-    print("=" * 80)
-    print("📌 사용 방법:")
-    print("=" * 80)
-    print("1. Chrome을 디버깅 모드로 실행해야 합니다:")
-    print("   /Applications/Google\\ Chrome.app/Contents/MacOS/Google\\ Chrome --remote-debugging-port=9222")
-    print("\n2. 이 스크립트가 자동으로 로그인 + 이력서를 추출합니다")
-    print("=" * 80)
-    print("\n🔍 Chrome이 이미 실행 중인지 확인하는 중...\n")
+    # 1️⃣ 브라우저 없이 직접 요청 (서버에서 렌더링된 이력서)
+    def relogin() -> bool:
+        new_session = auth.login(use_cache=False)
+        if not new_session:
+            return False
+        session.cookies.clear()
+        session.cookies.update(new_session.cookies)
+        return True
+
+    fetcher = ResumeFetcher(
+        session,
+        rate_limiter=get_rate_limiter(JobKoreaConfig),
+        account=username,
+        timeout=RetryPolicy.from_config(JobKoreaConfig).timeout,
+        relogin=relogin
+    )
+    print(f"⚡ 브라우저 없이 이력서 {len(resumes)}개 요청 (동시 {http_workers}개)\n")
+    results, fallback = fetcher.fetch_all(resumes, workers=http_workers)
+    fetcher.latency.print_summary("HTTP 추출")
+
+    if fallback:
+        fallback_resumes = [resumes[index] for index in fallback]
+        if browser_fallback:
+            # 2️⃣ 나머지는 브라우저로 추출
+            print(f"\n🌐 {len(fallback)}개는 브라우저로 추출합니다")
+            print("=" * 80)
+            print("📌 사용 방법:")
+            print("=" * 80)
+            print("1. Chrome을 디버깅 모드로 실행해야 합니다:")
+            print("   /Applications/Google\\ Chrome.app/Contents/MacOS/Google\\ Chrome --remote-debugging-port=9222")
+            print("\n2. 이 스크립트가 자동으로 로그인 + 이력서를 추출합니다")
+            print("=" * 80)
+            print("\n🔍 Chrome이 이미 실행 중인지 확인하는 중...\n")
+            browser_results = asyncio.run(
+                _extract_with_chrome(fallback_resumes, to_playwright_cookies(session), username, workers)
+            ) or _failed_results(fallback_resumes, "Chrome 연결 실패")
+        else:
+            browser_results = _failed_results(fallback_resumes, "HTTP로 추출하지 못함")
 
-    results = []
+        results.update(zip(fallback, browser_results))
 
-    with sync_playwright() as p:
+    return [results[index] for index in range(len(resumes))]
+
+
+def _failed_results(resumes: list, error: str) -> list:
+    return [{**resume, **ResumeDetail().to_dict(), "추출상태": f"오류: {error}"} for resume in resumes]
+
+
+async def _extract_with_chrome(resumes: list, cookies: list, username: str, workers: int) -> list:
+    """실행 중인 Chrome에 쿠키를 주입하고 탭 workers개로 이력서 추출"""
+    async with async_playwright() as p:
         try:
             # 실행 중인 Chrome에 연결
             print("🔗 실행 중인 Chrome에 연결 시도...")
-            browser = p.chromium.connect_over_cdp("http://localhost:9222")
+            browser = await p.chromium.connect_over_cdp("http://localhost:9222")
             print("✅ Chrome 연결 성공!\n")
 
             # 기본 컨텍스트 가져오기
@@ -171,87 +178,12 @@ def extract_all_resumes(summary_json_path: str, max_count: int = None):
                 return []
 
             context = contexts[0]
-            pages = context.pages
-
-            if not pages:
-                print("❌ 열린 탭이 없습니다. Chrome에서 새 탭을 열어주세요.")
-                return []
-
-            # 첫 번째 페이지 사용 (또는 새 탭 생성)
-            page = pages[0]
-            print(f"✅ 현재 탭 사용: {page.url}\n")
 
             # 🔥 쿠키 주입!
             print("🍪 로그인 쿠키 주입 중...")
-            context.add_cookies(cookies)
+            await context.add_cookies(cookies)
             print("✅ 쿠키 주입 완료!\n")
 
-            # 각 이력서 순회
-            for idx, resume in enumerate(resumes, 1):
-                resume_no = resume.get('이력서번호')
-                resume_link = resume.get('이력서링크')
-                name = resume.get('이름', 'Unknown')
-
-                print(f"[{idx}/{len(resumes)}] {name} (rNo={resume_no})")
-
-                try:
-                    # 이력서 페이지 이동
-                    page.goto(resume_link, wait_until='domcontentloaded', timeout=30000)
-
-                    # JavaScript 실행 대기
-                    time.sleep(3)
-
-                    # 자기소개서 추출
-                    intro_data = extract_introduction_from_page(page)
-
-                    # 자격증 추출
-                    cert_data = extract_certificates_from_page(page)
-
-                    # 결과 구성
-                    result = {
-                        **resume,
-                        "자기소개서": intro_data,
-                        "자격증": cert_data,
-                        "추출상태": "성공"
-                    }
-                    results.append(result)
-
-                    # 출력
-                    if intro_data:
-                        print(f"   ✅ 자기소개서 {len(intro_data)}개 추출")
-                        # 미리보기
-                        if intro_data[0]['body_text']:
-                            preview = intro_data[0]['body_text'][:100]
-                            print(f"   📝 {preview}...")
-                    else:
-                        print(f"   ⚠️  자기소개서 없음")
-
-                    if cert_data:
-                        print(f"   ✅ 자격증 {len(cert_data)}개 추출")
-                        # 자격증 목록 출력
-                        cert_names = [c['자격증명'] for c in cert_data[:3]]
-                        print(f"   🏆 {', '.join(cert_names)}{'...' if len(cert_data) > 3 else ''}")
-                    else:
-                        print(f"   ⚠️  자격증 없음")
-
-                    print()
-
-                    # 요청 간 간격
-                    time.sleep(1)
-
-                except Exception as e:
-                    print(f"   ❌ 오류: {e}\n")
-
-                    result = {
-                        **resume,
-                        "자기소개서": None,
-                        "자격증": None,
-                        "추출상태": f"오류: {str(e)}"
-                    }
-                    results.append(result)
-
-                    time.sleep(1)
-
         except Exception as e:
             print(f"\n❌ Chrome 연결 실패: {e}")
             print("\n해결 방법:")
@@ -262,7 +194,21 @@ def extract_all_resumes(summary_json_path: str, max_count: int = None):
             traceback.print_exc()
             return []
 
-    return results
+        # 탭 workers개가 큐에서 이력서를 나눠 처리 (요청 간격은 검색 API와 같은 속도 제한을 따름)
+        print(f"🗂️  탭 {workers}개로 추출 시작\n")
+        resource_blocker = ResourceBlocker.from_config(JobKoreaConfig, "resume")
+        pool = ResumeWorkerPool(
+            context,
+            workers=workers,
+            rate_limiter=get_rate_limiter(JobKoreaConfig),
+            account=username,
+            resource_blocker=resource_blocker
+        )
+        results = await pool.run(resumes)
+        pool.latency.print_summary("이력서 추출")
+        if resource_blocker is not None:
+            resource_blocker.print_summary("이력서 페이지 리소스")
+        return results
 
 
 def main():
@@ -288,6 +234,9 @@ def main():
     if not results:
         return
 
+    # 검색 결과 + 이력서 상세로 채점 ("점수" 열 추가)
+    CandidateScorer().score_batch(results)
+
     # 결과 저장
     output_file = "output/kspac2022_with_introduction.json"
     with open(output_file, "w", encoding="utf-8") as f:
@@ -1,22 +1,42 @@
 """메인 실행 파일"""
+import asyncio
 import json
+import time
+from functools import partial
 from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
 from src.config import JobKoreaConfig
 from src.payload_manager import PayloadManager
 from src.scraper import JobKoreaScraper
 from src.excel_config_parser import ExcelConfigParser
 from src.account_manager import AccountManager
+from src.account_runner import ParallelAccountRunner
+from src.checkpoint import ScrapeCheckpoint
+from src.dedup import DedupIndex
+from src.candidate_store import CandidateStore
+from src.exporter import StreamingExcelExporter, StreamingJsonExporter, get_exporter
+from src.metrics import RunSummary
+from src.scoring_rules import RuleSetRegistry
 
 
 def run_single_account(
     excel_path: str,
     sheet_name: str,
     start_page: int = 1,
-    end_page: int = 1,
+    end_page: Optional[int] = 1,
     page_size: int = 100,
-    delay: float = 1.0,
+    delay: float = 0.0,
     output_dir: str = "output",
-    filter_active_within_minutes: int = None
+    filter_active_within_minutes: int = None,
+    config_overrides: Optional[Dict] = None,
+    use_async: bool = False,
+    streaming: bool = False,
+    export_formats: Sequence[str] = (),
+    resume: bool = False,
+    dedup: bool = False,
+    only_changed: bool = False,
+    adaptive: bool = False,
+    score: bool = False
 ) -> bool:
     """
     단일 계정으로 검색 실행
@@ -25,22 +45,92 @@ def run_single_account(
         excel_path: 엑셀 파일 경로
         sheet_name: 시트명 (계정 아이디)
         start_page: 시작 페이지
-        end_page: 끝 페이지
+        end_page: 끝 페이지 (None이면 검색 결과 수로 자동 결정)
         page_size: 페이지당 크기
-        delay: 지연 시간(초)
+        delay: 페이지 간 추가 지연 시간(초, 요청 간격은 RateLimiter가 조절하므로 기본 0)
         output_dir: 출력 디렉토리
         filter_active_within_minutes: 최근활동 필터링 (분 단위, None이면 필터링 안 함)
+        config_overrides: JobKoreaConfig 속성 덮어쓰기 (예: {"API_URL": "http://127.0.0.1:8000/..."})
+        use_async: 비동기 수집 사용 여부 (페이지 요청과 파싱을 겹쳐서 실행)
+        streaming: 페이지마다 바로 JSON/엑셀에 기록 (전체 결과를 메모리에 모으지 않음)
+        export_formats: JSON/엑셀 외에 추가로 저장할 포맷 ("csv", "parquet", "arrow")
+        resume: 이전 실행이 중단된 경우 체크포인트의 마지막 페이지 다음부터 이어서 수집
+        dedup: 이력서번호 기준으로 페이지 간 중복 인재 제외
+        only_changed: 지난 실행 이후 새로 나타났거나 바뀐 인재만 저장 ({output_dir}/candidates.sqlite3에 기록)
+        adaptive: 더 이상 결과가 없거나 최근활동 기간 안의 인재가 없는 페이지에서 수집 종료
+        score: 인재 채점(src/scoring.py) 후 "점수" 열을 JSON/엑셀/추가 포맷에 함께 저장 (규칙은 data/scoring_rules + 엑셀 "채점규칙" 시트)
 
     Returns:
         성공 여부
     """
+    candidate_store = _open_candidate_store(output_dir) if only_changed else None
+    try:
+        result = _run_account(
+            excel_path=excel_path,
+            sheet_name=sheet_name,
+            start_page=start_page,
+            end_page=end_page,
+            page_size=page_size,
+            delay=delay,
+            output_dir=output_dir,
+            filter_active_within_minutes=filter_active_within_minutes,
+            config_overrides=config_overrides,
+            use_async=use_async,
+            streaming=streaming,
+            export_formats=export_formats,
+            resume=resume,
+            dedup_index=DedupIndex() if dedup else None,
+            candidate_store=candidate_store,
+            adaptive=adaptive,
+            score=score
+        )
+    finally:
+        if candidate_store is not None:
+            candidate_store.close()
+    return result["success"]
+
+
+def _run_account(
+    excel_path: str,
+    sheet_name: str,
+    start_page: int = 1,
+    end_page: Optional[int] = 1,
+    page_size: int = 100,
+    delay: float = 0.0,
+    output_dir: str = "output",
+    filter_active_within_minutes: int = None,
+    config_overrides: Optional[Dict] = None,
+    on_page: Optional[Callable[[int, List[Dict[str, str]]], None]] = None,
+    use_async: bool = False,
+    streaming: bool = False,
+    export_formats: Sequence[str] = (),
+    resume: bool = False,
+    dedup_index: Optional[DedupIndex] = None,
+    candidate_store: Optional[CandidateStore] = None,
+    adaptive: bool = False,
+    score: bool = False,
+    scoring_rules: Optional[RuleSetRegistry] = None
+) -> Dict:
+    """
+    단일 계정 실행 (run_single_account 본체)
+
+    Args:
+        dedup_index: 이력서번호 중복 제거 인덱스 (run_all_accounts에서는 모든 계정이 공유)
+        candidate_store: 변경 감지 저장소 (지정하면 새로 나타났거나 바뀐 인재만 저장)
+        adaptive: 더 이상 결과가 없거나 최근활동 기간 안의 인재가 없는 페이지에서 수집 종료
+        score: 인재 채점 후 "점수" 열 저장 (검색 조건의 직무에 맞는 규칙 사용)
+        scoring_rules: 채점 규칙 저장소 (run_all_accounts에서는 모든 계정이 공유, None이면 새로 생성)
+
+    Returns:
+        {"success": 성공 여부, "pages": 요청한 페이지 수, "people": 수집 인원, "duplicates": 중복 제외 인원}
+    """
     # 1️⃣ 계정 정보 로드
     account_manager = AccountManager(excel_path)
     credentials = account_manager.get_credentials(sheet_name)
 
     if not credentials:
         print(f"⚠️  계정 '{sheet_name}'를 찾을 수 없습니다.")
-        return False
+        return {"success": False, "pages": 0, "people": 0}
 
     username = credentials['username']
     password = credentials['password']
@@ -51,27 +141,36 @@ def run_single_account(
 
     if not search_config:
         print("⚠️  검색 설정이 없습니다.")
-        return False
+        return {"success": False, "pages": 0, "people": 0}
 
     # 검색 조건 출력
     _print_search_config(excel_path, sheet_name, username, search_config, start_page, end_page, page_size)
 
     # 3️⃣ 스크래퍼 초기화
     config = JobKoreaConfig(username=username, password=password)
+    for key, value in (config_overrides or {}).items():
+        setattr(config, key, value)
+
+    scorer = None
+    if score:
+        scoring_rules = scoring_rules or RuleSetRegistry(excel_path=excel_path)
+        scorer = scoring_rules.scorer(scoring_rules.select(search_config))
+        print(f"🧮 채점 규칙: {scorer.name}")
+
     payload_manager = PayloadManager("data/payload_template.json")
     scraper = JobKoreaScraper(
         config=config,
         payload_manager=payload_manager,
         output_dir=output_dir,
-        filter_active_within_minutes=filter_active_within_minutes
+        filter_active_within_minutes=filter_active_within_minutes,
+        dedup_index=dedup_index,
+        account_name=sheet_name,
+        candidate_store=candidate_store,
+        scorer=scorer
     )
 
-    # 4️⃣ 데이터 수집
-    people = scraper.scrape(
-        start_page=start_page,
-        end_page=end_page,
-        page_size=page_size,
-        delay=delay,
+    # 4️⃣ 데이터 수집 (스트리밍이면 페이지마다 바로 저장)
+    search_options = dict(
         job_name=search_config['job_names'],
         areas=search_config['areas'],
         education=search_config['education'],
@@ -79,38 +178,154 @@ def run_single_account(
         genders=search_config['genders'],
         job_status=search_config['job_status']
     )
+    # 페이지 단위 진행 저널 (계정 + 검색 조건 + 시작 페이지별, 중단 시 resume=True로 이어서 수집)
+    # 끝 페이지는 저널의 완료 기록과 비교하므로 키에 넣지 않음 (end_page를 늘리면 이어서 수집)
+    checkpoint = ScrapeCheckpoint.for_search(
+        str(Path(output_dir) / "checkpoints"),
+        sheet_name,
+        saveno_ttl=getattr(config, "CHECKPOINT_SAVENO_TTL", 30 * 60),
+        start_page=start_page,
+        page_size=page_size,
+        filter_active_within_minutes=filter_active_within_minutes,
+        **search_options
+    )
+    scrape_options = dict(
+        start_page=start_page,
+        end_page=end_page,
+        page_size=page_size,
+        delay=delay,
+        on_page=on_page,
+        checkpoint=checkpoint,
+        resume=resume,
+        adaptive=adaptive,
+        **search_options
+    )
+    if streaming:
+        return _run_streaming(scraper, sheet_name, output_dir, use_async, scrape_options, export_formats)
 
-    # 5️⃣ 결과 저장
-    _save_results(people, sheet_name, output_dir, scraper)
+    if use_async:
+        people = asyncio.run(scraper.scrape_async(**scrape_options))
+    else:
+        people = scraper.scrape(**scrape_options)
+
+    # 5️⃣ 결과 저장 (저장한 뒤에만 변경 감지 지문 기록)
+    _save_results(people, sheet_name, output_dir, scraper, export_formats)
+    scraper.commit_changes()
+
+    return {
+        "success": not scraper.failed_pages,  # 수집하지 못한 페이지가 있으면 resume=True로 다시 실행
+        "pages": scraper.pages_fetched,
+        "people": len(people),
+        "duplicates": scraper.duplicates_removed,
+    }
+
+
+def _run_streaming(
+    scraper: JobKoreaScraper,
+    sheet_name: str,
+    output_dir: str,
+    use_async: bool,
+    scrape_options: Dict,
+    export_formats: Sequence[str] = ()
+) -> Dict:
+    """페이지 단위로 JSON/엑셀에 바로 기록하며 수집 (결과를 메모리에 모으지 않음)"""
+    json_path, excel_path = _result_paths(sheet_name, output_dir)
+    columns = scraper.exporter.columns
+    extra_exporters = _create_exporters(sheet_name, output_dir, export_formats, columns)
+    on_page = scrape_options.get("on_page")
+
+    with StreamingJsonExporter(str(json_path)) as json_exporter, \
+            StreamingExcelExporter(str(excel_path), columns=columns) as excel_exporter:
+
+        def write_page(page: int, people: List[Dict[str, str]]):
+            json_exporter.write(people)
+            excel_exporter.write(people)
+            for exporter in extra_exporters:
+                exporter.write(people)
+            if on_page:
+                on_page(page, people)
+
+        scrape_options = dict(scrape_options, on_page=write_page, keep_results=False)
+        try:
+            if use_async:
+                asyncio.run(scraper.scrape_async(**scrape_options))
+            else:
+                scraper.scrape(**scrape_options)
+        finally:
+            for exporter in extra_exporters:
+                exporter.close()
+
+    scraper.commit_changes()  # 모든 파일을 닫은 뒤에만 변경 감지 지문 기록
+    count = json_exporter.count
+    if count:
+        print(f"✅ 완료: {count}명 수집")
+        print(f"   📄 JSON: {json_path}")
+        print(f"   📊 Excel: {excel_path}")
+        for exporter in extra_exporters:
+            print(f"   🗂️  {exporter.EXTENSION.upper()}: {exporter.filename}")
+    else:
+        print(f"⚠️  수집된 데이터 없음")
 
-    return True
+    return {
+        "success": not scraper.failed_pages,
+        "pages": scraper.pages_fetched,
+        "people": count,
+        "duplicates": scraper.duplicates_removed,
+    }
 
 
 def run_all_accounts(
     excel_path: str = "configs/jobkorea_Excel.xlsx",
     start_page: int = 1,
-    end_page: int = 2,
+    end_page: Optional[int] = 2,
     page_size: int = 200,
-    delay: float = 1.0,
+    delay: float = 0.0,
     output_dir: str = "output",
-    filter_active_within_minutes: int = None
-):
+    filter_active_within_minutes: int = None,
+    workers: int = 1,
+    account_delays: Optional[Dict[str, float]] = None,
+    config_overrides: Optional[Dict] = None,
+    use_async: bool = False,
+    streaming: bool = False,
+    export_formats: Sequence[str] = (),
+    resume: bool = False,
+    dedup: bool = False,
+    dedup_bloom_capacity: Optional[int] = None,
+    only_changed: bool = False,
+    adaptive: bool = False,
+    score: bool = False
+) -> Optional[RunSummary]:
     """
-    엑셀 파일의 모든 계정을 순차 실행
+    엑셀 파일의 모든 계정을 실행 (workers > 1이면 병렬 실행)
 
     Args:
         excel_path: 엑셀 파일 경로
         start_page: 시작 페이지
-        end_page: 끝 페이지
+        end_page: 끝 페이지 (None이면 검색 결과 수로 자동 결정)
         page_size: 페이지당 크기
-        delay: 지연 시간(초)
+        delay: 페이지 간 추가 지연 시간(초, 요청 간격은 RateLimiter가 조절하므로 기본 0)
         output_dir: 출력 디렉토리
         filter_active_within_minutes: 최근활동 필터링 (분 단위, None이면 필터링 안 함)
+        workers: 동시에 실행할 계정 수 (1이면 순차 실행)
+        account_delays: 계정별 지연 시간 {시트명: 초} (없는 계정은 delay 사용)
+        config_overrides: 모든 계정의 JobKoreaConfig 속성 덮어쓰기
+        use_async: 계정별 비동기 수집 사용 여부
+        streaming: 페이지마다 바로 JSON/엑셀에 기록 (대용량 수집 시 메모리 절약)
+        export_formats: JSON/엑셀 외에 추가로 저장할 포맷 ("csv", "parquet", "arrow")
+        resume: 계정별 체크포인트의 마지막 페이지 다음부터 이어서 수집 (완료된 계정은 요청 없이 결과만 다시 저장)
+        dedup: 이력서번호 기준으로 페이지/계정 간 중복 인재 제외 (먼저 수집한 계정에만 남김)
+        dedup_bloom_capacity: 지정하면 중복 제거에 이 크기의 Bloom 필터 사용 (대규모 실행 시 메모리 고정)
+        only_changed: 계정별로 지난 실행 이후 새로 나타났거나 바뀐 인재만 저장
+        adaptive: 더 이상 결과가 없거나 최근활동 기간 안의 인재가 없는 페이지에서 수집 종료
+        score: 인재 채점(src/scoring.py) 후 "점수" 열을 JSON/엑셀/추가 포맷에 함께 저장 (규칙은 data/scoring_rules + 엑셀 "채점규칙" 시트)
+
+    Returns:
+        실행 통계 (실행할 계정이 없으면 None)
     """
     # 엑셀 파일 확인
     if not Path(excel_path).exists():
         print(f"❌ 엑셀 파일을 찾을 수 없습니다: {excel_path}")
-        return
+        return None
 
     # 실행 가능한 계정 시트 목록 가져오기
     account_manager = AccountManager(excel_path)
@@ -120,55 +335,96 @@ def run_all_accounts(
         print("❌ 실행 가능한 계정이 없습니다.")
         print(f"   - 계정 시트에 등록된 아이디: {account_manager.list_accounts()}")
         print(f"   - 엑셀의 모든 시트: {account_manager.get_all_sheet_names()}")
-        return
+        return None
 
     # 실행 정보 출력
     print(f"\n{'='*60}")
-    print(f"🚀 다중 계정 실행 시작")
+    print(f"🚀 다중 계정 실행 시작{f' (병렬 {workers}개)' if workers > 1 else ''}")
     print(f"📋 엑셀 파일: {excel_path}")
     print(f"🔢 실행 계정 수: {len(valid_sheets)}개")
     print(f"📄 실행 계정: {', '.join(valid_sheets)}")
     print(f"{'='*60}\n")
 
+    candidate_store = _open_candidate_store(output_dir) if only_changed else None
+    run_account = partial(
+        _run_account,
+        excel_path,
+        start_page=start_page,
+        end_page=end_page,
+        page_size=page_size,
+        output_dir=output_dir,
+        filter_active_within_minutes=filter_active_within_minutes,
+        config_overrides=config_overrides,
+        use_async=use_async,
+        streaming=streaming,
+        export_formats=export_formats,
+        resume=resume,
+        dedup_index=DedupIndex(bloom_capacity=dedup_bloom_capacity) if dedup else None,
+        candidate_store=candidate_store,
+        adaptive=adaptive,
+        score=score,
+        scoring_rules=RuleSetRegistry(excel_path=excel_path) if score else None
+    )
+    delays = {**(account_delays or {}), "default": delay}
+
+    try:
+        total_pages = end_page - start_page + 1 if end_page is not None else None
+        return _execute_accounts(run_account, valid_sheets, workers, delays, total_pages)
+    finally:
+        if candidate_store is not None:
+            candidate_store.close()
+
+
+def _execute_accounts(
+    run_account: Callable[..., Dict],
+    valid_sheets: List[str],
+    workers: int,
+    delays: Dict[str, float],
+    total_pages: Optional[int]
+) -> RunSummary:
+    """계정 실행 (workers > 1이면 병렬, 아니면 순차) 후 통계 출력"""
+    # 병렬 실행
+    if workers > 1:
+        runner = ParallelAccountRunner(run_account, workers=workers)
+        summary = runner.run(valid_sheets, delay=delays, total_pages=total_pages)
+        summary.print_summary()
+        return summary
+
     # 순차 실행
-    success_count = 0
-    fail_count = 0
+    summary = RunSummary()
 
     for idx, sheet_name in enumerate(valid_sheets, 1):
         print(f"\n{'='*60}")
         print(f"[{idx}/{len(valid_sheets)}] 📌 계정: {sheet_name}")
         print(f"{'='*60}\n")
 
-        success = run_single_account(
-            excel_path=excel_path,
-            sheet_name=sheet_name,
-            start_page=start_page,
-            end_page=end_page,
-            page_size=page_size,
-            delay=delay,
-            output_dir=output_dir,
-            filter_active_within_minutes=filter_active_within_minutes
+        started = time.perf_counter()
+        result = run_account(sheet_name, delay=delays.get(sheet_name, delays["default"]))
+        summary.add_account(
+            sheet_name,
+            success=result["success"],
+            pages=result["pages"],
+            people=result["people"],
+            elapsed=time.perf_counter() - started,
+            duplicates=result.get("duplicates", 0)
         )
 
-        if success:
-            success_count += 1
-        else:
-            fail_count += 1
-
         print(f"\n{'='*60}")
         print(f"✅ [{idx}/{len(valid_sheets)}] {sheet_name} 완료")
         print(f"{'='*60}\n")
 
     # 최종 결과 출력
-    print(f"\n{'='*60}")
-    print(f"🎉 전체 실행 완료!")
-    print(f"   ✅ 성공: {success_count}개")
-    if fail_count > 0:
-        print(f"   ❌ 실패: {fail_count}개")
-    print(f"{'='*60}\n")
+    summary.finish()
+    summary.print_summary()
+    return summary
+
 
+def _open_candidate_store(output_dir: str) -> CandidateStore:
+    """변경 감지 저장소 열기 (출력 디렉토리의 candidates.sqlite3)"""
+    return CandidateStore(str(Path(output_dir) / "candidates.sqlite3"))
 
-def _print_search_config(excel_path: str, sheet_name: str, username: str, config: dict, start_page: int, end_page: int, page_size: int):
+
+def _print_search_config(excel_path: str, sheet_name: str, username: str, config: dict, start_page: int, end_page: Optional[int], page_size: int):
     """검색 조건 출력"""
     print(f"🔑 계정: {username}")
     print(f"📄 검색조건 시트: {sheet_name}\n")
@@ -180,16 +436,35 @@ def _print_search_config(excel_path: str, sheet_name: str, username: str, config
     print(f"   학력: {config['education']}")
     print(f"   나이: {config['ages']}")
     print(f"   구직상태: {config['job_status']}")
-    print(f"   페이지: {start_page} ~ {end_page} (크기: {page_size})\n")
+    print(f"   페이지: {start_page} ~ {end_page if end_page is not None else '자동'} (크기: {page_size})\n")
+
 
+def _result_paths(sheet_name: str, output_dir: str, extension: str = "xlsx") -> tuple:
+    """결과 파일 경로 (파일명: 시트명 기반)"""
+    safe_sheet_name = sheet_name.replace('@', '_').replace('.', '_')
+    json_path = Path(output_dir) / f"{safe_sheet_name}_summary.json"
+    result_path = Path(output_dir) / f"{safe_sheet_name}_결과.{extension}"
+    return json_path, result_path
 
-def _save_results(people: list, sheet_name: str, output_dir: str, scraper):
+
+def _create_exporters(
+    sheet_name: str,
+    output_dir: str,
+    export_formats: Sequence[str],
+    columns: Optional[List[str]] = None
+) -> list:
+    """추가 저장 포맷별 exporter 생성 (파일명: {시트명}_결과.{확장자})"""
+    exporters = []
+    for fmt in export_formats:
+        _, path = _result_paths(sheet_name, output_dir, extension=fmt)
+        exporters.append(get_exporter(fmt, str(path), columns=columns))
+    return exporters
+
+
+def _save_results(people: list, sheet_name: str, output_dir: str, scraper, export_formats: Sequence[str] = ()):
     """결과 저장"""
     if people:
-        # 파일명: 시트명 기반
-        safe_sheet_name = sheet_name.replace('@', '_').replace('.', '_')
-        json_path = Path(output_dir) / f"{safe_sheet_name}_summary.json"
-        excel_path = Path(output_dir) / f"{safe_sheet_name}_결과.xlsx"
+        json_path, excel_path = _result_paths(sheet_name, output_dir)
 
         # JSON 저장
         with open(json_path, "w", encoding="utf-8") as f:
@@ -198,9 +473,16 @@ def _save_results(people: list, sheet_name: str, output_dir: str, scraper):
         # 엑셀 저장
         scraper.exporter.save(people, str(excel_path))
 
+        # 추가 포맷 저장 (CSV/Parquet/Arrow)
+        extra_exporters = _create_exporters(sheet_name, output_dir, export_formats, scraper.exporter.columns)
+        for exporter in extra_exporters:
+            exporter.save(people)
+
         print(f"✅ 완료: {len(people)}명 수집")
         print(f"   📄 JSON: {json_path}")
         print(f"   📊 Excel: {excel_path}")
+        for exporter in extra_exporters:
+            print(f"   🗂️  {exporter.EXTENSION.upper()}: {exporter.filename}")
     else:
         print(f"⚠️  수집된 데이터 없음")
 
@@ -215,13 +497,16 @@ def main():
     START_PAGE = 1
     END_PAGE = 2
     PAGE_SIZE = 100
-    DELAY = 1.0
+    DELAY = 0.0  # 추가 지연 (요청 간격은 config.py의 RATE_LIMIT_*로 조절)
 
     OUTPUT_DIR = "output"
 
     # 🔥 최근활동 필터링 설정 (분 단위)
     FILTER_ACTIVE_WITHIN_MINUTES = 240  # 30분 이내 활동한 사용자만 추출
 
+    # 동시에 실행할 계정 수 (1이면 순차 실행)
+    WORKERS = 1
+
     # =====================================================
 
     # 모든 계정 자동 실행
@@ -232,7 +517,8 @@ def main():
         page_size=PAGE_SIZE,
         delay=DELAY,
         output_dir=OUTPUT_DIR,
-        filter_active_within_minutes=FILTER_ACTIVE_WITHIN_MINUTES
+        filter_active_within_minutes=FILTER_ACTIVE_WITHIN_MINUTES,
+        workers=WORKERS
     )
 
 
@@ -4,6 +4,8 @@
 from playwright.sync_api import sync_playwright
 import time
 from src.account_manager import AccountManager
+from src.config import JobKoreaConfig
+from src.resource_blocker import ResourceBlocker
 
 def setup_2fa_login():
     """
@@ -47,6 +49,11 @@ def setup_2fa_login():
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         )
 
+        # 동영상/폰트 등 인증에 필요 없는 리소스 차단 (config.RESOURCE_BLOCKING["setup_2fa"])
+        resource_blocker = ResourceBlocker.from_config(JobKoreaConfig, "setup_2fa")
+        if resource_blocker is not None:
+            resource_blocker.attach(context)
+
         page = context.pages[0]  # 첫 번째 페이지 사용
 
         # 로그인 페이지로 이동
@@ -78,7 +85,9 @@ def setup_2fa_login():
 
         try:
             # 첫 번째 이력서 페이지 접근
+            started = time.perf_counter()
             page.goto("https://www.jobkorea.co.kr/corp/person/find/resume/view?rNo=28135740", timeout=10000)
+            print(f"⏱️  이력서 페이지 로드 {time.perf_counter() - started:.2f}초")
             time.sleep(3)
 
             print("⚠️  2단계 인증 화면이 나타납니다!")
@@ -100,6 +109,9 @@ def setup_2fa_login():
         print(f"💾 User Data: {user_data_dir}")
         print("\n이제 extract_with_persistent.py를 실행하면 2차 인증 없이 작동합니다!")
 
+        if resource_blocker is not None:
+            resource_blocker.print_summary("브라우저 리소스")
+
         time.sleep(2)
         context.close()
 
@@ -110,13 +110,13 @@ class AccountManager:
         (고정 시트 제외 + 계정 시트에 존재하는 아이디만)
 
         Args:
-            excluded_sheets: 제외할 시트명 리스트 (기본: ["직무스킬", "계정", "매핑"])
+            excluded_sheets: 제외할 시트명 리스트 (기본: ["직무스킬", "계정", "매핑", "채점규칙"])
 
         Returns:
             실행 가능한 계정 시트명 리스트
         """
         if excluded_sheets is None:
-            excluded_sheets = ["직무스킬", "계정", "매핑"]
+            excluded_sheets = ["직무스킬", "계정", "매핑", "채점규칙"]
 
         # 1. 모든 시트명 가져오기
         all_sheets = self.get_all_sheet_names()
@@ -0,0 +1,110 @@
+"""다중 계정 병렬 실행"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Union
+
+from src.metrics import RunSummary
+
+
+class AccountProgress:
+    """계정별 진행 상황 출력"""
+
+    _print_lock = threading.Lock()
+
+    def __init__(self, sheet_name: str, total_pages: Optional[int] = None):
+        self.sheet_name = sheet_name
+        self.total_pages = total_pages
+        self.pages_done = 0
+        self.people = 0
+
+    def on_page(self, page: int, people: List[Dict[str, str]]):
+        """페이지 1개 처리 완료 시 호출 (JobKoreaScraper.scrape의 on_page 콜백)"""
+        self.pages_done += 1
+        self.people += len(people)
+        total = f"/{self.total_pages}" if self.total_pages else ""
+        with self._print_lock:
+            print(f"   📈 [{self.sheet_name}] {self.pages_done}{total} 페이지 완료 "
+                  f"(page {page}, +{len(people)}명, 누적 {self.people}명)")
+
+
+class ParallelAccountRunner:
+    """
+    워커 풀로 여러 계정을 동시에 실행
+
+    각 워커는 계정 1개를 맡아 자신만의 JobKoreaScraper/requests.Session과
+    지연 시간(delay)을 사용하므로 계정 간 상태를 공유하지 않습니다.
+    """
+
+    def __init__(self, run_account: Callable[..., Dict], workers: int = 4):
+        """
+        Args:
+            run_account: 계정 1개 실행 함수
+                run_account(sheet_name, delay=..., on_page=...) → {"success", "pages", "people", "duplicates"(선택)}
+            workers: 동시에 실행할 계정 수
+        """
+        self.run_account = run_account
+        self.workers = max(1, workers)
+
+    def run(
+        self,
+        sheet_names: List[str],
+        delay: Union[float, Dict[str, float]] = 0.0,
+        total_pages: Optional[int] = None
+    ) -> RunSummary:
+        """
+        모든 계정 실행 후 통합 통계 반환
+
+        Args:
+            sheet_names: 실행할 계정 시트명 리스트
+            delay: 페이지 간 지연 시간(초) 또는 {시트명: 지연 시간} 딕셔너리
+            total_pages: 계정당 요청할 페이지 수 (진행 상황 표시용)
+        """
+        summary = RunSummary()
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="account") as executor:
+            futures = {
+                executor.submit(self._run_one, sheet_name, self._delay_for(sheet_name, delay), total_pages): sheet_name
+                for sheet_name in sheet_names
+            }
+
+            for done_count, future in enumerate(as_completed(futures), 1):
+                sheet_name = futures[future]
+                result = future.result()
+                summary.add_account(sheet_name, **result)
+
+                status = "✅" if result["success"] else "❌"
+                print(f"\n{status} [{done_count}/{len(sheet_names)}] {sheet_name} 완료 "
+                      f"({result['pages']}페이지, {result['people']}명, {result['elapsed']:.1f}초)\n")
+
+        summary.finish()
+        return summary
+
+    def _run_one(self, sheet_name: str, delay: float, total_pages: Optional[int]) -> Dict:
+        """워커 스레드에서 계정 1개 실행 (예외는 실패로 기록)"""
+        progress = AccountProgress(sheet_name, total_pages)
+        started = time.perf_counter()
+
+        try:
+            result = self.run_account(sheet_name, delay=delay, on_page=progress.on_page)
+            error = None if result["success"] else "실행 실패"
+        except Exception as e:
+            print(f"❌ [{sheet_name}] 오류: {e}")
+            result = {"success": False, "pages": progress.pages_done, "people": progress.people}
+            error = str(e)
+
+        return {
+            "success": result["success"],
+            "pages": result.get("pages", progress.pages_done),
+            "people": result.get("people", progress.people),
+            "elapsed": time.perf_counter() - started,
+            "error": error,
+            "duplicates": result.get("duplicates", 0),
+        }
+
+    @staticmethod
+    def _delay_for(sheet_name: str, delay: Union[float, Dict[str, float]]) -> float:
+        """계정별 지연 시간 결정"""
+        if isinstance(delay, dict):
+            return delay.get(sheet_name, delay.get("default", 0.0))
+        return delay
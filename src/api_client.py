@@ -1,17 +1,35 @@
 """잡코리아 API 클라이언트"""
-import json
+import time
 import requests
+from typing import Optional
 from src.config import JobKoreaConfig
 from src.payload_manager import PayloadManager
 from src.auth import JobKoreaAuth
+from src.session_cache import SessionCache
+from src.rate_limiter import RateLimiter, get_rate_limiter
+from src.retry import CircuitBreaker, CircuitOpenError, RetryPolicy, SearchRequestError
+from src.transport import create_session
+
+
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"}
 
 
 class JobKoreaAPIClient:
     """잡코리아 API 클라이언트"""
 
-    def __init__(self, config: JobKoreaConfig, payload_manager: PayloadManager):
+    def __init__(self, config: JobKoreaConfig, payload_manager: PayloadManager, rate_limiter: Optional[RateLimiter] = None):
+        """
+        Args:
+            config: 잡코리아 설정
+            payload_manager: payload 관리자
+            rate_limiter: 요청 속도 제한 (None이면 프로세스 공유 인스턴스 사용)
+        """
         self.config = config
         self.payload_manager = payload_manager
+        self.rate_limiter = rate_limiter or get_rate_limiter(config)
+        self.retry_policy = RetryPolicy.from_config(config)
+        self.circuit_breaker = CircuitBreaker.from_config(config, name=config.USERNAME)  # 계정별
+        self.auth: Optional[JobKoreaAuth] = None
         self.session = self._create_session()
 
     def _create_session(self) -> requests.Session:
@@ -24,9 +42,16 @@ class JobKoreaAPIClient:
                 print("   임시로 쿠키 방식을 사용합니다.\n")
                 return self._create_session_with_cookies()
 
-            # 로그인 시도
-            auth = JobKoreaAuth(self.config.USERNAME, self.config.PASSWORD)
-            session = auth.login()
+            # 로그인 시도 (저장된 세션이 유효하면 재사용)
+            self.auth = JobKoreaAuth(
+                self.config.USERNAME,
+                self.config.PASSWORD,
+                cache=SessionCache.from_config(self.config),
+                rate_limiter=self.rate_limiter,
+                timeout=self.retry_policy.timeout,
+                config=self.config
+            )
+            session = self.auth.login()
 
             if session:
                 # 로그인 성공 - 헤더 추가
@@ -39,9 +64,31 @@ class JobKoreaAPIClient:
             # 수동 쿠키 사용
             return self._create_session_with_cookies()
 
+    def relogin(self) -> bool:
+        """
+        세션 만료 시 다시 로그인
+
+        저장된 쿠키는 버리고, 새로 받은 쿠키로 기존 세션 객체의 쿠키를 교체합니다.
+        (세션을 공유하는 비동기 클라이언트도 같은 쿠키를 사용하도록)
+
+        Returns:
+            다시 로그인했으면 True (자동 로그인을 사용하지 않거나 실패하면 False)
+        """
+        if self.auth is None:
+            return False
+
+        print("🔄 세션 만료 - 다시 로그인합니다")
+        session = self.auth.login(use_cache=False)
+        if not session:
+            return False
+
+        self.session.cookies.clear()
+        self.session.cookies.update(session.cookies)
+        return True
+
     def _create_session_with_cookies(self) -> requests.Session:
         """쿠키 문자열로 세션 생성"""
-        session = requests.Session()
+        session = create_session(self.config)
         session.headers.update(self.config.HEADERS)
         session.cookies.update(self._parse_cookies(self.config.COOKIE_STR))
         return session
@@ -52,12 +99,63 @@ class JobKoreaAPIClient:
         return dict(x.strip().split("=", 1) for x in cookie_str.split("; ") if "=" in x)
 
     def search(self, page: int = 1, page_size: int = 10, saveno: int = 0, **kwargs) -> requests.Response:
-        """인재 검색 API 호출"""
-        payload = self.payload_manager.create_payload(page, page_size, saveno=saveno, **kwargs)
-        data = {"searchCondition": json.dumps(payload, ensure_ascii=False)}
+        """
+        인재 검색 API 호출
+
+        연결 실패/타임아웃/429·5xx는 지수 백오프로 재시도하고,
+        비로그인 응답이면 다시 로그인 후 1회 재요청합니다.
+
+        Raises:
+            CircuitOpenError: 연속 실패로 이 계정의 요청이 잠시 중단된 상태
+            SearchRequestError: 재시도 후에도 실패 (비로그인, 4xx 등 재시도할 수 없는 응답 포함)
+        """
+        # 검색 조건별로 미리 인코딩한 본문에 페이지 필드만 채움
+        data = self.payload_manager.create_search_body(page, page_size, saveno=saveno, **kwargs)
+        policy = self.retry_policy
+        relogged_in = False
+        attempt = 0
+
+        # 서킷 브레이커는 페이지 단위로 판단 (재시도 중에는 다시 묻지 않고, 재시도 후 최종 실패만 1회로 기록)
+        if not self.circuit_breaker.allow():
+            raise CircuitOpenError(f"요청 중단 상태 (연속 {self.circuit_breaker.failures}회 실패)", page)
+
+        while True:
+            attempt += 1
+            retry_after = None
+            print(f"[요청] page={page}, ps={page_size}, saveno={saveno}")
+            try:
+                response = self._post(data)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = SearchRequestError(f"{type(e).__name__}: {e}", page)
+            else:
+                print(f"[응답] status={response.status_code}")
+                if JobKoreaAuth.is_logged_out(response.status_code, response.url, response.text):
+                    # 비로그인 응답이면 다시 로그인 후 1회 재요청
+                    if not relogged_in and self.relogin():
+                        relogged_in = True
+                        continue
+                    self.circuit_breaker.record_failure()
+                    raise SearchRequestError("비로그인 응답 (다시 로그인 실패)", page, response.status_code)
+
+                if response.ok:
+                    self.circuit_breaker.record_success()
+                    return response
+
+                error = SearchRequestError(f"HTTP {response.status_code}", page, response.status_code)
+                if not policy.is_retryable_status(response.status_code):
+                    self.circuit_breaker.record_failure()
+                    raise error
+                retry_after = response.headers.get("Retry-After")
+
+            if attempt >= policy.max_attempts:
+                self.circuit_breaker.record_failure()
+                raise error
 
-        print(f"[요청] page={page}, ps={page_size}, saveno={saveno}")
-        response = self.session.post(self.config.API_URL, data=data)
-        print(f"[응답] status={response.status_code}")
+            wait = policy.backoff(attempt, retry_after)
+            print(f"⚠️  page {page} 요청 실패 ({error}) - {wait:.1f}초 후 재시도 ({attempt}/{policy.max_attempts - 1})")
+            time.sleep(wait)
 
-        return response
+    def _post(self, data: bytes) -> requests.Response:
+        """속도 제한을 거쳐 검색 API 호출"""
+        self.rate_limiter.acquire(self.config.API_URL, account=self.config.USERNAME)
+        return self.session.post(self.config.API_URL, data=data, headers=FORM_HEADERS, timeout=self.retry_policy.timeout)
@@ -0,0 +1,217 @@
+"""잡코리아 비동기 API 클라이언트 (aiohttp)"""
+import asyncio
+import json
+from typing import Callable, Dict, Optional
+
+import aiohttp
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.api_client import FORM_HEADERS
+from src.auth import JobKoreaAuth
+from src.config import JobKoreaConfig
+from src.payload_manager import PayloadManager
+from src.rate_limiter import RateLimiter
+from src.retry import CircuitBreaker, CircuitOpenError, RetryPolicy, SearchRequestError
+
+
+class AsyncSearchResponse:
+    """aiohttp 응답을 requests.Response처럼 다루기 위한 래퍼"""
+
+    def __init__(self, status_code: int, headers: Dict[str, str], text: str, url: str):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.text = text
+        self.url = url
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncJobKoreaAPIClient:
+    """
+    잡코리아 비동기 API 클라이언트
+
+    동기 클라이언트(JobKoreaAPIClient)의 requests.Session과 쿠키/헤더를 공유합니다.
+    요청 시 세션 쿠키를 사용하고, 응답으로 받은 쿠키는 다시 세션에 반영합니다.
+    비로그인 응답을 받으면 relogin으로 다시 로그인한 뒤 1회 재요청하고,
+    일시적인 오류는 동기 클라이언트와 같은 재시도 정책/서킷 브레이커로 처리합니다.
+    """
+
+    def __init__(
+        self,
+        config: JobKoreaConfig,
+        payload_manager: PayloadManager,
+        session: requests.Session,
+        max_in_flight: int = 4,
+        timeout: float = 60.0,
+        relogin: Optional[Callable[[], bool]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Args:
+            config: 잡코리아 설정
+            payload_manager: payload 관리자
+            session: 쿠키/헤더를 공유할 동기 세션 (로그인된 세션)
+            max_in_flight: 동시에 진행할 최대 요청 수
+            timeout: 요청 1개의 전체 제한 시간(초)
+            relogin: 세션 만료 시 호출할 재로그인 함수 (session의 쿠키를 갱신하고 성공 여부 반환)
+            rate_limiter: 요청 속도 제한 (동기 클라이언트와 같은 인스턴스를 공유)
+            retry_policy: 재시도 정책 (None이면 config 설정으로 생성)
+            circuit_breaker: 계정별 서킷 브레이커 (동기 클라이언트와 같은 인스턴스를 공유)
+        """
+        self.config = config
+        self.payload_manager = payload_manager
+        self.sync_session = session
+        self.max_in_flight = max(1, max_in_flight)
+        self.timeout = timeout
+        self.relogin = relogin
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy.from_config(config)
+        self.circuit_breaker = circuit_breaker or CircuitBreaker.from_config(config, name=config.USERNAME)
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        self._relogin_lock = asyncio.Lock()
+        self._login_generation = 0  # 재로그인할 때마다 증가 (동시 요청의 중복 재로그인 방지)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @classmethod
+    def from_sync_client(cls, sync_client, max_in_flight: int = 4) -> "AsyncJobKoreaAPIClient":
+        """동기 클라이언트의 설정/세션을 그대로 사용하는 비동기 클라이언트 생성"""
+        return cls(
+            sync_client.config,
+            sync_client.payload_manager,
+            sync_client.session,
+            max_in_flight=max_in_flight,
+            relogin=sync_client.relogin,
+            rate_limiter=sync_client.rate_limiter,
+            retry_policy=sync_client.retry_policy,
+            circuit_breaker=sync_client.circuit_breaker
+        )
+
+    async def __aenter__(self) -> "AsyncJobKoreaAPIClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def open(self):
+        """aiohttp 세션 생성 (동기 세션의 헤더/쿠키 복사)"""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                headers=dict(self.sync_session.headers),
+                cookies=self.sync_session.cookies.get_dict(),
+                connector=aiohttp.TCPConnector(limit=self.max_in_flight),
+                timeout=aiohttp.ClientTimeout(
+                    total=self.timeout,
+                    sock_connect=self.retry_policy.connect_timeout,
+                    sock_read=self.retry_policy.read_timeout
+                )
+            )
+
+    async def close(self):
+        """aiohttp 세션 종료"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def search(self, page: int = 1, page_size: int = 10, saveno: int = 0, **kwargs) -> AsyncSearchResponse:
+        """
+        인재 검색 API 비동기 호출 (동시 요청 수는 max_in_flight로 제한)
+
+        Raises:
+            CircuitOpenError: 연속 실패로 이 계정의 요청이 잠시 중단된 상태
+            SearchRequestError: 재시도 후에도 실패
+        """
+        await self.open()
+
+        data = self.payload_manager.create_search_body(page, page_size, saveno=saveno, **kwargs)
+        policy = self.retry_policy
+        relogged_in = False
+        attempt = 0
+
+        # 서킷 브레이커는 페이지 단위로 판단 (재시도 중에는 다시 묻지 않고, 재시도 후 최종 실패만 1회로 기록)
+        if not self.circuit_breaker.allow():
+            raise CircuitOpenError(f"요청 중단 상태 (연속 {self.circuit_breaker.failures}회 실패)", page)
+
+        while True:
+            attempt += 1
+            retry_after = None
+            async with self._semaphore:
+                generation = self._login_generation
+                try:
+                    response = await self._post(data, page, page_size, saveno)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    response = None
+                    error = SearchRequestError(f"{type(e).__name__}: {e}", page)
+
+                if response is not None and JobKoreaAuth.is_logged_out(response.status_code, response.url, response.text):
+                    # 비로그인 응답이면 다시 로그인 후 1회 재요청
+                    if not relogged_in and await self._relogin(generation):
+                        relogged_in = True
+                        continue
+                    self.circuit_breaker.record_failure()
+                    raise SearchRequestError("비로그인 응답 (다시 로그인 실패)", page, response.status_code)
+
+            if response is not None:
+                if 200 <= response.status_code < 400:
+                    self.circuit_breaker.record_success()
+                    return response
+
+                error = SearchRequestError(f"HTTP {response.status_code}", page, response.status_code)
+                if not policy.is_retryable_status(response.status_code):
+                    self.circuit_breaker.record_failure()
+                    raise error
+                retry_after = response.headers.get("Retry-After")
+
+            if attempt >= policy.max_attempts:
+                self.circuit_breaker.record_failure()
+                raise error
+
+            wait = policy.backoff(attempt, retry_after)
+            print(f"⚠️  page {page} 요청 실패 ({error}) - {wait:.1f}초 후 재시도 ({attempt}/{policy.max_attempts - 1})")
+            await asyncio.sleep(wait)
+
+    async def _post(self, data: bytes, page: int, page_size: int, saveno: int) -> AsyncSearchResponse:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(self.config.API_URL, account=self.config.USERNAME)
+
+        print(f"[비동기 요청] page={page}, ps={page_size}, saveno={saveno}")
+        async with self._session.post(self.config.API_URL, data=data, headers=FORM_HEADERS) as response:
+            text = await response.text()
+            self._share_cookies(response)
+            print(f"[비동기 응답] page={page}, status={response.status}")
+
+            return AsyncSearchResponse(response.status, dict(response.headers), text, str(response.url))
+
+    async def _relogin(self, generation: int) -> bool:
+        """
+        재로그인 후 aiohttp 세션 쿠키 갱신
+
+        동시에 만료 응답을 받은 요청들은 한 번만 재로그인하고 갱신된 쿠키를 함께 사용합니다.
+        """
+        if self.relogin is None:
+            return False
+
+        async with self._relogin_lock:
+            if generation != self._login_generation:
+                return True  # 다른 요청이 이미 재로그인함
+
+            loop = asyncio.get_running_loop()
+            if not await loop.run_in_executor(None, self.relogin):
+                return False
+
+            self._session.cookie_jar.clear()
+            self._session.cookie_jar.update_cookies(self.sync_session.cookies.get_dict())
+            self._login_generation += 1
+            return True
+
+    def _share_cookies(self, response: aiohttp.ClientResponse):
+        """응답으로 받은 쿠키를 동기 세션에도 반영"""
+        for name, morsel in response.cookies.items():
+            cookie_attrs = {"path": morsel["path"] or "/"}
+            if morsel["domain"]:
+                cookie_attrs["domain"] = morsel["domain"]
+            self.sync_session.cookies.set(name, morsel.value, **cookie_attrs)
@@ -1,25 +1,88 @@
 """잡코리아 로그인 인증"""
+import re
 import requests
 from typing import Optional
 
+from src.session_cache import SessionCache
+from src.rate_limiter import RateLimiter
+from src.transport import create_session
+
 
 class JobKoreaAuth:
     """잡코리아 로그인 인증"""
 
     LOGIN_URL = "https://www.jobkorea.co.kr/Login/Login.asp"
-
-    def __init__(self, username: str, password: str):
+    # 비로그인 상태에서 받는 로그인 페이지/로그인 이동 스크립트
+    LOGGED_OUT_PATTERN = re.compile(r'/login/login\w*\.asp|name=["\']M_ID["\']', re.IGNORECASE)
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        cache: Optional[SessionCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        timeout=None,
+        config=None
+    ):
+        """
+        Args:
+            username: 잡코리아 아이디
+            password: 잡코리아 비밀번호
+            cache: 로그인 세션 캐시 (None이면 매번 로그인)
+            rate_limiter: 요청 속도 제한 (None이면 제한 없음)
+            timeout: 로그인 요청 제한 시간 (초 또는 (연결, 응답) 튜플, None이면 제한 없음)
+            config: HTTP 연결 풀 설정 (HTTP_*, None이면 기본값), LOGIN_URL이 있으면 그 주소로 로그인
+        """
         self.username = username
         self.password = password
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.config = config
+        self.login_url = getattr(config, "LOGIN_URL", None) or self.LOGIN_URL
 
-    def login(self) -> Optional[requests.Session]:
+    def login(self, use_cache: bool = True) -> Optional[requests.Session]:
         """
         로그인하여 세션 반환
 
+        캐시가 있으면 저장된 쿠키가 만료되기 전까지 재사용하고, 없거나 만료되었을 때만 로그인합니다.
+
+        Args:
+            use_cache: False면 저장된 쿠키를 버리고 다시 로그인 (요청이 비로그인 상태로 응답된 경우)
+
         Returns:
             로그인 성공 시 세션 객체, 실패 시 None
         """
-        session = requests.Session()
+        if self.cache is not None:
+            if use_cache:
+                session = self._restore_session()
+                if session:
+                    return session
+            else:
+                self.cache.invalidate(self.username)
+
+        session = self._login_with_form()
+        if session and self.cache is not None:
+            self.cache.save(self.username, session.cookies)
+        return session
+
+    def _restore_session(self) -> Optional[requests.Session]:
+        """캐시에 저장된 쿠키로 세션 생성 (없거나 만료되었으면 None)"""
+        cookies = self.cache.load(self.username)
+        if cookies is None:
+            return None
+
+        session = create_session(self.config)
+        session.cookies.update(cookies)
+        if not self._check_login_success(session):
+            return None
+
+        print(f"♻️  저장된 로그인 세션 사용: {self.username}")
+        return session
+
+    def _login_with_form(self) -> Optional[requests.Session]:
+        """Login.asp에 아이디/비밀번호를 전송하여 로그인"""
+        session = create_session(self.config)
 
         # 로그인 데이터
         data = {
@@ -56,11 +119,14 @@ class JobKoreaAuth:
 
         try:
             print(f"🔐 로그인 시도: {self.username}")
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self.login_url, account=self.username)
             response = session.post(
-                self.LOGIN_URL,
+                self.login_url,
                 data=data,
                 headers=headers,
-                allow_redirects=True
+                allow_redirects=True,
+                timeout=self.timeout
             )
 
             # 디버깅: 응답 상태 확인
@@ -108,3 +174,15 @@ class JobKoreaAuth:
                 return True
 
         return False
+
+    @classmethod
+    def is_logged_out(cls, status_code: int, url: str, text: str = "") -> bool:
+        """
+        응답이 비로그인 상태인지 확인 (세션 만료)
+
+        401/403이거나, 로그인 페이지로 리다이렉트되었거나,
+        200이지만 본문이 로그인 페이지(로그인 이동 스크립트)인 경우
+        """
+        if status_code in (401, 403) or "/login/" in str(url).lower():
+            return True
+        return bool(text) and cls.LOGGED_OUT_PATTERN.search(text) is not None
@@ -0,0 +1,383 @@
+"""
+대량 재채점 (열 단위 벡터 연산)
+
+규칙을 바꾼 뒤 저장된 인재 전체를 다시 채점할 때 사용합니다.
+CandidateScorer가 레코드를 한 명씩 보는 것과 달리, 인재 표를 pandas DataFrame 1개로 읽어 필드(열)별로 한 번에 계산합니다.
+
+- 필드마다 pd.factorize로 서로 다른 텍스트만 골라 정규화/키워드/정규식을 계산하고 코드로 행에 펼침
+  (지역, 학력, 기술스택처럼 값이 반복되는 필드는 고유 값 수만큼만 계산)
+- 키워드 조건은 그룹의 키워드를 정규식 1개(대안 |)로 묶어 Series.str.contains
+- TOEIC/OPIc 점수, 숫자 성과(numberHit)는 Series.str.extract로 추출 후 필드 순서대로 첫 일치 선택
+- 단계(tiers)는 np.select, 항목 상한은 clip
+- workers > 1이면 행을 나눠 여러 프로세스에서 채점
+
+CandidateScorer와 같은 규칙에 대해 같은 점수를 반환합니다 (benchmarks/bench_scoring.py에서 확인).
+
+읽을 수 있는 파일: *_summary.json (JSON 목록 또는 grade.js 형식 {id: 레코드}), .csv, .parquet, .arrow
+
+사용법:
+    python -m src.batch_scoring output/*_summary.json --rules insurance_sales --workers 4 --output rescored.parquet
+"""
+import json
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.scoring import (
+    DETAIL_FIELDS,
+    ESSAY_DEFAULT_FIELD,
+    ESSAY_FIELDS,
+    ESSAY_SOURCE,
+    FIELD_ALIASES,
+    SCORE_COLUMN,
+    CandidateScorer,
+    default_rules,
+    detail_text,
+    essay_texts,
+    item_list,
+    normalize_text,
+    own_text,
+)
+
+ESSAY_TARGETS = tuple(name for _, name in ESSAY_FIELDS) + (ESSAY_DEFAULT_FIELD,)
+
+
+def load_candidates(path: Union[str, Path]) -> pd.DataFrame:
+    """
+    저장된 인재 파일 → DataFrame (값의 파이썬 타입을 유지하도록 object 열)
+
+    Args:
+        path: *_summary.json, .csv, .parquet 또는 .arrow 파일
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        records = list(data.values()) if isinstance(data, dict) else data  # grade.js 형식은 {id: 레코드}
+        return pd.DataFrame(records, dtype=object)
+    if suffix == ".csv":
+        return pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+    if suffix == ".parquet":
+        return pd.read_parquet(path)
+    if suffix == ".arrow":
+        import pyarrow
+
+        with pyarrow.memory_map(str(path)) as source:
+            return pyarrow.ipc.open_file(source).read_all().to_pandas()
+    raise ValueError(f"지원하지 않는 파일 형식: {path} (json, csv, parquet, arrow)")
+
+
+def _own_text(df: pd.DataFrame, column: str) -> pd.Series:
+    """
+    열 값 → 채점 텍스트 (scoring_fields와 같은 own_text 규칙)
+
+    문자열/숫자는 문자열로, 스칼라 목록은 공백으로 이은 문자열, 그 외(없음/딕셔너리 목록)는 NaN
+    """
+    if column not in df.columns:
+        return pd.Series(np.nan, index=df.index, dtype=object)
+    values = df[column]
+    if pd.api.types.infer_dtype(values, skipna=True) in ("string", "empty"):
+        return values.astype(object)
+
+    def text(value):
+        if isinstance(value, float) and np.isnan(value):
+            return np.nan
+        found = own_text(value)
+        return np.nan if found is None else found
+
+    return values.map(text).astype(object)
+
+
+def _list_text(df: pd.DataFrame, column: str, convert) -> pd.Series:
+    """목록 열(이력서 상세) → 텍스트 (목록이 아닌 행은 NaN, 목록 판단은 scoring_fields와 같은 item_list)"""
+    if column not in df.columns:
+        return pd.Series(np.nan, index=df.index, dtype=object)
+
+    def text(value):
+        items = item_list(value)
+        return np.nan if items is None else convert(items)
+
+    return df[column].map(text).astype(object)
+
+
+def field_texts(df: pd.DataFrame, fields: Iterable[str]) -> Dict[str, pd.Series]:
+    """DataFrame → {grade.js 입력 필드: 텍스트 Series} (scoring_fields의 열 단위 버전, 없는 값은 "")"""
+    details = {field: (source, keys, keep) for source, field, keys, keep in DETAIL_FIELDS}
+    essays = None
+    texts = {}
+    for field in fields:
+        text = _own_text(df, field)
+        if field in FIELD_ALIASES:
+            text = text.combine_first(_own_text(df, FIELD_ALIASES[field]))
+        elif field in details:
+            source, keys, keep_existing = details[field]
+            joined = _list_text(df, source, lambda items, keys=keys: detail_text(items, keys))
+            text = text.combine_first(joined) if keep_existing else joined.combine_first(text)
+        elif field in ESSAY_TARGETS:
+            if essays is None:
+                essays = _list_text(df, ESSAY_SOURCE, essay_texts)
+            text = text.combine_first(essays.map(lambda found, field=field: found.get(field, np.nan) if isinstance(found, dict) else np.nan))
+        texts[field] = text.fillna("").astype(str)
+    return texts
+
+
+class _FrameTexts:
+    """DataFrame 1개의 필드별 고유 값 / 키워드 / 정규식 결과 캐시"""
+
+    def __init__(self, texts: Dict[str, pd.Series], patterns: Dict[str, str]):
+        self.texts = texts
+        self.rows = len(next(iter(texts.values()))) if texts else 0
+        self.patterns = patterns
+        self._factorized: Dict[str, Tuple[np.ndarray, pd.Series]] = {}
+        self._normalized: Dict[str, pd.Series] = {}
+        self._hits: Dict[tuple, np.ndarray] = {}
+        self._matches: Dict[tuple, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def factorized(self, field: str) -> Tuple[np.ndarray, pd.Series]:
+        """(행별 코드, 고유 텍스트)"""
+        if field not in self._factorized:
+            codes, uniques = pd.factorize(self.texts[field])
+            self._factorized[field] = (codes, pd.Series(uniques, dtype=object))
+        return self._factorized[field]
+
+    def nonempty(self, field: str) -> np.ndarray:
+        return (self.texts[field] != "").to_numpy()
+
+    def hits(self, field: str, keyword_regex: Optional[str]) -> np.ndarray:
+        """행별로 키워드(정규화 후 부분 문자열)가 하나라도 포함되었는지"""
+        key = (field, keyword_regex)
+        if key not in self._hits:
+            if keyword_regex is None:
+                self._hits[key] = np.zeros(self.rows, dtype=bool)
+            else:
+                codes, uniques = self.factorized(field)
+                if field not in self._normalized:
+                    self._normalized[field] = uniques.str.lower().str.replace(r"\s+", " ", regex=True).str.strip()
+                found = self._normalized[field].str.contains(keyword_regex, regex=True).to_numpy(dtype=bool)
+                self._hits[key] = found[codes]
+        return self._hits[key]
+
+    def first_match(self, pattern: str, fields: tuple) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        필드를 순서대로 보며 처음 일치한 결과 → (일치 여부, value 그룹 값)
+
+        value 그룹이 없으면 일치한 전체 문자열, 값이 비었으면 ""
+        """
+        key = (pattern, fields)
+        if key not in self._matches:
+            matched = np.zeros(self.rows, dtype=bool)
+            values = np.full(self.rows, "", dtype=object)
+            for field in fields:
+                codes, uniques = self.factorized(field)
+                extracted = uniques.str.extract(self.patterns[pattern], flags=re.IGNORECASE)
+                found = extracted["_match"].notna().to_numpy() & (uniques != "").to_numpy()
+                value = extracted["value"] if "value" in extracted.columns else extracted["_match"]
+                value = value.fillna("").to_numpy(dtype=object)
+                row_found = found[codes] & ~matched
+                values[row_found] = value[codes][row_found]
+                matched |= row_found
+            self._matches[key] = (matched, values)
+        return self._matches[key]
+
+
+class BatchScorer:
+    """채점 규칙으로 인재 DataFrame 전체를 열 단위로 채점"""
+
+    def __init__(self, rules: Optional[Dict] = None):
+        """
+        Args:
+            rules: 채점 규칙 (None이면 data/scoring_rules/insurance_sales.json)
+
+        Raises:
+            ValueError: 규칙 형식이 잘못된 경우 (CandidateScorer와 같은 검사)
+        """
+        self.rules = rules or default_rules()
+        CandidateScorer(self.rules)  # 규칙 검사
+        self.name = self.rules.get("name", "")
+        self.keywords = {
+            group: sorted({normalize_text(k) for k in keywords if normalize_text(k)}, key=len, reverse=True)
+            for group, keywords in self.rules["keywords"].items()
+        }
+        # 일치 여부를 알 수 있도록 전체를 _match 그룹으로 감쌈 (value 그룹은 그대로)
+        self.patterns = {name: f"(?P<_match>{expr})" for name, expr in self.rules.get("patterns", {}).items()}
+        self.fields = sorted({
+            field
+            for criterion in self.rules["criteria"]
+            for component in criterion["components"]
+            for field in component["fields"]
+        })
+
+    # ---------- 채점 ----------
+
+    def score_detail(self, df: pd.DataFrame) -> pd.DataFrame:
+        """항목별 점수 (열: 항목 이름, 행: df와 같은 인덱스)"""
+        texts = _FrameTexts(field_texts(df, self.fields), self.patterns)
+        detail = {}
+        for criterion in self.rules["criteria"]:
+            points = np.zeros(len(df), dtype=np.int64)
+            for component in criterion["components"]:
+                fields = tuple(component["fields"])
+                conditions = [self._tier_mask(texts, fields, tier["when"]) for tier in component["tiers"]]
+                points += np.select(conditions, [tier["points"] for tier in component["tiers"]], default=0).astype(np.int64)
+            if "max" in criterion:
+                points = np.minimum(points, criterion["max"])
+            detail[criterion["name"]] = points
+        return pd.DataFrame(detail, index=df.index)
+
+    def score(self, df: pd.DataFrame, workers: int = 1, chunk_size: int = 50_000) -> pd.Series:
+        """
+        총점 Series
+
+        Args:
+            df: 인재 DataFrame
+            workers: 프로세스 수 (1이면 현재 프로세스에서 계산)
+            chunk_size: 프로세스에 나눠 줄 행 수
+        """
+        if workers <= 1 or len(df) <= chunk_size:
+            return self._total(df)
+        chunks = [df.iloc[start:start + chunk_size] for start in range(0, len(df), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            totals = list(executor.map(_score_chunk, [self.rules] * len(chunks), chunks))
+        return pd.concat(totals)
+
+    def score_frame(self, df: pd.DataFrame, column: str = SCORE_COLUMN, workers: int = 1) -> pd.DataFrame:
+        """점수 열을 추가한 DataFrame (같은 객체 반환)"""
+        df[column] = self.score(df, workers=workers)
+        return df
+
+    def _total(self, df: pd.DataFrame) -> pd.Series:
+        return self.score_detail(df).sum(axis=1).astype(np.int64).rename(SCORE_COLUMN)
+
+    # ---------- 조건 ----------
+
+    def _tier_mask(self, texts: _FrameTexts, fields: tuple, conditions: List[Dict]) -> np.ndarray:
+        mask = np.ones(texts.rows, dtype=bool)
+        for condition in conditions:
+            mask &= self._condition_mask(texts, fields, condition)
+        return mask
+
+    def _condition_mask(self, texts: _FrameTexts, fields: tuple, condition: Dict) -> np.ndarray:
+        if "any" in condition:
+            regex = self._keyword_regex(condition["any"])
+            mask = np.zeros(texts.rows, dtype=bool)
+            for field in fields:
+                mask |= texts.hits(field, regex)
+            return mask
+
+        if "pattern" in condition:
+            matched, values = texts.first_match(condition["pattern"], fields)
+            if "value_gte" in condition:
+                numbers = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=float)
+                return matched & (np.nan_to_num(numbers, nan=-np.inf) >= condition["value_gte"])
+            if "value_match" in condition:
+                expected = re.compile(condition["value_match"], re.IGNORECASE)
+                codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+                found = np.array([bool(expected.search(value)) for value in uniques], dtype=bool)
+                return matched & found[codes] if len(uniques) else matched
+            return matched
+
+        if "nonempty" in condition:
+            mask = np.zeros(texts.rows, dtype=bool)
+            for field in fields:
+                mask |= texts.nonempty(field)
+            return mask == bool(condition["nonempty"])
+
+        raise ValueError(f"알 수 없는 채점 조건: {condition}")
+
+    def _keyword_regex(self, groups: Sequence[str]) -> Optional[str]:
+        """키워드 그룹들 → 정규식 1개 (키워드가 없으면 None)"""
+        keywords = sorted({k for group in groups for k in self.keywords[group]}, key=len, reverse=True)
+        return "|".join(re.escape(k) for k in keywords) if keywords else None
+
+
+def _score_chunk(rules: Dict, chunk: pd.DataFrame) -> pd.Series:
+    """프로세스 작업 단위 (피클 가능한 모듈 함수)"""
+    return BatchScorer(rules)._total(chunk)
+
+
+def rescore_files(
+    paths: Sequence[Union[str, Path]],
+    rules: Optional[Dict] = None,
+    workers: int = 1,
+    output: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    저장된 인재 파일들을 읽어 다시 채점하고 처리 속도(rows/sec) 출력
+
+    Args:
+        paths: 인재 파일 목록 (json/csv/parquet/arrow)
+        rules: 채점 규칙 (None이면 기본 규칙)
+        workers: 프로세스 수
+        output: 결과를 저장할 파일 (.csv, .parquet, .json, None이면 저장 안 함)
+
+    Returns:
+        점수 열을 추가한 DataFrame
+    """
+    started = time.perf_counter()
+    df = pd.concat([load_candidates(path) for path in paths], ignore_index=True) if paths else pd.DataFrame()
+    loaded = time.perf_counter() - started
+
+    scorer = BatchScorer(rules)
+    started = time.perf_counter()
+    scorer.score_frame(df, workers=workers)
+    elapsed = time.perf_counter() - started
+
+    print(f"🧮 {scorer.name}: {len(df):,}행 채점 {elapsed:.2f}초 ({len(df) / elapsed if elapsed else 0:,.0f} rows/sec, "
+          f"프로세스 {max(1, workers)}개, 읽기 {loaded:.2f}초)")
+    if len(df):
+        print(f"   점수 평균 {df[SCORE_COLUMN].mean():.1f}, 최고 {df[SCORE_COLUMN].max()}")
+
+    if output:
+        _save(df, output)
+        print(f"✅ 저장 완료: {output}")
+    return df
+
+
+def _save(df: pd.DataFrame, output: str):
+    suffix = Path(output).suffix.lower()
+    if suffix == ".csv":
+        df.to_csv(output, index=False, encoding="utf-8-sig")
+    elif suffix == ".parquet":
+        try:
+            df.to_parquet(output, index=False)
+        except (TypeError, ValueError) as e:  # 한 열에 딕셔너리 목록과 문자열 목록이 섞인 경우 등 (pyarrow 변환 실패)
+            print(f"⚠️  목록 열을 Parquet 형식으로 바꾸지 못해 JSON 문자열로 저장합니다 ({e})")
+            df.assign(**{
+                column: df[column].map(_json_text) for column in df.columns if df[column].map(item_list).notna().any()
+            }).to_parquet(output, index=False)
+    elif suffix == ".json":
+        df.to_json(output, orient="records", force_ascii=False, indent=2)
+    else:
+        raise ValueError(f"지원하지 않는 저장 형식: {output} (csv, parquet, json)")
+
+
+def _json_text(value):
+    """목록 값 → JSON 문자열 (목록이 아니면 그대로)"""
+    items = item_list(value)
+    if items is None:
+        return value
+    return json.dumps(items, ensure_ascii=False, default=str)
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+
+    from src.scoring_rules import RuleSetRegistry
+
+    arg_parser = argparse.ArgumentParser(description="저장된 인재 파일 전체 재채점")
+    arg_parser.add_argument("paths", nargs="+", help="*_summary.json, .csv, .parquet, .arrow")
+    arg_parser.add_argument("--rules", default=None, help="규칙 이름 (data/scoring_rules/<이름>.json 또는 엑셀 채점규칙 시트)")
+    arg_parser.add_argument("--excel", default=None, help="채점규칙 시트를 읽을 엑셀 파일")
+    arg_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    arg_parser.add_argument("--output", default=None, help="결과 파일 (.csv, .parquet, .json)")
+    args = arg_parser.parse_args()
+
+    registry = RuleSetRegistry(excel_path=args.excel)
+    rescore_files(args.paths, registry.get(args.rules).rules, workers=args.workers, output=args.output)
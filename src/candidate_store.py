@@ -0,0 +1,195 @@
+"""
+인재 변경 감지 저장소 (SQLite)
+
+계정별로 이력서번호(rno) → 마지막으로 본 지문(제목, 최근활동, 경력, 기술스택)을 저장하고
+새로 나타났거나 내용이 바뀐 인재만 골라냅니다. 같은 검색을 몇 분마다 반복 실행할 때 사용합니다.
+확인(filter_changed)과 기록(commit)은 나뉘어 있어, 결과 파일을 저장한 뒤에만 지문이 기록됩니다.
+
+최근활동은 "10분전 이력서 수정"처럼 상대 시간이라 실행할 때마다 글자가 바뀌므로
+활동 종류(시간 제거)는 지문에 넣고, 활동 시각은 절대 시각으로 환산해 따로 비교합니다.
+"""
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.parser import PersonDataParser
+
+RNO_FIELD = "이력서번호"
+ACTIVITY_FIELD = "최근활동"
+
+
+class CandidateStore:
+    """계정별 이력서번호 → 마지막 지문 저장소 (스레드 안전)"""
+
+    FINGERPRINT_FIELDS = ("제목", "경력", "기술스택")
+    ACTIVITY_TIME_PATTERN = re.compile(r"\d+\s*(시간|분)\s*")
+
+    def __init__(self, path: str = "output/candidates.sqlite3"):
+        """
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # 계정 → {이력서번호: (지문, 활동 시각, 바뀜 여부)} (commit 전까지 보관)
+        self._pending: Dict[str, Dict[str, Tuple[str, Optional[float], bool]]] = {}
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS candidates ("
+            " account TEXT NOT NULL,"
+            " rno TEXT NOT NULL,"
+            " fingerprint TEXT NOT NULL,"
+            " activity_at REAL,"
+            " first_seen REAL NOT NULL,"
+            " last_seen REAL NOT NULL,"
+            " last_changed REAL NOT NULL,"
+            " PRIMARY KEY (account, rno))"
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> "CandidateStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+
+    @classmethod
+    def fingerprint(cls, person: Dict[str, str]) -> str:
+        """제목/경력/기술스택 + 활동 종류로 만든 지문"""
+        activity_kinds = cls.ACTIVITY_TIME_PATTERN.sub("", person.get(ACTIVITY_FIELD, "")).replace("전", "")
+        parts = [str(person.get(name, "")) for name in cls.FINGERPRINT_FIELDS] + [activity_kinds]
+        return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def activity_time(person: Dict[str, str], now: float) -> Tuple[Optional[float], float]:
+        """
+        가장 최근 활동의 절대 시각과 표시 단위(초)
+
+        "10분전"은 1분, "2시간전"은 1시간 단위로 표시되므로 그만큼의 오차는 같은 활동으로 봅니다.
+        """
+        latest = None
+        for text in person.get(ACTIVITY_FIELD, "").split(", "):
+            minutes = PersonDataParser._parse_activity_minutes(text)
+            if minutes is not None and (latest is None or minutes < latest):
+                latest = minutes
+
+        if latest is None:
+            return None, 0.0
+        resolution = 3600.0 if latest >= 60 else 60.0
+        return now - latest * 60, resolution
+
+    def filter_changed(self, people: List[Dict[str, str]], account: str = "") -> Tuple[List[Dict[str, str]], int]:
+        """
+        새로 나타났거나 바뀐 인재만 반환 (저장소에는 아직 기록하지 않음)
+
+        확인한 지문은 계정별로 보관해 두었다가 commit(account)을 호출할 때 저장소에 기록합니다.
+        결과 파일을 저장한 뒤에 commit해야, 저장 전에 중단되어도 다음 실행에서 같은 인재를 다시 수집합니다.
+        같은 실행 안에서 이미 확인한 인재는 보관 중인 지문과 비교합니다.
+
+        Args:
+            people: 인재 리스트 (이력서번호가 없으면 항상 반환)
+            account: 계정(시트명), 계정별로 따로 기록
+
+        Returns:
+            (새로 나타났거나 바뀐 인재 리스트, 변경 없어 제외한 인원)
+        """
+        now = time.time()
+        changed = []
+        unchanged = 0
+
+        with self._lock:
+            pending = self._pending.setdefault(account, {})
+            for person in people:
+                rno = person.get(RNO_FIELD)
+                if not rno:
+                    changed.append(person)
+                    continue
+
+                fingerprint = self.fingerprint(person)
+                activity_at, resolution = self.activity_time(person, now)
+                if rno in pending:
+                    stored = pending[rno][:2]
+                else:
+                    stored = self._conn.execute(
+                        "SELECT fingerprint, activity_at FROM candidates WHERE account = ? AND rno = ?",
+                        (account, rno)
+                    ).fetchone()
+
+                if stored is None or stored[0] != fingerprint or self._is_newer_activity(activity_at, stored[1], resolution):
+                    pending[rno] = (fingerprint, activity_at, True)
+                    changed.append(person)
+                else:
+                    pending[rno] = (stored[0], stored[1], pending.get(rno, (None, None, False))[2])
+                    unchanged += 1
+
+        return changed, unchanged
+
+    def commit(self, account: str = "") -> int:
+        """
+        filter_changed로 확인한 계정의 지문을 저장소에 기록 (결과 파일을 저장한 뒤 호출)
+
+        Returns:
+            기록한 인원
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            pending = self._pending.pop(account, {})
+            for rno, (fingerprint, activity_at, changed) in pending.items():
+                if changed:
+                    self._conn.execute(
+                        "INSERT INTO candidates VALUES (?, ?, ?, ?, ?, ?, ?)"
+                        " ON CONFLICT(account, rno) DO UPDATE SET"
+                        " fingerprint = excluded.fingerprint, activity_at = excluded.activity_at,"
+                        " last_seen = excluded.last_seen, last_changed = excluded.last_changed",
+                        (account, rno, fingerprint, activity_at, now, now, now)
+                    )
+                else:
+                    self._conn.execute(
+                        "UPDATE candidates SET last_seen = ? WHERE account = ? AND rno = ?",
+                        (now, account, rno)
+                    )
+        return len(pending)
+
+    def stage(self, people: List[Dict[str, str]], account: str = ""):
+        """
+        이미 결과에 들어간 인재를 바뀐 것으로 보관 (체크포인트에서 복원한 페이지용, commit 때 기록)
+
+        복원한 페이지는 filter_changed를 다시 거치지 않으므로, 보관하지 않으면 commit에서 빠져
+        다음 실행에서 같은 인재가 다시 새 인재로 수집됩니다.
+        """
+        now = time.time()
+        with self._lock:
+            pending = self._pending.setdefault(account, {})
+            for person in people:
+                rno = person.get(RNO_FIELD)
+                if rno:
+                    activity_at, _ = self.activity_time(person, now)
+                    pending[rno] = (self.fingerprint(person), activity_at, True)
+
+    def discard(self, account: str = ""):
+        """기록하지 않은 계정의 지문 버리기 (저장에 실패했거나 새 수집을 시작할 때)"""
+        with self._lock:
+            self._pending.pop(account, None)
+
+    @staticmethod
+    def _is_newer_activity(activity_at: Optional[float], stored_at: Optional[float], resolution: float) -> bool:
+        """저장된 활동보다 표시 단위 이상 최근의 활동인지"""
+        if activity_at is None:
+            return False
+        if stored_at is None:
+            return True
+        return activity_at - stored_at > resolution
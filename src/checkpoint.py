@@ -0,0 +1,175 @@
+"""
+수집 체크포인트 (재시작 지원)
+
+(계정, 검색 조건)별 append-only JSONL 저널에 페이지 단위로 saveNo, 페이지 번호, 수집한 인재를 기록합니다.
+실행이 중간에 끊겨도 resume=True로 다시 실행하면 마지막으로 완료한 페이지 다음부터 이어서 수집합니다.
+
+저널 형식 (한 줄에 레코드 1개):
+    {"type": "page", "page": 3, "saveno": 715204386, "saved_at": 1760000000.0, "next_index": 301, "records": [...]}
+    {"type": "failed", "page": 4, "error": "HTTP 503"}
+    {"type": "done", "end_page": 10}
+
+재시도 후에도 실패한 페이지는 "failed"로 기록해 두고, 이어서 수집할 때 먼저 다시 요청합니다.
+시작 페이지는 저널 파일 키에 포함하고, 끝 페이지는 "done"에 기록해 두었다가 이어서 수집할 때
+더 뒤 페이지까지 요청하면 완료로 보지 않고 이어서 수집합니다.
+saveNo는 마지막 기록 후 saveno_ttl초가 지나면 만료된 것으로 보고 새 검색 세션으로 시작합니다.
+"""
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+@dataclass
+class CheckpointState:
+    """저널에서 복원한 진행 상태"""
+    saveno: int = 0
+    last_page: Optional[int] = None
+    next_index: int = 1
+    pages: List[Dict] = field(default_factory=list)  # [{"page", "records"}, ...] 완료 순서대로
+    failed_pages: List[int] = field(default_factory=list)  # 실패한 뒤 아직 수집하지 못한 페이지
+    done: bool = False
+    done_end_page: Optional[int] = None  # 완료 당시 끝 페이지 (None이면 결과 끝까지 수집)
+    saveno_at: Optional[float] = None  # saveno를 마지막으로 기록한 시각 (없으면 알 수 없음)
+    saveno_expired: bool = False  # 저장된 saveno가 만료되어 버렸는지
+
+    @property
+    def people(self) -> List[Dict[str, str]]:
+        return [person for entry in self.pages for person in entry["records"]]
+
+
+class ScrapeCheckpoint:
+    """(계정, 검색 조건)별 수집 저널"""
+
+    def __init__(self, path: str, saveno_ttl: Optional[float] = None):
+        """
+        Args:
+            path: 저널 파일 경로
+            saveno_ttl: 저장된 saveNo를 다시 쓸 수 있는 시간(초), None이면 만료 없음
+        """
+        self.path = Path(path)
+        self.saveno_ttl = saveno_ttl
+
+    @classmethod
+    def for_search(
+        cls,
+        checkpoint_dir: str,
+        account: str,
+        saveno_ttl: Optional[float] = None,
+        **search_key
+    ) -> "ScrapeCheckpoint":
+        """
+        계정과 검색 조건으로 저널 파일 결정
+
+        Args:
+            checkpoint_dir: 저널 디렉토리
+            account: 계정(시트명)
+            saveno_ttl: 저장된 saveNo를 다시 쓸 수 있는 시간(초), None이면 만료 없음
+            **search_key: 검색 조건 (job_name, areas, page_size, start_page 등 결과에 영향을 주는 값)
+        """
+        key = json.dumps(search_key, ensure_ascii=False, sort_keys=True, default=str)
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
+        safe_account = account.replace('@', '_').replace('.', '_')
+        return cls(Path(checkpoint_dir) / f"{safe_account}_{digest}.jsonl", saveno_ttl=saveno_ttl)
+
+    def load(self, end_page: Optional[int] = None) -> CheckpointState:
+        """
+        저널에서 진행 상태 복원
+
+        기록 도중 끊겨 손상된 줄은 무시합니다.
+
+        Args:
+            end_page: 이번 실행의 끝 페이지 (None이면 결과 끝까지).
+                완료 당시보다 뒤 페이지까지 요청하면 done을 False로 돌려 이어서 수집합니다.
+        """
+        state = CheckpointState()
+        if not self.path.exists():
+            return state
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+
+                if entry.get("type") == "page":
+                    page = entry["page"]
+                    if entry.get("saveno"):
+                        state.saveno = entry["saveno"]
+                        state.saveno_at = entry.get("saved_at")
+                    # 실패했다가 나중에 수집한 페이지는 마지막 페이지보다 앞일 수 있음
+                    state.last_page = page if state.last_page is None else max(state.last_page, page)
+                    state.next_index = entry.get("next_index", state.next_index)
+                    state.pages.append({"page": page, "records": entry.get("records", [])})
+                    if page in state.failed_pages:
+                        state.failed_pages.remove(page)
+                    state.done = False
+                elif entry.get("type") == "failed":
+                    if entry["page"] not in state.failed_pages:
+                        state.failed_pages.append(entry["page"])
+                elif entry.get("type") == "done":
+                    state.done = True
+                    state.done_end_page = entry.get("end_page")
+
+        if state.done and not self._covers(state.done_end_page, end_page):
+            state.done = False
+        if state.saveno and self._saveno_expired(state.saveno_at):
+            state.saveno = 0  # 첫 요청에서 새 saveNo를 받음
+            state.saveno_expired = True
+        return state
+
+    @staticmethod
+    def _covers(done_end_page: Optional[int], end_page: Optional[int]) -> bool:
+        """완료 당시 범위가 이번 실행의 범위를 포함하는지"""
+        if done_end_page is None:
+            return True  # 결과 끝까지 수집했음
+        return end_page is not None and end_page <= done_end_page
+
+    def _saveno_expired(self, saved_at: Optional[float]) -> bool:
+        if self.saveno_ttl is None:
+            return False
+        # 시각이 없는 이전 형식의 기록은 만료된 것으로 봄
+        return saved_at is None or time.time() - saved_at > self.saveno_ttl
+
+    def reset(self):
+        """저널 삭제 (처음부터 다시 수집)"""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def record_page(self, page: int, saveno: int, next_index: int, records: List[Dict[str, str]]):
+        """완료한 페이지 기록"""
+        self._append({
+            "type": "page",
+            "page": page,
+            "saveno": saveno,
+            "saved_at": time.time(),
+            "next_index": next_index,
+            "records": records,
+        })
+
+    def record_failed(self, page: int, error: str = ""):
+        """재시도 후에도 실패한 페이지 기록 (이어서 수집할 때 다시 요청)"""
+        self._append({"type": "failed", "page": page, "error": error})
+
+    def mark_done(self, end_page: Optional[int] = None):
+        """수집 완료 표시 (end_page: 이번 실행의 끝 페이지, None이면 결과 끝까지 수집)"""
+        self._append({"type": "done", "end_page": end_page})
+
+    def _append(self, entry: Dict):
+        """한 줄 추가 후 디스크에 반영 (중간에 종료되어도 앞선 기록은 보존)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a+b") as f:
+            # 이전 실행이 줄 중간에서 끊겼으면 새 줄에서 시작
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write((json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
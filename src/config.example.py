@@ -5,6 +5,7 @@ class JobKoreaConfig:
     """잡코리아 API 설정"""
     API_URL = "https://www.jobkorea.co.kr/corp/person/detailsearchajax"
     BASE_URL = "https://www.jobkorea.co.kr"
+    LOGIN_URL = "https://www.jobkorea.co.kr/Login/Login.asp"
 
     # ==================== 인증 방법 선택 ====================
     # 방법 1: 자동 로그인 (권장)
@@ -17,6 +18,50 @@ class JobKoreaConfig:
     COOKIE_STR = "JSESSIONID=...; JKUID=...; ..."
     # ======================================================
 
+    # 로그인 세션 캐시 (자동 로그인 쿠키를 계정별로 저장해 두고 만료 전까지 재사용)
+    SESSION_CACHE_DIR = ".session_cache"  # None이면 매번 로그인
+    SESSION_CACHE_TTL = 6 * 60 * 60  # 쿠키에 만료 정보가 없을 때 최대 재사용 시간(초)
+
+    # 수집 체크포인트 (resume=True로 이어서 수집할 때 저장된 saveNo를 다시 쓸 수 있는 시간(초), None이면 만료 없음)
+    CHECKPOINT_SAVENO_TTL = 30 * 60
+
+    # 요청 속도 제한 (토큰 버킷, 검색/로그인/이력서 추출 요청이 모두 공유)
+    RATE_LIMIT_HOST_RATE = 4.0      # 호스트별 초당 요청 수 (모든 계정 합산)
+    RATE_LIMIT_HOST_BURST = 8       # 호스트별 연속 요청 허용 수
+    RATE_LIMIT_ACCOUNT_RATE = 1.0   # 계정별 초당 요청 수
+    RATE_LIMIT_ACCOUNT_BURST = 3    # 계정별 연속 요청 허용 수
+    RATE_LIMIT_SHARED_DIR = ".rate_limit"  # 여러 프로세스가 한도를 공유할 디렉토리 (None이면 프로세스 안에서만)
+
+    # 검색 요청 제한 시간 / 재시도 (연결 실패, 타임아웃, 429/5xx는 지수 백오프로 재시도)
+    REQUEST_CONNECT_TIMEOUT = 5.0   # 연결 제한 시간(초)
+    REQUEST_READ_TIMEOUT = 30.0     # 응답 대기 제한 시간(초)
+    RETRY_MAX_ATTEMPTS = 4          # 최대 시도 횟수 (첫 요청 포함)
+    RETRY_BASE_DELAY = 1.0          # 첫 재시도 대기 시간 상한(초), 시도할 때마다 2배
+    RETRY_MAX_DELAY = 30.0          # 재시도 대기 시간 상한(초)
+    CIRCUIT_FAILURE_THRESHOLD = 5   # 계정별로 재시도 후에도 실패한 페이지가 연속으로 이만큼 쌓이면 요청 중단
+                                    # (시도 횟수가 아니라 페이지 단위로 셈, 한 페이지의 재시도는 1회 실패로 기록)
+    CIRCUIT_RESET_TIMEOUT = 60.0    # 요청 중단 후 다시 시험 요청하기까지의 시간(초)
+
+    # HTTP 연결 (프로세스 안의 모든 계정/로그인 세션이 연결 풀 1개를 공유)
+    HTTP_POOL_CONNECTIONS = 10      # 연결 풀을 유지할 호스트 수
+    HTTP_POOL_MAXSIZE = 32          # 호스트당 유지할 연결 수 (동시에 실행하는 계정/요청 수 이상)
+    HTTP2_ENABLED = False           # True면 HTTP/2 사용 (httpx[http2] 필요, 없으면 HTTP/1.1)
+    RECORD_SESSION_PATH = None      # 경로를 지정하면 요청/응답을 녹화 (쿠키/비밀번호 제외, src/replay.py로 재생)
+
+    # 브라우저 리소스 차단 (이미지/폰트와 허용 도메인 밖의 광고/분석 스크립트는 받지 않음)
+    # block_types: Playwright resource_type (image, media, font, stylesheet, script 등)
+    # allowed_domains: 이 도메인(하위 도메인 포함)만 요청 허용, None이면 도메인으로 거르지 않음
+    RESOURCE_BLOCKING = {
+        "resume": {  # extract_with_real_chrome.py 이력서 추출
+            "block_types": ["image", "media", "font"],
+            "allowed_domains": ["jobkorea.co.kr", "jobkorea.kr"],
+        },
+        "setup_2fa": {  # setup_2fa.py (로그인 화면이 보여야 하므로 이미지는 유지)
+            "block_types": ["media", "font"],
+            "allowed_domains": None,
+        },
+    }
+
     HEADERS = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X) AppleWebKit/537.36 "
                       "(KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36",
@@ -25,3 +70,14 @@ class JobKoreaConfig:
         "Referer": "https://www.jobkorea.co.kr/corp/person/find",
         "X-Requested-With": "XMLHttpRequest",
     }
+
+    def __init__(self, username: str = None, password: str = None):
+        """
+        Args:
+            username: 잡코리아 아이디 (None이면 USERNAME 사용)
+            password: 잡코리아 비밀번호 (None이면 PASSWORD 사용)
+        """
+        if username:
+            self.USERNAME = username
+        if password:
+            self.PASSWORD = password
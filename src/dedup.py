@@ -0,0 +1,161 @@
+"""
+인재 중복 제거 인덱스
+
+이력서번호(rno) 기준으로 이미 수집한 인재를 기억하여 페이지/계정 간 중복을 제거합니다.
+여러 계정을 병렬로 실행할 때 인덱스 1개를 모든 스크래퍼가 공유합니다. (스레드 안전)
+
+- 정확 모드 (기본): rno별로 처음 발견한 계정/페이지를 기억
+- Bloom 필터 모드: bloom_capacity를 지정하면 메모리 사용량이 고정됨
+  (처음 발견 위치는 기억하지 않으며, error_rate 확률로 새 인재를 중복으로 판단할 수 있음)
+"""
+import hashlib
+import math
+import threading
+from typing import Dict, List, Optional, Tuple
+
+RNO_FIELD = "이력서번호"
+
+
+class BloomFilter:
+    """고정 크기 Bloom 필터 (이중 해싱)"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: 예상 원소 수
+            error_rate: 목표 오탐률
+        """
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def add(self, key: str) -> bool:
+        """원소 추가 (이미 있던 것으로 판단되면 False)"""
+        added = False
+        for pos in self._positions(key):
+            mask = 1 << (pos & 7)
+            if not self.bits[pos >> 3] & mask:
+                self.bits[pos >> 3] |= mask
+                added = True
+        return added
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.bits)
+
+
+class DedupIndex:
+    """이력서번호(rno) 기준 중복 제거 인덱스 (계정 간 공유, 스레드 안전)"""
+
+    def __init__(self, bloom_capacity: Optional[int] = None, error_rate: float = 0.001):
+        """
+        Args:
+            bloom_capacity: 지정하면 이 크기의 Bloom 필터 사용 (대규모 실행용, None이면 정확 모드)
+            error_rate: Bloom 필터 오탐률
+        """
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter(bloom_capacity, error_rate) if bloom_capacity else None
+        self._first_seen: Dict[str, Tuple[str, Optional[int]]] = {}
+        self.unique_count = 0
+        self.duplicate_count = 0
+        self.duplicates_by_account: Dict[str, int] = {}
+
+    def __contains__(self, rno: str) -> bool:
+        """이미 수집한 rno인지 확인 (집계하지 않음)"""
+        if not rno:
+            return False
+        with self._lock:
+            return self._contains(rno)
+
+    def seen(self, rno: str, account: str = "") -> bool:
+        """
+        이미 수집한 rno인지 확인하고, 그렇다면 account의 중복으로 집계 (파싱 전 카드 건너뛰기용)
+
+        parse_page의 skip_rno로 넘기면 파서에서 건너뛴 카드도 duplicate_count/stats()에 포함됩니다.
+        """
+        if not rno:
+            return False
+        with self._lock:
+            if not self._contains(rno):
+                return False
+            self._count_duplicates(account, 1)
+            return True
+
+    def _contains(self, rno: str) -> bool:
+        """lock 안에서 호출"""
+        if self._bloom is not None:
+            return rno in self._bloom
+        return rno in self._first_seen
+
+    def _count_duplicates(self, account: str, count: int):
+        """lock 안에서 호출"""
+        self.duplicate_count += count
+        self.duplicates_by_account[account] = self.duplicates_by_account.get(account, 0) + count
+
+    def first_seen(self, rno: str) -> Optional[Tuple[str, Optional[int]]]:
+        """처음 발견한 (계정, 페이지) (Bloom 필터 모드에서는 항상 None)"""
+        with self._lock:
+            return self._first_seen.get(rno)
+
+    def _add(self, rno: str, account: str, page: Optional[int]) -> bool:
+        """rno 등록 (lock 안에서 호출, 새로 등록했으면 True)"""
+        if self._bloom is not None:
+            return self._bloom.add(rno)
+        if rno in self._first_seen:
+            return False
+        self._first_seen[rno] = (account, page)
+        return True
+
+    def add_new(self, people: List[Dict[str, str]], account: str = "", page: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        처음 보는 인재만 등록하여 반환 (이력서번호가 없으면 그대로 유지)
+
+        Args:
+            people: 인재 리스트
+            account: 계정(시트명)
+            page: 페이지 번호
+        """
+        new_people = []
+        duplicates = 0
+        with self._lock:
+            for person in people:
+                rno = person.get(RNO_FIELD)
+                if not rno or self._add(rno, account, page):
+                    new_people.append(person)
+                else:
+                    duplicates += 1
+
+            self.unique_count += len(new_people)
+            if duplicates:
+                self._count_duplicates(account, duplicates)
+
+        return new_people
+
+    def register(self, people: List[Dict[str, str]], account: str = "", page: Optional[int] = None):
+        """이미 저장된 인재 등록 (체크포인트 복원 시, 중복 집계 안 함)"""
+        with self._lock:
+            for person in people:
+                rno = person.get(RNO_FIELD)
+                if rno and self._add(rno, account, page):
+                    self.unique_count += 1
+
+    def stats(self) -> Dict:
+        """중복 제거 통계"""
+        with self._lock:
+            return {
+                "mode": "bloom" if self._bloom is not None else "exact",
+                "unique": self.unique_count,
+                "duplicates": self.duplicate_count,
+                "duplicates_by_account": dict(self.duplicates_by_account),
+                "bloom_bytes": self._bloom.memory_bytes if self._bloom is not None else None,
+            }
@@ -1,23 +1,39 @@
 """데이터 내보내기"""
-from typing import List, Dict
+import csv
+import json
+from typing import List, Dict, Optional
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment
 
+from src.scoring import SCORE_COLUMN
+
 
 class ExcelExporter:
     """엑셀 파일 저장"""
 
     COLUMNS = ["번호", "이름", "성별", "나이", "제목", "경력", "학력", "지역", "직무", "기술스택", "이력서번호", "이력서링크", "최근활동"]
+    SCORED_COLUMNS = COLUMNS + [SCORE_COLUMN]  # 채점(CandidateScorer) 사용 시
     COLUMN_WIDTHS = {
         'A': 8, 'B': 12, 'C': 8, 'D': 15, 'E': 40, 'F': 12,
-        'G': 30, 'H': 20, 'I': 30, 'J': 50, 'K': 15, 'L': 60, 'M': 40
+        'G': 30, 'H': 20, 'I': 30, 'J': 50, 'K': 15, 'L': 60, 'M': 40, 'N': 8
     }
+    SHEET_TITLE = "백엔드개발자"
+    HEADER_FONT = Font(bold=True)
+    HEADER_ALIGNMENT = Alignment(horizontal='center')
+
+    def __init__(self, columns: Optional[List[str]] = None):
+        """
+        Args:
+            columns: 저장할 열 (None이면 COLUMNS, 점수까지 저장하려면 SCORED_COLUMNS)
+        """
+        self.columns = list(columns or self.COLUMNS)
 
     def save(self, people: List[Dict[str, str]], filename: str = "백엔드개발자_검색결과.xlsx"):
         """데이터를 엑셀 파일로 저장"""
         wb = openpyxl.Workbook()
         ws = wb.active
-        ws.title = "백엔드개발자"
+        ws.title = self.SHEET_TITLE
 
         self._write_headers(ws)
         self._write_data(ws, people)
@@ -28,18 +44,300 @@ class ExcelExporter:
 
     def _write_headers(self, ws):
         """헤더 작성 및 스타일 적용"""
-        ws.append(self.COLUMNS)
+        ws.append(self.columns)
         for cell in ws[1]:
-            cell.font = Font(bold=True)
-            cell.alignment = Alignment(horizontal='center')
+            cell.font = self.HEADER_FONT
+            cell.alignment = self.HEADER_ALIGNMENT
 
     def _write_data(self, ws, people: List[Dict[str, str]]):
         """데이터 작성"""
         for person in people:
-            row = [person.get(col, "") for col in self.COLUMNS]
+            row = [person.get(col, "") for col in self.columns]
             ws.append(row)
 
     def _adjust_columns(self, ws):
         """열 너비 조정"""
         for col, width in self.COLUMN_WIDTHS.items():
             ws.column_dimensions[col].width = width
+
+
+class StreamingExcelExporter(ExcelExporter):
+    """
+    엑셀 파일 스트리밍 저장 (openpyxl write-only 모드)
+
+    페이지 단위로 write()를 호출하면 행이 바로 임시 파일로 기록되므로
+    전체 인원 수와 관계없이 메모리 사용량이 일정합니다.
+    첫 write() 때 파일을 열고, 한 번도 기록하지 않으면 파일을 만들지 않습니다.
+    """
+
+    def __init__(self, filename: str = "백엔드개발자_검색결과.xlsx", columns: Optional[List[str]] = None):
+        super().__init__(columns)
+        self.filename = filename
+        self.count = 0
+        self._wb = None
+        self._ws = None
+
+    def __enter__(self) -> "StreamingExcelExporter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _open(self):
+        """write-only 워크북 생성 (열 너비와 헤더는 행보다 먼저 기록해야 함)"""
+        self._wb = openpyxl.Workbook(write_only=True)
+        self._ws = self._wb.create_sheet(self.SHEET_TITLE)
+        self._adjust_columns(self._ws)
+
+        header = []
+        for col in self.columns:
+            cell = WriteOnlyCell(self._ws, value=col)
+            cell.font = self.HEADER_FONT
+            cell.alignment = self.HEADER_ALIGNMENT
+            header.append(cell)
+        self._ws.append(header)
+
+    def write(self, people: List[Dict[str, str]]):
+        """인재 리스트(페이지 1개 분량) 추가"""
+        if not people:
+            return
+        if self._wb is None:
+            self._open()
+        for person in people:
+            self._ws.append([person.get(col, "") for col in self.columns])
+        self.count += len(people)
+
+    def close(self):
+        """파일 저장 (기록한 행이 없으면 아무것도 하지 않음)"""
+        if self._wb is None:
+            return
+        self._wb.save(self.filename)
+        self._wb = None
+        self._ws = None
+        print(f"✅ 엑셀 파일 저장 완료: {self.filename} ({self.count}행)")
+
+
+class StreamingJsonExporter:
+    """
+    JSON 배열 스트리밍 저장
+
+    json.dump(people, f, ensure_ascii=False, indent=2)와 같은 형식을 레코드 단위로 기록합니다.
+    첫 write() 때 파일을 열고, 한 번도 기록하지 않으면 파일을 만들지 않습니다.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.count = 0
+        self._file = None
+
+    def __enter__(self) -> "StreamingJsonExporter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, people: List[Dict[str, str]]):
+        """인재 리스트(페이지 1개 분량) 추가"""
+        if not people:
+            return
+        if self._file is None:
+            self._file = open(self.filename, "w", encoding="utf-8")
+            self._file.write("[")
+
+        for person in people:
+            text = json.dumps(person, ensure_ascii=False, indent=2)
+            self._file.write(",\n  " if self.count else "\n  ")
+            self._file.write(text.replace("\n", "\n  "))
+            self.count += 1
+        self._file.flush()
+
+    def close(self):
+        """배열을 닫고 파일 저장"""
+        if self._file is None:
+            return
+        self._file.write("\n]")
+        self._file.close()
+        self._file = None
+
+
+class CsvExporter:
+    """
+    CSV 파일 저장 (ExcelExporter.COLUMNS 순서, 채점 시 점수 열 추가, UTF-8 BOM)
+
+    BOM을 붙여 엑셀에서 바로 열어도 한글이 깨지지 않고, pandas/DuckDB 등에서도 그대로 읽을 수 있습니다.
+    write()로 페이지 단위 기록, save()로 한 번에 기록할 수 있습니다.
+    """
+
+    EXTENSION = "csv"
+    COLUMNS = ExcelExporter.COLUMNS
+
+    def __init__(self, filename: str, columns: Optional[List[str]] = None):
+        self.filename = filename
+        self.columns = list(columns or self.COLUMNS)
+        self.count = 0
+        self._file = None
+        self._writer = None
+
+    def __enter__(self) -> "CsvExporter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def save(self, people: List[Dict[str, str]]):
+        """데이터를 한 번에 저장"""
+        self.write(people)
+        self.close()
+
+    def write(self, people: List[Dict[str, str]]):
+        """인재 리스트(페이지 1개 분량) 추가"""
+        if not people:
+            return
+        if self._file is None:
+            self._file = open(self.filename, "w", encoding="utf-8-sig", newline="")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(self.columns)
+
+        self._writer.writerows([person.get(col, "") for col in self.columns] for person in people)
+        self.count += len(people)
+
+    def close(self):
+        """파일 닫기 (기록한 행이 없으면 아무것도 하지 않음)"""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        self._writer = None
+        print(f"✅ CSV 파일 저장 완료: {self.filename} ({self.count}행)")
+
+
+class ArrowExporter:
+    """
+    Arrow IPC 파일 저장 (pyarrow 필요)
+
+    스키마는 ExcelExporter.COLUMNS(채점 시 SCORED_COLUMNS) 기준으로 고정합니다. (번호/점수: int64, 나머지: string)
+    행은 batch_size개씩 모아 RecordBatch 단위로 기록하므로 대량 데이터도 메모리 사용량이 일정합니다.
+    """
+
+    EXTENSION = "arrow"
+    COLUMNS = ExcelExporter.COLUMNS
+    INT_COLUMNS = {"번호", SCORE_COLUMN}
+
+    def __init__(self, filename: str, batch_size: int = 65536, columns: Optional[List[str]] = None):
+        import pyarrow
+
+        self._pa = pyarrow
+        self.filename = filename
+        self.batch_size = max(1, batch_size)
+        self.columns = list(columns or self.COLUMNS)
+        self.count = 0
+        self.schema = pyarrow.schema([
+            (col, pyarrow.int64() if col in self.INT_COLUMNS else pyarrow.string())
+            for col in self.columns
+        ])
+        self._writer = None
+        self._buffer = self._empty_buffer()
+        self._buffered = 0
+
+    def __enter__(self) -> "ArrowExporter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def save(self, people: List[Dict[str, str]]):
+        """데이터를 한 번에 저장"""
+        self.write(people)
+        self.close()
+
+    def _empty_buffer(self) -> Dict[str, list]:
+        return {col: [] for col in self.columns}
+
+    def _open_writer(self):
+        """파일 포맷별 writer 생성"""
+        return self._pa.ipc.new_file(self.filename, self.schema)
+
+    def _write_batch(self, batch):
+        self._writer.write_batch(batch)
+
+    def write(self, people: List[Dict[str, str]]):
+        """인재 리스트(페이지 1개 분량) 추가 (batch_size만큼 모이면 기록)"""
+        for person in people:
+            for col, values in self._buffer.items():
+                value = person.get(col)
+                if value is None or value == "":
+                    values.append(None)
+                elif col in self.INT_COLUMNS:
+                    values.append(int(value))
+                else:
+                    values.append(str(value))
+        self._buffered += len(people)
+        self.count += len(people)
+
+        if self._buffered >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        """버퍼에 모인 행을 RecordBatch로 기록"""
+        if not self._buffered:
+            return
+        if self._writer is None:
+            self._writer = self._open_writer()
+
+        batch = self._pa.RecordBatch.from_pydict(self._buffer, schema=self.schema)
+        self._write_batch(batch)
+        self._buffer = self._empty_buffer()
+        self._buffered = 0
+
+    def close(self):
+        """남은 행을 기록하고 파일 닫기 (기록한 행이 없으면 아무것도 하지 않음)"""
+        self._flush()
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._writer = None
+        print(f"✅ {self.EXTENSION.upper()} 파일 저장 완료: {self.filename} ({self.count}행)")
+
+
+class ParquetExporter(ArrowExporter):
+    """
+    Parquet 파일 저장 (pyarrow 필요)
+
+    ArrowExporter와 같은 스키마를 사용하며, batch_size개 단위로 row group을 기록합니다.
+    """
+
+    EXTENSION = "parquet"
+
+    def __init__(self, filename: str, batch_size: int = 65536, compression: str = "zstd", columns: Optional[List[str]] = None):
+        import pyarrow.parquet
+
+        super().__init__(filename, batch_size=batch_size, columns=columns)
+        self._pq = pyarrow.parquet
+        self.compression = compression
+
+    def _open_writer(self):
+        return self._pq.ParquetWriter(self.filename, self.schema, compression=self.compression)
+
+    def _write_batch(self, batch):
+        self._writer.write_batch(batch, row_group_size=self.batch_size)
+
+
+EXPORTERS = {
+    "csv": CsvExporter,
+    "parquet": ParquetExporter,
+    "arrow": ArrowExporter,
+}
+
+
+def get_exporter(fmt: str, filename: str, columns: Optional[List[str]] = None):
+    """
+    파일 포맷별 exporter 생성
+
+    Args:
+        fmt: "csv", "parquet" 또는 "arrow"
+        filename: 저장할 파일 경로
+        columns: 저장할 열 (None이면 ExcelExporter.COLUMNS)
+    """
+    if fmt not in EXPORTERS:
+        raise ValueError(f"지원하지 않는 저장 포맷: {fmt} (사용 가능: {', '.join(EXPORTERS)})")
+    return EXPORTERS[fmt](filename, columns=columns)
@@ -0,0 +1,146 @@
+"""실행 통계 집계"""
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class RunSummary:
+    """다중 계정 실행 결과 통계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.perf_counter()
+        self.finished_at: Optional[float] = None
+        self.accounts: List[Dict] = []
+
+    def add_account(self, sheet_name: str, success: bool, pages: int = 0, people: int = 0,
+                    elapsed: float = 0.0, error: Optional[str] = None, duplicates: int = 0):
+        """계정 1개 실행 결과 기록"""
+        with self._lock:
+            self.accounts.append({
+                "sheet_name": sheet_name,
+                "success": success,
+                "pages": pages,
+                "people": people,
+                "elapsed": elapsed,
+                "error": error,
+                "duplicates": duplicates,
+            })
+
+    def finish(self):
+        """전체 실행 종료 시각 기록"""
+        self.finished_at = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    @property
+    def success_count(self) -> int:
+        return sum(1 for a in self.accounts if a["success"])
+
+    @property
+    def fail_count(self) -> int:
+        return sum(1 for a in self.accounts if not a["success"])
+
+    @property
+    def total_pages(self) -> int:
+        return sum(a["pages"] for a in self.accounts)
+
+    @property
+    def total_people(self) -> int:
+        return sum(a["people"] for a in self.accounts)
+
+    @property
+    def total_duplicates(self) -> int:
+        return sum(a.get("duplicates", 0) for a in self.accounts)
+
+    def as_dict(self) -> Dict:
+        """통계를 딕셔너리로 반환"""
+        elapsed = self.elapsed or 1e-9
+        return {
+            "accounts": len(self.accounts),
+            "success": self.success_count,
+            "failures": self.fail_count,
+            "pages": self.total_pages,
+            "people": self.total_people,
+            "duplicates": self.total_duplicates,
+            "elapsed_sec": round(self.elapsed, 3),
+            "accounts_per_sec": round(len(self.accounts) / elapsed, 3),
+            "pages_per_sec": round(self.total_pages / elapsed, 3),
+        }
+
+    def print_summary(self):
+        """통계 출력"""
+        stats = self.as_dict()
+        print(f"\n{'='*60}")
+        print(f"🎉 전체 실행 완료!")
+        print(f"   ✅ 성공: {stats['success']}개")
+        if stats['failures'] > 0:
+            print(f"   ❌ 실패: {stats['failures']}개")
+            for a in self.accounts:
+                if not a["success"]:
+                    print(f"      - {a['sheet_name']}: {a['error'] or '실패'}")
+        print(f"   📄 페이지: {stats['pages']}개 / 👥 인재: {stats['people']}명")
+        if stats['duplicates'] > 0:
+            print(f"   🔁 중복 제외: {stats['duplicates']}명")
+        print(f"   ⏱️  {stats['elapsed_sec']:.2f}초 "
+              f"({stats['accounts_per_sec']:.2f} 계정/초, {stats['pages_per_sec']:.2f} 페이지/초)")
+        print(f"{'='*60}\n")
+
+
+class LatencyStats:
+    """작업별 소요 시간 백분위수 / 처리량 집계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.perf_counter()
+        self.samples: List[float] = []
+        self.failures = 0
+
+    def record(self, seconds: float):
+        """성공한 작업 1개의 소요 시간(초) 기록"""
+        with self._lock:
+            self.samples.append(seconds)
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+
+    def percentile(self, p: float) -> Optional[float]:
+        """p백분위수 (선형 보간, 기록이 없으면 None)"""
+        with self._lock:
+            ordered = sorted(self.samples)
+        if not ordered:
+            return None
+        rank = (len(ordered) - 1) * p / 100
+        low = int(rank)
+        high = min(low + 1, len(ordered) - 1)
+        return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+    def as_dict(self) -> Dict:
+        elapsed = time.perf_counter() - self.started_at
+        count = len(self.samples)
+        return {
+            "count": count,
+            "failures": self.failures,
+            "elapsed_sec": round(elapsed, 3),
+            "per_sec": round(count / (elapsed or 1e-9), 3),
+            "p50_sec": _round(self.percentile(50)),
+            "p90_sec": _round(self.percentile(90)),
+            "p99_sec": _round(self.percentile(99)),
+            "max_sec": _round(max(self.samples) if self.samples else None),
+        }
+
+    def print_summary(self, label: str = "처리"):
+        stats = self.as_dict()
+        print(f"⏱️  {label} {stats['count']}건 (실패 {stats['failures']}건), {stats['elapsed_sec']:.2f}초, "
+              f"{stats['per_sec']:.2f}건/초")
+        if stats["count"]:
+            print(f"   p50 {stats['p50_sec']:.2f}초 / p90 {stats['p90_sec']:.2f}초 / "
+                  f"p99 {stats['p99_sec']:.2f}초 / 최대 {stats['max_sec']:.2f}초")
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 3) if value is not None else None
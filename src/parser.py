@@ -1,20 +1,39 @@
 """인재 데이터 파싱"""
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from dataclasses import dataclass, field
+from typing import Callable, List, Dict, Optional
 import re
 
+from src.parser_engines import get_engine
+
+
+@dataclass
+class ParsedPage:
+    """검색 결과 페이지 1개의 파싱 결과 (인재 목록 + 페이지 메타데이터)"""
+    people: List[Dict[str, str]] = field(default_factory=list)
+    saveno: Optional[int] = None       # 검색 세션 ID (input#saveNo)
+    card_count: int = 0                # 필터링 전 카드 수
+    has_next: bool = False             # 다음 페이지 존재 여부
+    duplicate_count: int = 0           # 이미 수집한 인재라 제외한 카드 수
+    unchanged_count: int = 0           # 지난 실행과 달라진 점이 없어 제외한 인원
+    active_count: int = 0              # 최근활동 필터를 통과한 카드 수 (중복으로 건너뛴 카드 포함)
+
 
 class PersonDataParser:
     """인재 데이터 파싱"""
 
-    def __init__(self, base_url: str, filter_active_within_minutes: Optional[int] = None):
+    SAVENO_ID = "saveNo"  # <input type="hidden" id="saveNo" value="...">
+    # 전체 결과 수 요소는 실제 응답에서 확인하지 못해 읽지 않음 (다음 페이지 여부는 카드 수로 판단)
+
+    def __init__(self, base_url: str, filter_active_within_minutes: Optional[int] = None, engine: str = "auto"):
         """
         Args:
             base_url: 기본 URL
             filter_active_within_minutes: 최근 활동 필터링 (분 단위, None이면 필터링 안 함)
+            engine: HTML 파싱 엔진 ("lxml", "bs4", "auto" - lxml이 없으면 bs4)
         """
         self.base_url = base_url
         self.filter_active_within_minutes = filter_active_within_minutes
+        self.engine = get_engine(engine)
 
     def parse_html(self, html: str, start_index: int = 1) -> List[Dict[str, str]]:
         """
@@ -24,17 +43,54 @@ class PersonDataParser:
             html: HTML 문자열
             start_index: 시작 번호 (페이지 연속 번호용)
         """
-        soup = BeautifulSoup(html, "html.parser")
-        people = []
+        return self.parse_page(html, start_index=start_index).people
+
+    def parse_page(
+        self,
+        html: str,
+        start_index: int = 1,
+        page_size: Optional[int] = None,
+        skip_rno: Optional[Callable[[str], bool]] = None
+    ) -> ParsedPage:
+        """
+        HTML을 한 번만 파싱하여 인재 정보와 페이지 메타데이터를 함께 추출
 
-        for idx, card in enumerate(soup.select("tr.dvResumeTr"), start=start_index):
+        Args:
+            html: HTML 문자열
+            start_index: 시작 번호 (페이지 연속 번호용)
+            page_size: 페이지당 결과 수 (다음 페이지 판단용)
+            skip_rno: 이력서번호를 받아 True를 반환하면 해당 카드는 추출하지 않음 (중복 제거용)
+        """
+        doc = self.engine.parse(html)
+        result = ParsedPage()
+
+        for idx, card in enumerate(self.engine.iter_cards(doc), start=start_index):
+            result.card_count += 1
+            if skip_rno is not None and skip_rno(card.attr("data-rno", "")):
+                result.duplicate_count += 1
+                result.active_count += 1  # 활동 시각을 확인하지 않았으므로 기간 안으로 간주
+                continue
             person_data = self._extract_person_data(card, index=idx)
             if person_data:
-                people.append(person_data)
+                result.people.append(person_data)
+                result.active_count += 1
 
-        return people
+        saveno = self.engine.value_by_id(doc, self.SAVENO_ID)
+        if saveno and saveno.strip().isdigit():
+            result.saveno = int(saveno)
 
-    def _parse_activity_minutes(self, activity_text: str) -> Optional[int]:
+        result.has_next = self._has_next(result, page_size)
+        return result
+
+    @staticmethod
+    def _has_next(result: ParsedPage, page_size: Optional[int]) -> bool:
+        """다음 페이지 존재 여부 (카드가 페이지 크기만큼 차 있으면 다음 페이지가 있다고 봄)"""
+        if page_size:
+            return result.card_count >= page_size
+        return result.card_count > 0
+
+    @staticmethod
+    def _parse_activity_minutes(activity_text: str) -> Optional[int]:
         """
         활동 시간 텍스트에서 분 단위로 변환
 
@@ -68,16 +124,15 @@ class PersonDataParser:
         return total_minutes
 
     def _extract_person_data(self, card, index: int) -> Optional[Dict[str, str]]:
-        """카드에서 개인 정보 추출"""
+        """카드에서 개인 정보 추출 (card: 파싱 엔진의 카드 래퍼)"""
         # 이름/나이
-        name_elem = card.select_one(".nameAge dt a")
-        age_elem = card.select_one(".nameAge dd")
+        name_text = card.first_text("name")
+        age_text = card.first_text("age")
 
         # 성별과 나이 분리 (HTML 원본: "(여, 만 35세)")
         gender = ""
         age = ""
-        if age_elem:
-            age_text = age_elem.get_text(strip=True)
+        if age_text is not None:
             # "(여, 만 35세)" 형식에서 분리
             if "," in age_text:
                 parts = age_text.replace("(", "").replace(")", "").split(",")
@@ -90,14 +145,14 @@ class PersonDataParser:
 
         # 이력서 링크
         resume_url = ""
-        if name_elem and name_elem.get("href"):
-            resume_url = self.base_url + name_elem.get("href")
+        resume_href = card.first_attr("name", "href")
+        if resume_href:
+            resume_url = self.base_url + resume_href
 
         # 경력
-        career_elem = card.select_one(".careerIcon .career")
+        career_text = card.first_text("career")
         career = ""
-        if career_elem:
-            career_text = career_elem.get_text(strip=True)
+        if career_text is not None:
             # "경력\r\n                                                2년2개월" 형식에서 "2년2개월"만 추출
             career = career_text.replace("경력", "").replace("\r", "").replace("\n", "").strip()
 
@@ -107,36 +162,30 @@ class PersonDataParser:
 
         # 제목 (이력서 제목)
         # p.title.active > a 에 제목이 표시됨
-        title_p = card.select_one("p.title.active")
-        resume_title_elem = None
-        if title_p:
-            resume_title_elem = title_p.select_one("a")
+        resume_title = card.first_text("title")
 
         # 학력 (항상 .ico_edu 위치에 있음)
-        education_elem = card.select_one(".ico_edu span")
+        education = card.first_text("education")
 
         # 지역
-        area_elem = card.select_one(".ico_pin span")
+        area = card.first_text("area")
 
         # 직무 키워드
-        job_keywords = [btn.get_text(strip=True) for btn in card.select(".keywordSkill button")]
+        job_keywords = card.all_texts("job_keywords")
 
         # 기술 스킬
-        tech_skills = [btn.get_text(strip=True) for btn in card.select(".keywordJob button")]
+        tech_skills = card.all_texts("tech_skills")
 
         # 이력서 번호
-        rno = card.get("data-rno", "")
+        rno = card.attr("data-rno", "")
 
         # 🔥 최근 활동 정보 수집 (bullList)
         # "이력서 수정", "공고 스크랩", "입사지원" 모두 통합
-        bull_list = card.select("ul.bullList li")
         activity_items = []
         latest_activity_minutes = None
         latest_activity_text = ""
 
-        for li in bull_list:
-            text = li.get_text(strip=True)
-
+        for text in card.all_texts("activities"):
             # 시간 정보가 있는 활동만 수집
             activity_minutes = self._parse_activity_minutes(text)
 
@@ -158,13 +207,13 @@ class PersonDataParser:
 
         return {
             "번호": index,
-            "이름": name_elem.get_text(strip=True) if name_elem else "",
+            "이름": name_text or "",
             "성별": gender,
             "나이": age,
-            "제목": resume_title_elem.get_text(strip=True) if resume_title_elem else "",
+            "제목": resume_title or "",
             "경력": career,
-            "학력": education_elem.get_text(strip=True) if education_elem else "",
-            "지역": area_elem.get_text(strip=True) if area_elem else "",
+            "학력": education or "",
+            "지역": area or "",
             "직무": ", ".join(job_keywords),
             "기술스택": ", ".join(tech_skills),
             "이력서번호": rno,
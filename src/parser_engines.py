@@ -0,0 +1,196 @@
+"""
+HTML 파싱 엔진
+
+PersonDataParser가 사용하는 HTML 백엔드를 교체할 수 있도록 카드 단위 조회를 추상화합니다.
+- "lxml": libxml2 기반 + 미리 컴파일한 XPath (빠름, lxml 설치 필요)
+- "bs4":  BeautifulSoup(html.parser) + CSS 선택자 (기존 방식, 대체용)
+
+두 엔진은 같은 입력에 대해 같은 텍스트를 반환해야 합니다.
+(get_text(strip=True)와 동일하게 텍스트 조각별 strip 후 빈 조각을 버리고 이어 붙임)
+"""
+from typing import Iterator, List, Optional
+
+# 카드 안에서 조회하는 항목별 CSS 선택자 (bs4 엔진)
+CARD_SELECTORS = {
+    "name": ".nameAge dt a",
+    "age": ".nameAge dd",
+    "career": ".careerIcon .career",
+    "title_box": "p.title.active",
+    "title": "a",  # title_box 안에서 조회
+    "education": ".ico_edu span",
+    "area": ".ico_pin span",
+    "job_keywords": ".keywordSkill button",
+    "tech_skills": ".keywordJob button",
+    "activities": "ul.bullList li",
+}
+
+
+def _cls(name: str) -> str:
+    """CSS 클래스 선택자(.name)에 대응하는 XPath 조건"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# 카드 안에서 조회하는 항목별 XPath (lxml 엔진, CARD_SELECTORS와 같은 의미)
+CARD_XPATHS = {
+    "name": f".//*[{_cls('nameAge')}]//dt//a",
+    "age": f".//*[{_cls('nameAge')}]//dd",
+    "career": f".//*[{_cls('careerIcon')}]//*[{_cls('career')}]",
+    "title": f"(.//p[{_cls('title')} and {_cls('active')}])[1]//a",
+    "education": f".//*[{_cls('ico_edu')}]//span",
+    "area": f".//*[{_cls('ico_pin')}]//span",
+    "job_keywords": f".//*[{_cls('keywordSkill')}]//button",
+    "tech_skills": f".//*[{_cls('keywordJob')}]//button",
+    "activities": f".//ul[{_cls('bullList')}]//li",
+}
+
+
+class Bs4Card:
+    """BeautifulSoup 카드 래퍼"""
+
+    def __init__(self, tag):
+        self.tag = tag
+
+    def attr(self, name: str, default: str = "") -> str:
+        return self.tag.get(name, default)
+
+    def _first(self, key: str):
+        if key == "title":
+            # p.title.active > a (첫 번째 p.title.active 안에서만 조회)
+            box = self.tag.select_one(CARD_SELECTORS["title_box"])
+            return box.select_one(CARD_SELECTORS["title"]) if box else None
+        return self.tag.select_one(CARD_SELECTORS[key])
+
+    def first_text(self, key: str) -> Optional[str]:
+        elem = self._first(key)
+        return elem.get_text(strip=True) if elem else None
+
+    def first_attr(self, key: str, name: str) -> Optional[str]:
+        elem = self._first(key)
+        return elem.get(name) if elem else None
+
+    def all_texts(self, key: str) -> List[str]:
+        return [elem.get_text(strip=True) for elem in self.tag.select(CARD_SELECTORS[key])]
+
+
+class Bs4Engine:
+    """BeautifulSoup(html.parser) 엔진"""
+
+    name = "bs4"
+
+    def __init__(self):
+        from bs4 import BeautifulSoup
+        self._soup_cls = BeautifulSoup
+
+    def parse(self, html: str):
+        return self._soup_cls(html, "html.parser")
+
+    def iter_cards(self, doc) -> Iterator[Bs4Card]:
+        for tag in doc.select("tr.dvResumeTr"):
+            yield Bs4Card(tag)
+
+    def value_by_id(self, doc, elem_id: str) -> Optional[str]:
+        elem = doc.find(id=elem_id)
+        return elem.get("value") if elem else None
+
+
+class LxmlCard:
+    """lxml 카드 래퍼"""
+
+    def __init__(self, elem, engine: "LxmlEngine"):
+        self.elem = elem
+        self.engine = engine
+
+    def attr(self, name: str, default: str = "") -> str:
+        return self.elem.get(name, default)
+
+    def _first(self, key: str):
+        found = self.engine.card_xpaths[key](self.elem)
+        return found[0] if found else None
+
+    def first_text(self, key: str) -> Optional[str]:
+        elem = self._first(key)
+        return self.engine.text(elem) if elem is not None else None
+
+    def first_attr(self, key: str, name: str) -> Optional[str]:
+        elem = self._first(key)
+        # bs4 Tag는 자식 노드가 없으면 거짓으로 평가되므로 같은 규칙을 따름
+        if elem is None or (len(elem) == 0 and not elem.text):
+            return None
+        return elem.get(name)
+
+    def all_texts(self, key: str) -> List[str]:
+        return [self.engine.text(elem) for elem in self.engine.card_xpaths[key](self.elem)]
+
+
+class LxmlEngine:
+    """lxml 엔진 (XPath는 생성 시 1회 컴파일)"""
+
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.html
+        from lxml import etree
+
+        self._lxml_html = lxml.html
+        self.card_xpaths = {key: etree.XPath(expr) for key, expr in CARD_XPATHS.items()}
+        self._cards = etree.XPath(f"//tr[{_cls('dvResumeTr')}]")
+        # BeautifulSoup.get_text()처럼 script/style/template 내용과 주석은 제외
+        self._texts = etree.XPath(
+            "descendant-or-self::text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+            smart_strings=False
+        )
+
+    def parse(self, html: str):
+        return self._lxml_html.document_fromstring(html)
+
+    def iter_cards(self, doc) -> Iterator[LxmlCard]:
+        for elem in self._cards(doc):
+            yield LxmlCard(elem, self)
+
+    def value_by_id(self, doc, elem_id: str) -> Optional[str]:
+        elem = doc.get_element_by_id(elem_id, None)
+        return elem.get("value") if elem is not None else None
+
+    def text(self, elem) -> str:
+        """get_text(strip=True)와 같은 결과"""
+        return "".join(part for part in (t.strip() for t in self._texts(elem)) if part)
+
+    def text_lines(self, elem) -> str:
+        """get_text(separator="\\n", strip=True)와 같은 결과"""
+        return "\n".join(part for part in (t.strip() for t in self._texts(elem)) if part)
+
+
+ENGINES = {
+    "lxml": LxmlEngine,
+    "bs4": Bs4Engine,
+}
+
+
+def available_engines() -> List[str]:
+    """현재 환경에서 사용 가능한 엔진 이름 목록"""
+    names = []
+    for name, engine_cls in ENGINES.items():
+        try:
+            engine_cls()
+            names.append(name)
+        except ImportError:
+            continue
+    return names
+
+
+def get_engine(name: str = "auto"):
+    """
+    파싱 엔진 생성
+
+    Args:
+        name: "lxml", "bs4" 또는 "auto" (lxml이 없으면 bs4 사용)
+    """
+    if name == "auto":
+        try:
+            return LxmlEngine()
+        except ImportError:
+            return Bs4Engine()
+
+    if name not in ENGINES:
+        raise ValueError(f"지원하지 않는 파싱 엔진: {name} (사용 가능: {', '.join(ENGINES)})")
+    return ENGINES[name]()
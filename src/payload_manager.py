@@ -1,52 +1,197 @@
 """검색 조건 payload 관리"""
+import copy
 import json
+import threading
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode
 
 
 class PayloadManager:
-    """검색 조건 payload 관리"""
+    """
+    검색 조건 payload 관리
+
+    템플릿은 한 번만 로드하고, 로드 시 직무/지역/학력/나이/구직상태의 이름 → 노드 경로 인덱스와
+    선택이 모두 해제된 섹션을 미리 만들어 둡니다.
+    검색 조건(필터 조합)별 payload는 변경되는 노드의 경로만 복사(구조 공유)하여 한 번 만들고 캐시하며,
+    페이지별 payload는 최상위 딕셔너리만 복사한 뒤 p/ps/saveno를 설정합니다.
+
+    ⚠️ 반환된 payload의 하위 객체는 템플릿/캐시와 공유되므로 최상위 키 외에는 수정하지 마세요.
+    """
+
+    # 학력 매핑 (사용자 친화적 이름 → API 이름)
+    EDU_MAPPING = {
+        "대졸": "대학교(4년) 졸업",
+        "대학교": "대학교(4년) 졸업",
+        "4년제": "대학교(4년) 졸업",
+        "전문대": "대학(2,3년) 졸업",
+        "초대졸": "대학(2,3년) 졸업",
+        "2년제": "대학(2,3년) 졸업",
+        "3년제": "대학(2,3년) 졸업",
+        "대학원": "대학원 졸업",
+        "석사": "대학원 졸업",
+        "박사": "대학원 졸업",
+        "고졸": "고등학교 졸업 이하",
+        "고등학교": "고등학교 졸업 이하",
+    }
+
+    # 나이 매핑 (레거시 고정 범위)
+    AGE_MAPPING = {
+        "25세이하": "~25세",
+        "20대초반": "~25세",
+        "26-30": "26~30세",
+        "20대후반": "26~30세",
+        "31-35": "31~35세",
+        "30대초반": "31~35세",
+        "36-40": "36~40세",
+        "30대후반": "36~40세",
+        "41-50": "41~50세",
+        "40대": "41~50세",
+        "51세이상": "51세 이상",
+        "50대이상": "51세 이상",
+    }
+
+    # 성별 매핑
+    GENDER_MAPPING = {
+        "남": "man",
+        "남성": "man",
+        "남자": "man",
+        "여": "woman",
+        "여성": "woman",
+        "여자": "woman",
+    }
+
+    # 구직상태 매핑
+    JOB_STATUS_MAPPING = {
+        "구직준비중": "구직 준비중",
+        "준비중": "구직 준비중",
+        "구직중": "구직중",
+        "재직중": "재직중",
+        "재직": "재직중",
+    }
+
+    # 요청 본문 템플릿에서 페이지 필드 자리를 표시하는 값 (JSON/URL 인코딩 후에도 그대로 남는 정수)
+    PAGE_FIELD_PLACEHOLDERS = {"p": -917000001, "ps": -917000002, "saveno": -917000003}
 
     def __init__(self, template_path: str):
         self.template_path = Path(template_path)
         self._template = None
+        self._lock = threading.Lock()
+        self._selection_cache: Dict[tuple, dict] = {}
+        self._body_cache: Dict[tuple, Optional[Tuple[List[bytes], List[str]]]] = {}
+
+        # 템플릿 로드 시 생성되는 인덱스/초기화 섹션
+        self._job_index: Dict[str, Tuple[tuple, Optional[int]]] = {}
+        self._area_index: Dict[str, Tuple[tuple, Optional[int]]] = {}
+        self._education_index: Dict[str, Optional[int]] = {}
+        self._age_code_index: Dict[str, int] = {}
+        self._job_status_index: Dict[str, int] = {}
+        self._cleared: Dict[str, list] = {}
 
     def _load_template(self) -> dict:
-        """브라우저 payload 템플릿 로드"""
+        """브라우저 payload 템플릿 로드 (1회만 로드하고 인덱스 생성, 반환값은 수정 금지)"""
         if self._template is None:
-            with open(self.template_path, "r", encoding="utf-8") as f:
-                self._template = json.load(f)
-        return self._template.copy()
-
-    def _find_job_by_name(self, job_name: str, job_list: list) -> Optional[dict]:
-        """직무 이름으로 직무 항목 찾기 (재귀)"""
-        for job in job_list:
-            if job.get("t") == job_name:
-                return job
-            # 하위 children이 있으면 재귀 탐색
-            if "children" in job:
-                found = self._find_job_by_name(job_name, job["children"])
-                if found:
-                    return found
+            with self._lock:
+                if self._template is None:
+                    with open(self.template_path, "r", encoding="utf-8") as f:
+                        template = json.load(f)
+                    self._build_indexes(template)
+                    self._template = template
+        return self._template
+
+    # ==================== 인덱스 ====================
+
+    def _build_indexes(self, template: dict):
+        """이름 → 노드 경로 인덱스와 선택 해제된 섹션 생성"""
+        # 직무: 카테고리 하위에서 (카테고리 순서, 전위 순회) 처음 찾은 노드
+        job_ctgr = template.get("jobtype", {}).get("ctgr", [])
+        for ci, category in enumerate(job_ctgr):
+            for path, node in self._walk(category.get("children", []), (ci,)):
+                self._job_index.setdefault(node.get("t"), (path, self._child_index(node, lambda t: t == "전체")))
+
+        # 지역: 전체 트리 전위 순회에서 처음 찾은 노드
+        area_ctgr = template.get("workarea", {}).get("ctgr", [])
+        for path, node in self._walk(area_ctgr, ()):
+            self._area_index.setdefault(node.get("t"), (path, self._child_index(node, lambda t: "전지역" in t)))
+
+        # 학력/나이/구직상태: 평면 리스트
+        for name in set(self.EDU_MAPPING) | set(self.EDU_MAPPING.values()):
+            self._education_index[name] = self._find_education_index(name, template.get("education", []))
+        for i, age in enumerate(template.get("age", {}).get("code", [])):
+            self._age_code_index.setdefault(age.get("t"), i)
+        for i, status in enumerate(template.get("job", [])):
+            self._job_status_index.setdefault(status.get("t"), i)
+
+        # 선택 해제된 섹션 (필터가 지정된 경우 이 상태에서 선택만 적용)
+        self._cleared = {
+            "jobtype": self._cleared_tree(job_ctgr, ("s", "c")),
+            "workarea": self._cleared_tree(area_ctgr, ("s", "c", "use")),
+            "education": self._cleared_tree(template.get("education", []), ("s", "c", "use")),
+            "age": self._cleared_tree(template.get("age", {}).get("code", []), ("s", "c", "use")),
+            "job": self._cleared_tree(template.get("job", []), ("s", "c", "use")),
+        }
+
+    @classmethod
+    def _walk(cls, nodes: list, prefix: tuple):
+        """(경로, 노드) 전위 순회"""
+        for i, node in enumerate(nodes):
+            path = prefix + (i,)
+            yield path, node
+            if "children" in node:
+                yield from cls._walk(node["children"], path)
+
+    @staticmethod
+    def _child_index(node: dict, predicate) -> Optional[int]:
+        """조건을 만족하는 첫 번째 하위 항목 인덱스"""
+        for i, child in enumerate(node.get("children", [])):
+            if predicate(child.get("t", "")):
+                return i
         return None
 
-    def _reset_all_selections(self, job_list: list):
-        """모든 직무 선택 초기화"""
-        for job in job_list:
-            job["s"] = 0
-            job["c"] = 0
-            if "children" in job:
-                self._reset_all_selections(job["children"])
-
-    def _find_job_category(self, job_name: str, ctgr_list: list) -> tuple:
-        """직무가 속한 카테고리와 직무 찾기"""
-        for category in ctgr_list:
-            # 현재 카테고리의 하위에서 직무 찾기
-            if "children" in category:
-                job = self._find_job_by_name(job_name, category["children"])
-                if job:
-                    return (category, job)
-        return (None, None)
+    @classmethod
+    def _cleared_tree(cls, nodes: list, keys: tuple) -> list:
+        """선택 플래그를 0으로 초기화한 트리 복사본"""
+        cleared = copy.deepcopy(nodes)
+        for _, node in cls._walk(cleared, ()):
+            for key in keys:
+                node[key] = 0
+        return cleared
+
+    @staticmethod
+    def _find_education_index(search_name: str, education_list: list) -> Optional[int]:
+        """학력명이 포함된 첫 번째 학력 항목 인덱스"""
+        for i, edu in enumerate(education_list):
+            if search_name in edu.get("t", ""):
+                return i
+        return None
+
+    @staticmethod
+    def _cow_node(nodes: list, path: tuple) -> Tuple[list, dict]:
+        """
+        경로 복사 (copy-on-write)
+
+        path에 해당하는 노드까지의 리스트/노드만 복사하고 나머지 노드는 공유합니다.
+
+        Returns:
+            (복사된 최상위 리스트, 복사된 대상 노드)
+        """
+        new_nodes = list(nodes)
+        current = new_nodes
+        node = None
+        for depth, i in enumerate(path):
+            node = dict(current[i])
+            current[i] = node
+            if depth < len(path) - 1:
+                node["children"] = list(node["children"])
+                current = node["children"]
+        return new_nodes, node
+
+    @staticmethod
+    def _set_flags(node: dict, keys: tuple = ("s", "c")):
+        for key in keys:
+            node[key] = 1
+
+    # ==================== 선택 ====================
 
     def _select_job(self, job_name: Union[str, List[str]], payload: dict):
         """
@@ -54,13 +199,11 @@ class PayloadManager:
 
         Args:
             job_name: 직무명 또는 직무명 리스트
-            payload: payload 딕셔너리
+            payload: payload 딕셔너리 (jobtype만 새 객체로 교체)
         """
-        job_type = payload.get("jobtype", {})
-        ctgr = job_type.get("ctgr", [])
-
+        job_type = dict(payload.get("jobtype", {}))
         # 모든 선택 초기화
-        self._reset_all_selections(ctgr)
+        ctgr = self._cleared["jobtype"]
 
         # 문자열이면 리스트로 변환
         if isinstance(job_name, str):
@@ -72,134 +215,81 @@ class PayloadManager:
 
         # 각 직무를 찾아서 선택
         for jname in job_names:
-            category, job = self._find_job_category(jname, ctgr)
+            entry = self._job_index.get(jname)
 
-            if not category or not job:
+            if not entry:
                 print(f"⚠️  직무 '{jname}'를 찾을 수 없습니다.")
                 continue
 
+            path, all_child = entry
+
             # 상위 카테고리 선택
-            category["s"] = 1
-            category["c"] = 1
+            ctgr, category = self._cow_node(ctgr, path[:1])
+            self._set_flags(category)
             selected_categories.add(category.get('t'))
 
             # 직무 선택
-            job["s"] = 1
-            job["c"] = 1
+            ctgr, job = self._cow_node(ctgr, path)
+            self._set_flags(job)
 
             # "전체" 하위 항목도 선택
-            if "children" in job:
-                for child in job["children"]:
-                    if child.get("t") == "전체":
-                        child["s"] = 1
-                        child["c"] = 1
-                        break
+            if all_child is not None:
+                ctgr, child = self._cow_node(ctgr, path + (all_child,))
+                self._set_flags(child)
 
             print(f"✅ 직무 '{jname}' 선택됨 (카테고리: {category.get('t')})")
 
         if selected_categories:
             print(f"💡 총 {len(job_names)}개 직무 선택 완료 (카테고리: {', '.join(selected_categories)})")
 
-    def _find_area_by_name(self, area_name: str, area_list: list) -> Optional[dict]:
-        """지역 이름으로 지역 항목 찾기 (재귀)"""
-        for area in area_list:
-            if area.get("t") == area_name:
-                return area
-            if "children" in area:
-                found = self._find_area_by_name(area_name, area["children"])
-                if found:
-                    return found
-        return None
-
-    def _reset_all_areas(self, area_list: list):
-        """모든 지역 선택 초기화"""
-        for area in area_list:
-            area["s"] = 0
-            area["c"] = 0
-            area["use"] = 0
-            if "children" in area:
-                self._reset_all_areas(area["children"])
+        job_type["ctgr"] = ctgr
+        payload["jobtype"] = job_type
 
     def _select_areas(self, area_names: List[str], payload: dict):
         """특정 지역들 선택"""
-        workarea = payload.get("workarea", {})
-        ctgr = workarea.get("ctgr", [])
-
+        workarea = dict(payload.get("workarea", {}))
         # 모든 지역 선택 초기화
-        self._reset_all_areas(ctgr)
+        ctgr = self._cleared["workarea"]
 
         for area_name in area_names:
-            area = self._find_area_by_name(area_name, ctgr)
-            if area:
-                area["s"] = 1
-                area["c"] = 1
-                area["use"] = 1
+            entry = self._area_index.get(area_name)
+            if entry:
+                path, all_child = entry
+                ctgr, area = self._cow_node(ctgr, path)
+                self._set_flags(area, ("s", "c", "use"))
                 # "전지역" 하위 항목이 있으면 선택
-                if "children" in area:
-                    for child in area["children"]:
-                        if "전지역" in child.get("t", ""):
-                            child["s"] = 1
-                            child["c"] = 1
-                            child["use"] = 1
-                            break
+                if all_child is not None:
+                    ctgr, child = self._cow_node(ctgr, path + (all_child,))
+                    self._set_flags(child, ("s", "c", "use"))
                 print(f"✅ 지역 '{area_name}' 선택됨")
             else:
                 print(f"⚠️  지역 '{area_name}'를 찾을 수 없습니다.")
 
-    def _reset_all_education(self, education_list: list):
-        """모든 학력 선택 초기화"""
-        for edu in education_list:
-            edu["s"] = 0
-            edu["c"] = 0
-            edu["use"] = 0
+        workarea["ctgr"] = ctgr
+        payload["workarea"] = workarea
 
     def _select_education(self, education_names: List[str], payload: dict):
         """특정 학력들 선택"""
-        education = payload.get("education", [])
-
         # 모든 학력 선택 초기화
-        self._reset_all_education(education)
-
-        # 학력 매핑 (사용자 친화적 이름 → API 이름)
-        edu_mapping = {
-            "대졸": "대학교(4년) 졸업",
-            "대학교": "대학교(4년) 졸업",
-            "4년제": "대학교(4년) 졸업",
-            "전문대": "대학(2,3년) 졸업",
-            "초대졸": "대학(2,3년) 졸업",
-            "2년제": "대학(2,3년) 졸업",
-            "3년제": "대학(2,3년) 졸업",
-            "대학원": "대학원 졸업",
-            "석사": "대학원 졸업",
-            "박사": "대학원 졸업",
-            "고졸": "고등학교 졸업 이하",
-            "고등학교": "고등학교 졸업 이하",
-        }
+        education = self._cleared["education"]
 
         for edu_name in education_names:
             # 매핑된 이름이 있으면 사용, 없으면 그대로 사용
-            search_name = edu_mapping.get(edu_name, edu_name)
-
-            found = False
-            for edu in education:
-                if search_name in edu.get("t", ""):
-                    edu["s"] = 1
-                    edu["c"] = 1
-                    edu["use"] = 1
-                    found = True
-                    print(f"✅ 학력 '{edu.get('t')}' 선택됨")
-                    break
-
-            if not found:
+            search_name = self.EDU_MAPPING.get(edu_name, edu_name)
+
+            if search_name not in self._education_index:
+                self._education_index[search_name] = self._find_education_index(search_name, education)
+            index = self._education_index[search_name]
+
+            if index is not None:
+                education, edu = self._cow_node(education, (index,))
+                self._set_flags(edu, ("s", "c", "use"))
+                print(f"✅ 학력 '{edu.get('t')}' 선택됨")
+            else:
                 print(f"⚠️  학력 '{edu_name}'를 찾을 수 없습니다.")
                 print(f"    사용 가능한 학력: 대졸, 전문대, 대학원, 고졸")
 
-    def _reset_all_ages(self, age_list: list):
-        """모든 나이 선택 초기화"""
-        for age in age_list:
-            age["s"] = 0
-            age["c"] = 0
-            age["use"] = 0
+        payload["education"] = education
 
     def _select_ages(self, age_input: Union[int, tuple, List], payload: dict):
         """
@@ -212,11 +302,10 @@ class PayloadManager:
                 - 리스트: [26, 30] → 26세~30세
                 - 문자열: "26~30세" → 고정 범위 사용 (레거시)
         """
-        age_data = payload.get("age", {})
-        age_codes = age_data.get("code", [])
-
+        age_data = dict(payload.get("age", {}))
         # 모든 나이 선택 초기화
-        self._reset_all_ages(age_codes)
+        age_data["code"] = self._cleared["age"]
+        payload["age"] = age_data
 
         # 입력 타입에 따른 처리
         if isinstance(age_input, int):
@@ -256,110 +345,124 @@ class PayloadManager:
         Args:
             age_range: "26~30세", "31~35세" 등
         """
-        age_data = payload.get("age", {})
-        age_codes = age_data.get("code", [])
-
-        # 나이 매핑
-        age_mapping = {
-            "25세이하": "~25세",
-            "20대초반": "~25세",
-            "26-30": "26~30세",
-            "20대후반": "26~30세",
-            "31-35": "31~35세",
-            "30대초반": "31~35세",
-            "36-40": "36~40세",
-            "30대후반": "36~40세",
-            "41-50": "41~50세",
-            "40대": "41~50세",
-            "51세이상": "51세 이상",
-            "50대이상": "51세 이상",
-        }
+        age_data = payload["age"]
 
         # 매핑된 이름이 있으면 사용, 없으면 그대로 사용
-        search_name = age_mapping.get(age_range, age_range)
-
-        found = False
-        for age in age_codes:
-            if search_name == age.get("t"):
-                age["s"] = 1
-                age["c"] = 1
-                age["use"] = 1
-                found = True
-                print(f"✅ 나이 '{age.get('t')}' 선택됨 (고정 범위)")
-                break
-
-        if not found:
+        search_name = self.AGE_MAPPING.get(age_range, age_range)
+
+        index = self._age_code_index.get(search_name)
+        if index is not None:
+            age_data["code"], age = self._cow_node(age_data["code"], (index,))
+            self._set_flags(age, ("s", "c", "use"))
+            print(f"✅ 나이 '{age.get('t')}' 선택됨 (고정 범위)")
+        else:
             print(f"⚠️  나이 '{age_range}'를 찾을 수 없습니다.")
             print(f"    사용 가능한 나이대: ~25세, 26~30세, 31~35세, 36~40세, 41~50세, 51세 이상")
 
     def _select_gender(self, genders: List[str], payload: dict):
         """성별 선택"""
-        gender_data = payload.get("gender", {})
-
-        # 성별 매핑
-        gender_mapping = {
-            "남": "man",
-            "남성": "man",
-            "남자": "man",
-            "여": "woman",
-            "여성": "woman",
-            "여자": "woman",
-        }
+        gender_data = dict(payload.get("gender", {}))
 
         for gender in genders:
             # 매핑된 이름이 있으면 사용, 없으면 그대로 사용
-            gender_key = gender_mapping.get(gender, gender.lower())
+            gender_key = self.GENDER_MAPPING.get(gender, gender.lower())
 
             if gender_key in gender_data:
-                gender_data[gender_key]["s"] = 1
-                gender_data[gender_key]["c"] = 1
-                gender_data[gender_key]["use"] = 1
+                gender_data[gender_key] = {**gender_data[gender_key], "s": 1, "c": 1, "use": 1}
                 print(f"✅ 성별 '{gender}' 선택됨")
             else:
                 print(f"⚠️  성별 '{gender}'를 찾을 수 없습니다.")
                 print(f"    사용 가능한 성별: 남, 여")
 
-    def _reset_all_job_status(self, job_status_list: list):
-        """모든 구직상태 선택 초기화"""
-        for job_status in job_status_list:
-            job_status["s"] = 0
-            job_status["c"] = 0
-            job_status["use"] = 0
+        payload["gender"] = gender_data
 
     def _select_job_status(self, job_status_names: List[str], payload: dict):
         """구직상태 선택"""
-        job_status_data = payload.get("job", [])
-
         # 모든 구직상태 선택 초기화
-        self._reset_all_job_status(job_status_data)
-
-        # 구직상태 매핑
-        job_status_mapping = {
-            "구직준비중": "구직 준비중",
-            "준비중": "구직 준비중",
-            "구직중": "구직중",
-            "재직중": "재직중",
-            "재직": "재직중",
-        }
+        job_status_data = self._cleared["job"]
 
         for status_name in job_status_names:
             # 매핑된 이름이 있으면 사용, 없으면 그대로 사용
-            search_name = job_status_mapping.get(status_name, status_name)
-
-            found = False
-            for job_status in job_status_data:
-                if search_name == job_status.get("t"):
-                    job_status["s"] = 1
-                    job_status["c"] = 1
-                    job_status["use"] = 1
-                    found = True
-                    print(f"✅ 구직상태 '{job_status.get('t')}' 선택됨")
-                    break
-
-            if not found:
+            search_name = self.JOB_STATUS_MAPPING.get(status_name, status_name)
+
+            index = self._job_status_index.get(search_name)
+            if index is not None:
+                job_status_data, job_status = self._cow_node(job_status_data, (index,))
+                self._set_flags(job_status, ("s", "c", "use"))
+                print(f"✅ 구직상태 '{job_status.get('t')}' 선택됨")
+            else:
                 print(f"⚠️  구직상태 '{status_name}'를 찾을 수 없습니다.")
                 print(f"    사용 가능한 구직상태: 구직 준비중, 구직중, 재직중")
 
+        payload["job"] = job_status_data
+
+    # ==================== payload 생성 ====================
+
+    @staticmethod
+    def filter_key(
+        job_name: Optional[Union[str, List[str]]] = None,
+        areas: Optional[List[str]] = None,
+        education: Optional[List[str]] = None,
+        ages: Optional[Union[int, tuple, List, str]] = None,
+        genders: Optional[List[str]] = None,
+        job_status: Optional[List[str]] = None
+    ) -> tuple:
+        """검색 조건(필터 조합)을 해시 가능한 키로 변환 (리스트/튜플은 같은 키)"""
+        def freeze(value):
+            if isinstance(value, (list, tuple)):
+                return tuple(freeze(v) for v in value)
+            return value
+
+        return tuple(freeze(v) for v in (job_name, areas, education, ages, genders, job_status))
+
+    def clear_cache(self):
+        """검색 조건별 payload/요청 본문 캐시 비우기 (템플릿과 인덱스는 유지)"""
+        with self._lock:
+            self._selection_cache.clear()
+            self._body_cache.clear()
+
+    def compile_selection(self, **filters) -> dict:
+        """
+        검색 조건이 적용된 기본 payload (필터 조합별 1회 생성 후 캐시, 수정 금지)
+
+        Args:
+            **filters: create_payload의 검색 조건 (job_name, areas, education, ages, genders, job_status)
+        """
+        key = self.filter_key(**filters)
+        cached = self._selection_cache.get(key)
+        if cached is not None:
+            return cached
+
+        template = self._load_template()
+        payload = dict(template)
+
+        # 직무 설정
+        if filters.get("job_name"):
+            self._select_job(filters["job_name"], payload)
+
+        # 지역 설정
+        if filters.get("areas"):
+            self._select_areas(filters["areas"], payload)
+
+        # 학력 설정
+        if filters.get("education"):
+            self._select_education(filters["education"], payload)
+
+        # 나이 설정
+        if filters.get("ages"):
+            self._select_ages(filters["ages"], payload)
+
+        # 성별 설정
+        if filters.get("genders"):
+            self._select_gender(filters["genders"], payload)
+
+        # 구직상태 설정
+        if filters.get("job_status"):
+            self._select_job_status(filters["job_status"], payload)
+
+        with self._lock:
+            return self._selection_cache.setdefault(key, payload)
+
     def create_payload(
         self,
         page: int = 1,
@@ -386,33 +489,93 @@ class PayloadManager:
             genders: 성별 리스트 (예: ["남"], ["여"], ["남", "여"])
             job_status: 구직상태 리스트 (예: ["구직중"], ["재직중"], ["구직 준비중", "구직중"])
         """
-        payload = self._load_template()
+        base = self.compile_selection(
+            job_name=job_name,
+            areas=areas,
+            education=education,
+            ages=ages,
+            genders=genders,
+            job_status=job_status
+        )
+
+        payload = dict(base)
         payload["p"] = page
         payload["ps"] = page_size
         payload["saveno"] = saveno  # 🔥 검색 세션 ID 설정
 
-        # 직무 설정
-        if job_name:
-            self._select_job(job_name, payload)
-
-        # 지역 설정
-        if areas:
-            self._select_areas(areas, payload)
+        return payload
 
-        # 학력 설정
-        if education:
-            self._select_education(education, payload)
+    # ==================== 요청 본문 ====================
 
-        # 나이 설정
-        if ages:
-            self._select_ages(ages, payload)
+    def create_search_body(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        saveno: int = 0,
+        **filters
+    ) -> bytes:
+        """
+        검색 요청 본문 생성 (application/x-www-form-urlencoded, searchCondition=...)
 
-        # 성별 설정
-        if genders:
-            self._select_gender(genders, payload)
+        검색 조건별로 JSON 직렬화 + URL 인코딩을 한 번만 하고,
+        페이지마다 바뀌는 p/ps/saveno만 미리 인코딩된 바이트 사이에 끼워 넣습니다.
+        결과는 requests가 {"searchCondition": json.dumps(payload)}를 인코딩한 것과 같습니다.
 
-        # 구직상태 설정
-        if job_status:
-            self._select_job_status(job_status, payload)
+        Args:
+            page: 페이지 번호
+            page_size: 페이지당 결과 수
+            saveno: 검색 세션 ID
+            **filters: 검색 조건 (job_name, areas, education, ages, genders, job_status)
+        """
+        values = {"p": page, "ps": page_size, "saveno": saveno}
+        key = self.filter_key(**filters)
+
+        if key not in self._body_cache:
+            self._body_cache[key] = self._compile_body(self.compile_selection(**filters))
+        compiled = self._body_cache[key]
+
+        # 템플릿을 만들 수 없었거나 정수가 아닌 값이면 전체 직렬화
+        if compiled is None or not all(type(v) is int for v in values.values()):
+            payload = self.create_payload(page, page_size, saveno=saveno, **filters)
+            return self.encode_body(payload)
+
+        segments, fields = compiled
+        parts = [segments[0]]
+        for name, segment in zip(fields, segments[1:]):
+            parts.append(str(values[name]).encode("ascii"))
+            parts.append(segment)
+        return b"".join(parts)
+
+    @staticmethod
+    def encode_body(payload: dict) -> bytes:
+        """payload 전체를 요청 본문으로 인코딩 (requests의 data=dict 인코딩과 동일)"""
+        return urlencode({"searchCondition": json.dumps(payload, ensure_ascii=False)}).encode("ascii")
+
+    def _compile_body(self, base: dict) -> Optional[Tuple[List[bytes], List[str]]]:
+        """
+        페이지 필드 자리에서 나눈 본문 조각 생성
 
-        return payload
+        Returns:
+            (본문 조각 리스트, 조각 사이에 들어갈 필드명 리스트) 또는 None (자리 표시 값이 겹치는 경우)
+        """
+        payload = dict(base)
+        payload.update(self.PAGE_FIELD_PLACEHOLDERS)
+        encoded = self.encode_body(payload)
+
+        positions = []
+        for name, placeholder in self.PAGE_FIELD_PLACEHOLDERS.items():
+            token = str(placeholder).encode("ascii")
+            if encoded.count(token) != 1:
+                return None
+            positions.append((encoded.index(token), name, len(token)))
+        positions.sort()
+
+        segments = []
+        fields = []
+        start = 0
+        for position, name, length in positions:
+            segments.append(encoded[start:position])
+            fields.append(name)
+            start = position + length
+        segments.append(encoded[start:])
+        return segments, fields
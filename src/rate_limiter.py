@@ -0,0 +1,210 @@
+"""
+요청 속도 제한 (토큰 버킷)
+
+검색 API, 로그인, 이력서 추출 요청이 모두 같은 RateLimiter를 거치도록 하여
+고정 지연(time.sleep) 대신 사이트가 허용하는 만큼의 속도로 요청합니다.
+
+- 호스트별 버킷: 같은 호스트로 가는 모든 요청이 공유 (여러 계정 합산)
+- 계정별 버킷: 계정 1개의 요청 속도 제한
+- shared_dir를 지정하면 버킷 상태를 파일(fcntl 잠금)로 공유하여 여러 프로세스가 하나의 한도를 나눠 씀
+  (fcntl이 없는 환경에서는 프로세스 안에서만 공유)
+"""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class TokenBucket:
+    """프로세스 내 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: 초당 충전되는 토큰 수 (= 초당 허용 요청 수)
+            capacity: 최대 토큰 수 (= 연속으로 보낼 수 있는 요청 수)
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 예약하고 기다려야 할 시간(초) 반환
+
+        토큰이 부족하면 잔량을 음수로 만들어 순서를 확보하므로 반환된 시간만큼 기다린 뒤 요청하면 됩니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = _take(self._tokens, now - self._updated, tokens, self.rate, self.capacity)
+            self._updated = now
+            return wait
+
+
+class FileTokenBucket:
+    """파일로 상태를 공유하는 토큰 버킷 (여러 프로세스가 같은 한도 사용)"""
+
+    def __init__(self, path: str, rate: float, capacity: float):
+        """
+        Args:
+            path: 버킷 상태 파일 경로
+            rate: 초당 충전되는 토큰 수
+            capacity: 최대 토큰 수
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """토큰을 예약하고 기다려야 할 시간(초) 반환 (파일 잠금 안에서 갱신)"""
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                raw = os.read(fd, 4096)
+                now = time.time()
+                try:
+                    state = json.loads(raw) if raw else {}
+                except ValueError:
+                    state = {}
+
+                current = state.get("tokens", self.capacity)
+                elapsed = max(0.0, now - state.get("updated", now))
+                current, wait = _take(current, elapsed, tokens, self.rate, self.capacity)
+
+                data = json.dumps({"tokens": current, "updated": now}).encode("utf-8")
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, data)
+                return wait
+            finally:
+                os.close(fd)  # 닫으면 잠금도 해제
+
+
+def _take(current: float, elapsed: float, tokens: float, rate: float, capacity: float) -> Tuple[float, float]:
+    """경과 시간만큼 충전 후 토큰 차감 → (남은 토큰, 기다릴 시간)"""
+    current = min(capacity, current + elapsed * rate) - tokens
+    wait = 0.0 if current >= 0 else -current / rate
+    return current, wait
+
+
+class RateLimiter:
+    """호스트별 + 계정별 토큰 버킷 속도 제한"""
+
+    def __init__(
+        self,
+        host_rate: float = 4.0,
+        host_burst: float = 8,
+        account_rate: float = 1.0,
+        account_burst: float = 3,
+        shared_dir: Optional[str] = None
+    ):
+        """
+        Args:
+            host_rate: 호스트별 초당 요청 수 (모든 계정 합산)
+            host_burst: 호스트별 연속 요청 허용 수
+            account_rate: 계정별 초당 요청 수
+            account_burst: 계정별 연속 요청 허용 수
+            shared_dir: 버킷 상태 공유 디렉토리 (None이면 프로세스 안에서만 공유)
+        """
+        self.host_rate = host_rate
+        self.host_burst = host_burst
+        self.account_rate = account_rate
+        self.account_burst = account_burst
+        self.shared_dir = shared_dir if shared_dir and fcntl is not None else None
+        self._buckets: Dict[Tuple[str, str], object] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.waited = 0.0  # 누적 대기 시간(초)
+
+    def _bucket(self, kind: str, key: str):
+        with self._lock:
+            bucket = self._buckets.get((kind, key))
+            if bucket is None:
+                rate, burst = (self.host_rate, self.host_burst) if kind == "host" else (self.account_rate, self.account_burst)
+                if self.shared_dir:
+                    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+                    bucket = FileTokenBucket(os.path.join(self.shared_dir, f"{kind}_{digest}.json"), rate, burst)
+                else:
+                    bucket = TokenBucket(rate, burst)
+                self._buckets[(kind, key)] = bucket
+            return bucket
+
+    def reserve(self, url: str, account: Optional[str] = None) -> float:
+        """호스트/계정 버킷에서 토큰을 예약하고 기다려야 할 시간(초) 반환"""
+        wait = 0.0
+        host = urlparse(url).netloc
+        if host and self.host_rate > 0:
+            wait = max(wait, self._bucket("host", host).reserve())
+        if account and self.account_rate > 0:
+            wait = max(wait, self._bucket("account", account).reserve())
+
+        with self._lock:
+            self.requests += 1
+            self.waited += wait
+        return wait
+
+    def acquire(self, url: str, account: Optional[str] = None) -> float:
+        """요청 가능할 때까지 대기 (대기한 시간 반환)"""
+        wait = self.reserve(url, account)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str, account: Optional[str] = None) -> float:
+        """요청 가능할 때까지 대기 (비동기)"""
+        wait = self.reserve(url, account)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"requests": self.requests, "waited_sec": round(self.waited, 3)}
+
+
+_shared_limiters: Dict[tuple, RateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter(config=None) -> RateLimiter:
+    """
+    프로세스에서 공유하는 RateLimiter (config의 RATE_LIMIT_* 설정별로 처음 호출할 때 생성)
+
+    같은 프로세스의 모든 계정/클라이언트가 이 인스턴스를 사용해야 호스트별 한도가 합산됩니다.
+    RATE_LIMIT_* 설정이 다른 config는 먼저 만든 한도를 물려받지 않고 자기 설정으로 만든 인스턴스를 사용합니다.
+    """
+    settings = (
+        getattr(config, "RATE_LIMIT_HOST_RATE", 4.0),
+        getattr(config, "RATE_LIMIT_HOST_BURST", 8),
+        getattr(config, "RATE_LIMIT_ACCOUNT_RATE", 1.0),
+        getattr(config, "RATE_LIMIT_ACCOUNT_BURST", 3),
+        getattr(config, "RATE_LIMIT_SHARED_DIR", None),
+    )
+    with _shared_lock:
+        limiter = _shared_limiters.get(settings)
+        if limiter is None:
+            host_rate, host_burst, account_rate, account_burst, shared_dir = settings
+            limiter = RateLimiter(
+                host_rate=host_rate,
+                host_burst=host_burst,
+                account_rate=account_rate,
+                account_burst=account_burst,
+                shared_dir=shared_dir
+            )
+            _shared_limiters[settings] = limiter
+        return limiter
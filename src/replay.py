@@ -0,0 +1,466 @@
+"""
+요청/응답 녹화와 오프라인 재생 (부하 테스트용)
+
+실제 잡코리아에 요청하지 않고 run_all_accounts 전체 흐름(로그인 → 검색 → 이력서)의 처리량을 측정하기 위한 도구입니다.
+
+녹화:
+    config.py에 RECORD_SESSION_PATH = "recordings/session.jsonl.gz"를 설정하고 평소처럼 실행하면
+    공유 연결 풀(src/transport.py)을 거치는 모든 요청/응답이 아카이브에 기록됩니다.
+    (동기 검색, 로그인, 이력서 HTTP 추출. aiohttp 비동기 검색은 기록되지 않음)
+
+    - 쿠키(Cookie/Set-Cookie)와 Authorization 헤더는 값을 지우고 쿠키 이름만 남김
+    - 로그인 비밀번호(M_PWD) 등 form 필드는 값을 지움
+    - 같은 응답 본문은 한 번만 저장하고(SHA-1), 파일 전체를 gzip으로 압축
+
+    아카이브 형식 (gzip JSONL, 한 줄에 하나):
+        {"kind": "body", "id": "<sha1>", "text": "<응답 본문>"}
+        {"kind": "exchange", "method": "POST", "url": ..., "request": {"headers", "body"},
+         "status": 200, "headers": {...}, "body": "<sha1>", "elapsed": 0.31}
+
+재생:
+    ReplayServer는 아카이브(없으면 data/fixtures)의 응답으로 detailsearchajax, Login.asp, 이력서 페이지를 응답합니다.
+    지연 시간, 오류 비율, 검색 결과 페이지 수를 조절할 수 있으므로 운영 규모의 10~100배 요청으로 부하 테스트할 수 있습니다.
+
+    python -m src.replay --archive recordings/session.jsonl.gz --latency 0.2 --error-rate 0.01 --page-count 300
+"""
+import atexit
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests.adapters import BaseAdapter
+from requests.cookies import RequestsCookieJar, extract_cookies_to_jar
+
+from src.stub_server import StubSearchServer
+
+REDACTED_HEADERS = {"authorization", "proxy-authorization"}
+REDACTED_FIELDS = {"M_PWD", "password", "passwd", "pwd"}
+REDACTED = "***"
+
+SEARCH_PATH = "/corp/person/detailsearchajax"
+LOGIN_PATH = "/login/login.asp"
+RESUME_PATH = "/corp/person/find/resume/view"
+DEFAULT_LOGIN_COOKIES = ("JKUID", "jkat", "jkrt")
+
+CARD_PATTERN = re.compile(rb'data-rno="')
+LOGIN_FORM_PAGE = (
+    '<!DOCTYPE html>\n<html lang="ko">\n<body>\n'
+    '<form action="/Login/Login.asp" method="post"><input type="text" name="M_ID"></form>\n'
+    '</body>\n</html>\n'
+).encode("utf-8")
+
+
+# ==================== 녹화 ====================
+
+def _cookie_names(value: str) -> List[str]:
+    """Cookie 헤더 값의 쿠키 이름 목록"""
+    return [pair.split("=", 1)[0].strip() for pair in value.split(";") if "=" in pair]
+
+
+def _redact_headers(headers, cookie_names: Optional[List[str]] = None) -> Dict[str, str]:
+    """쿠키/인증 헤더의 값을 지운 헤더 (쿠키는 이름만 남김)"""
+    redacted = {}
+    for name, value in headers.items():
+        lower = name.lower()
+        if lower == "cookie":
+            redacted[name] = "; ".join(f"{cookie}={REDACTED}" for cookie in _cookie_names(value))
+        elif lower == "set-cookie":
+            redacted[name] = "; ".join(f"{cookie}={REDACTED}" for cookie in cookie_names or ())
+        elif lower in REDACTED_HEADERS:
+            redacted[name] = REDACTED
+        else:
+            redacted[name] = value
+    return redacted
+
+
+def _redact_body(body, content_type: str) -> str:
+    """요청 본문 (form이면 비밀번호 필드의 값을 지움)"""
+    if body is None:
+        return ""
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    if "x-www-form-urlencoded" not in content_type.lower():
+        return body
+    fields = parse_qsl(body, keep_blank_values=True)
+    if not any(name in REDACTED_FIELDS for name, _ in fields):
+        return body  # 미리 인코딩한 검색 본문은 그대로 (재생 시 searchCondition을 다시 파싱)
+    return urlencode([(name, REDACTED if name in REDACTED_FIELDS else value) for name, value in fields])
+
+
+class SessionRecorder:
+    """요청/응답을 gzip JSONL 아카이브에 기록 (스레드 안전, 같은 본문은 한 번만 저장)"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 아카이브 파일 경로 (이미 있으면 덮어씀)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.exchange_count = 0
+        self._file = gzip.open(self.path, "wt", encoding="utf-8")
+        self._body_ids = set()
+        self._lock = threading.Lock()
+        atexit.register(self.close)  # 프로세스가 끝나면 gzip 끝 표시까지 기록
+
+    def record(self, request, response, elapsed: float = 0.0):
+        """requests의 PreparedRequest / Response 1쌍 기록 (elapsed: 응답 시간(초))"""
+        jar = RequestsCookieJar()
+        extract_cookies_to_jar(jar, request, response.raw)
+        content = response.content
+        body_id = hashlib.sha1(content).hexdigest()
+        exchange = {
+            "kind": "exchange",
+            "method": request.method,
+            "url": request.url,
+            "request": {
+                "headers": _redact_headers(request.headers),
+                "body": _redact_body(request.body, request.headers.get("Content-Type", "")),
+            },
+            "status": response.status_code,
+            "headers": _redact_headers(response.headers, list(jar.keys())),
+            "body": body_id,
+            "elapsed": round(elapsed, 4),
+        }
+
+        with self._lock:
+            if self._file.closed:
+                return
+            if body_id not in self._body_ids:
+                self._body_ids.add(body_id)
+                text = content.decode(response.encoding or "utf-8", errors="replace")
+                self._write({"kind": "body", "id": body_id, "text": text})
+            self._write(exchange)
+            self.exchange_count += 1
+
+    def _write(self, entry: Dict):
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+                print(f"📼 요청/응답 {self.exchange_count}건 녹화: {self.path}")
+
+
+class RecordingAdapter(BaseAdapter):
+    """다른 어댑터로 요청을 보내고 요청/응답을 SessionRecorder에 기록하는 requests 어댑터"""
+
+    def __init__(self, adapter: BaseAdapter, recorder: SessionRecorder):
+        super().__init__()
+        self.adapter = adapter
+        self.recorder = recorder
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        response = self.adapter.send(request, **kwargs)
+        try:
+            response.content  # 본문까지 받은 시간을 기록
+            self.recorder.record(request, response, time.perf_counter() - started)
+        except Exception as e:  # 녹화 실패가 수집을 멈추지 않도록
+            print(f"⚠️  요청/응답 녹화 실패 ({type(e).__name__}: {e}): {request.url}")
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+# ==================== 아카이브 읽기 ====================
+
+def _iter_entries(path: str) -> Iterator[Dict]:
+    """아카이브 항목 (녹화 중 종료되어 gzip 끝 표시가 없으면 읽은 곳까지)"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        except (EOFError, json.JSONDecodeError):
+            print(f"⚠️  아카이브가 완전히 기록되지 않았습니다 (읽은 곳까지 사용): {path}")
+
+
+class SessionArchive:
+    """녹화된 아카이브 (요청/응답 목록 + 본문)"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.bodies: Dict[str, bytes] = {}
+        self.exchanges: List[Dict] = []
+        for entry in _iter_entries(path):
+            if entry.get("kind") == "body":
+                self.bodies[entry["id"]] = entry["text"].encode("utf-8")
+            elif entry.get("kind") == "exchange":
+                self.exchanges.append(entry)
+
+    def body(self, exchange: Dict) -> bytes:
+        return self.bodies.get(exchange["body"], b"")
+
+    def find(self, path: str, method: Optional[str] = None) -> List[Dict]:
+        """URL 경로(대소문자 무시)가 path로 시작하는 요청/응답"""
+        path = path.lower()
+        return [
+            exchange for exchange in self.exchanges
+            if urlsplit(exchange["url"]).path.lower().startswith(path)
+            and (method is None or exchange["method"] == method)
+        ]
+
+    def search_pages(self) -> Dict[int, bytes]:
+        """
+        검색 결과 페이지 {페이지 번호: 본문}
+
+        인재 카드가 있는 정상 응답만 사용합니다 (빈 페이지, 오류, 비로그인 응답 제외, 같은 페이지는 마지막 응답).
+        """
+        pages = {}
+        for exchange in self.find(SEARCH_PATH, "POST"):
+            if exchange["status"] != 200 or not CARD_PATTERN.search(self.body(exchange)):
+                continue
+            form = dict(parse_qsl(exchange["request"]["body"]))
+            try:
+                page = int(json.loads(form["searchCondition"]).get("p", 1))
+            except (KeyError, ValueError):
+                continue
+            pages[page] = self.body(exchange)
+        return pages
+
+    def resume_pages(self) -> Dict[str, bytes]:
+        """이력서 페이지 {경로?쿼리(소문자): 본문} (정상 응답만)"""
+        pages = {}
+        for exchange in self.find(RESUME_PATH, "GET"):
+            if exchange["status"] == 200:
+                pages[_resource_key(exchange["url"])] = self.body(exchange)
+        return pages
+
+    def login_cookie_names(self) -> List[str]:
+        """로그인 응답에서 받은 쿠키 이름"""
+        names = []
+        for exchange in self.find(LOGIN_PATH, "POST"):
+            for name, value in exchange["headers"].items():
+                if name.lower() == "set-cookie":
+                    names.extend(cookie for cookie in _cookie_names(value) if cookie not in names)
+        return names
+
+    def summary(self) -> Dict[str, int]:
+        """경로별 요청 수"""
+        return dict(Counter(f"{exchange['method']} {urlsplit(exchange['url']).path}" for exchange in self.exchanges))
+
+
+def _resource_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}".lower()
+
+
+# ==================== 재생 서버 ====================
+
+class ReplayServer(StubSearchServer):
+    """
+    녹화된 응답으로 검색/로그인/이력서 요청에 응답하는 로컬 HTTP 서버
+
+    - 검색: 녹화된 페이지를 page_count 페이지까지 반복해서 응답
+    - 로그인: M_ID/M_PWD가 있으면 로그인 쿠키(녹화된 쿠키 이름, 값은 임의)를 설정
+    - 이력서: 녹화된 경로면 그 응답, 아니면 resume_view*.html 중 하나 (이력서번호별로 항상 같은 파일)
+    - 모든 요청에 latency(+ 0~latency_jitter)초 지연, error_rate 비율로 error_status 응답
+
+    JobKoreaConfig의 API_URL/LOGIN_URL/BASE_URL을 api_url/login_url/url로 덮어쓰면 됩니다.
+    """
+
+    def __init__(
+        self,
+        archive_path: Optional[str] = None,
+        pages_dir: str = "data/fixtures",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        page_count: Optional[int] = None,
+        require_login: bool = False,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            archive_path: 녹화된 아카이브 (None이거나 검색/이력서 응답이 없으면 pages_dir의 픽스처 사용)
+            pages_dir: result_page{N}.html / resume_view{N}.html이 있는 디렉토리
+            latency: 응답 전 지연 시간(초)
+            latency_jitter: 추가 지연 시간 상한(초, 요청마다 0~latency_jitter 무작위)
+            error_rate: 오류로 응답할 요청 비율 (0~1, 로그인 요청 포함)
+            error_status: 오류 응답 상태 코드 (429/5xx면 클라이언트가 재시도)
+            page_count: 결과가 있는 검색 페이지 수 (None이면 녹화된 페이지 수, 넘으면 빈 결과 페이지)
+            require_login: True면 로그인 쿠키 없는 검색/이력서 요청에 로그인 페이지 응답 (세션 만료 재현)
+            seed: 지연/오류 난수 시드 (같으면 같은 순서로 오류 발생)
+        """
+        self.archive = SessionArchive(archive_path) if archive_path else None
+        super().__init__(pages_dir, host=host, port=port, latency=latency)
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.require_login = require_login
+        self.counts: Counter = Counter()  # 경로별 응답 수 (search/login/resume/error/not_found)
+        self._random = random.Random(seed)
+
+        self.resumes = self.archive.resume_pages() if self.archive else {}
+        self._fixture_resumes = [path.read_bytes() for path in sorted(self.pages_dir.glob("resume_view*.html"))]
+        self.login_cookies = (self.archive.login_cookie_names() if self.archive else []) or list(DEFAULT_LOGIN_COOKIES)
+        self._sources = sorted(self.pages)
+        self.page_count = len(self._sources) if page_count is None else page_count
+        self.total_count = sum(
+            len(CARD_PATTERN.findall(self.pages[self._source_page(page)])) for page in range(1, self.page_count + 1)
+        ) if self._sources else 0
+
+    def _load_pages(self) -> Dict[int, bytes]:
+        pages = self.archive.search_pages() if self.archive else {}
+        return pages or super()._load_pages()
+
+
+    @property
+    def login_url(self) -> str:
+        return self.url + "/Login/Login.asp"
+
+    def _source_page(self, page: int) -> int:
+        """요청 페이지에 응답할 녹화 페이지 번호 (녹화 페이지를 순서대로 반복)"""
+        return self._sources[(page - 1) % len(self._sources)]
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        source = self.archive.path if self.archive else self.pages_dir
+        print(f"📼 재생 서버 시작: {self.url} ({source}, 검색 {self.page_count}페이지/{self.total_count}명, "
+              f"이력서 녹화 {len(self.resumes)}개, 지연 {self.latency}+{self.latency_jitter}초, 오류 {self.error_rate:.1%})")
+        return self
+
+    # ---------- 요청 처리 ----------
+
+    def handle(self, handler: BaseHTTPRequestHandler, method: str):
+        # 오류 응답에도 연결을 유지하도록 본문은 먼저 모두 읽음
+        form = self.read_form(handler) if method == "POST" else {}
+        path = handler.path.lower()
+
+        with self._lock:
+            self.request_count += 1
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+            delay = self.latency + (self._random.uniform(0, self.latency_jitter) if self.latency_jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        if failed:
+            self._count("error")
+            self.send(handler, self.error_status, f"replay error {self.error_status}".encode(), content_type="text/plain")
+        elif method == "POST" and path.startswith(SEARCH_PATH):
+            self._search(handler, form)
+        elif method == "POST" and path.startswith(LOGIN_PATH):
+            self._login(handler, form)
+        elif method == "GET" and path.startswith(RESUME_PATH):
+            self._resume(handler)
+        else:
+            self._count("not_found")
+            self.send(handler, 404, b"not found", content_type="text/plain")
+
+    def _count(self, route: str):
+        with self._lock:
+            self.counts[route] += 1
+
+    def _logged_in(self, handler: BaseHTTPRequestHandler) -> bool:
+        cookies = _cookie_names(handler.headers.get("Cookie", ""))
+        return not self.require_login or any(name in cookies for name in self.login_cookies)
+
+    def _search(self, handler: BaseHTTPRequestHandler, form: Dict[str, list]):
+        try:
+            condition = json.loads(form["searchCondition"][0])
+        except (KeyError, ValueError):
+            self._count("not_found")
+            self.send(handler, 400, b"searchCondition missing", content_type="text/plain")
+            return
+        if not self._logged_in(handler):
+            self._count("logged_out")
+            self.send(handler, 200, LOGIN_FORM_PAGE, cache_key="login_form")
+            return
+
+        self._count("search")
+        page = int(condition.get("p", 1))
+        if self._sources and 1 <= page <= self.page_count:
+            source = self._source_page(page)
+            self.send(handler, 200, self.pages[source], cache_key=source)
+        else:
+            self.send(handler, 200, self.page_body(0, int(condition.get("saveno", 0))))
+
+    def _login(self, handler: BaseHTTPRequestHandler, form: Dict[str, list]):
+        self._count("login")
+        username = (form.get("M_ID") or [""])[0]
+        if not username or not (form.get("M_PWD") or [""])[0]:
+            body = "<script>alert('아이디 또는 비밀번호를 확인하세요');</script>".encode("utf-8")
+            self.send(handler, 200, body)
+            return
+
+        token = f"replay-{username}-{self._random.getrandbits(32):08x}"
+        headers = [("Set-Cookie", f"{name}={token}; Path=/") for name in self.login_cookies]
+        self.send(handler, 200, b"<html><body>ok</body></html>", headers=headers)
+
+    def _resume(self, handler: BaseHTTPRequestHandler):
+        if not self._logged_in(handler):
+            self._count("logged_out")
+            self.send(handler, 200, LOGIN_FORM_PAGE, cache_key="login_form")
+            return
+
+        key = handler.path.lower()
+        body = self.resumes.get(key)
+        if body is None and self._fixture_resumes:
+            index = zlib.crc32(key.encode()) % len(self._fixture_resumes)
+            key, body = f"resume_view{index}", self._fixture_resumes[index]
+        if body is None:
+            self._count("not_found")
+            self.send(handler, 404, b"not found", content_type="text/plain")
+            return
+
+        self._count("resume")
+        self.send(handler, 200, body, cache_key=key)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="녹화된 요청/응답으로 검색/로그인/이력서 요청에 응답하는 재생 서버")
+    arg_parser.add_argument("--archive", help="녹화된 아카이브 (없으면 --pages-dir의 픽스처)")
+    arg_parser.add_argument("--pages-dir", default="data/fixtures")
+    arg_parser.add_argument("--port", type=int, default=8765)
+    arg_parser.add_argument("--latency", type=float, default=0.0)
+    arg_parser.add_argument("--latency-jitter", type=float, default=0.0)
+    arg_parser.add_argument("--error-rate", type=float, default=0.0)
+    arg_parser.add_argument("--error-status", type=int, default=503)
+    arg_parser.add_argument("--page-count", type=int)
+    arg_parser.add_argument("--require-login", action="store_true")
+    arg_parser.add_argument("--seed", type=int)
+    arg_parser.add_argument("--summary", action="store_true", help="아카이브의 경로별 요청 수만 출력")
+    args = arg_parser.parse_args()
+
+    if args.summary:
+        if not args.archive:
+            arg_parser.error("--summary에는 --archive가 필요합니다")
+        for route, count in sorted(SessionArchive(args.archive).summary().items()):
+            print(f"{count:6d}  {route}")
+        raise SystemExit(0)
+
+    replay = ReplayServer(
+        args.archive,
+        args.pages_dir,
+        port=args.port,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        page_count=args.page_count,
+        require_login=args.require_login,
+        seed=args.seed
+    ).start()
+    try:
+        replay._thread.join()
+    except KeyboardInterrupt:
+        replay.stop()
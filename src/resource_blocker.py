@@ -0,0 +1,163 @@
+"""
+Playwright 리소스 차단
+
+이력서 추출은 본문 영역(div.base)의 텍스트만 읽으므로 이미지, 폰트, 광고/분석 스크립트 같은
+리소스는 받을 필요가 없습니다. 요청을 가로채서 리소스 종류와 도메인 허용 목록으로 걸러냅니다.
+
+- block_types: 받지 않을 리소스 종류 (image, media, font, stylesheet 등 Playwright resource_type)
+- allowed_domains: 이 도메인(하위 도메인 포함)의 요청만 허용 (None이면 도메인으로 거르지 않음)
+  메인 프레임 이동(document)은 도메인과 관계없이 허용
+
+차단한 리소스는 실제로 받지 않으므로 절약한 바이트는 같은 종류의 리소스를 받았을 때의 평균 크기로 추정합니다.
+"""
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+# 한 번도 받아 본 적 없는 종류의 리소스 크기 추정값(바이트)
+DEFAULT_RESOURCE_SIZES = {
+    "image": 30_000,
+    "media": 200_000,
+    "font": 40_000,
+    "script": 50_000,
+    "stylesheet": 20_000,
+}
+DEFAULT_RESOURCE_SIZE = 10_000
+
+
+class PageResourceStats:
+    """탭 1개(또는 컨텍스트 전체)의 요청 통계"""
+
+    def __init__(self):
+        self.allowed = 0
+        self.blocked = 0
+        self.bytes_loaded = 0
+        self.bytes_saved = 0  # 추정값
+        self.blocked_by_type: Dict[str, int] = {}
+
+    def as_dict(self) -> Dict:
+        return {
+            "allowed": self.allowed,
+            "blocked": self.blocked,
+            "bytes_loaded": self.bytes_loaded,
+            "bytes_saved_estimate": self.bytes_saved,
+            "blocked_by_type": dict(self.blocked_by_type),
+        }
+
+
+class ResourceBlocker:
+    """리소스 종류/도메인 허용 목록으로 Playwright 요청 차단 (동기/비동기 API 모두 지원)"""
+
+    def __init__(self, block_types: Iterable[str] = ("image", "media", "font"), allowed_domains: Optional[Iterable[str]] = None):
+        """
+        Args:
+            block_types: 받지 않을 리소스 종류
+            allowed_domains: 허용할 도메인 목록 (None이면 도메인으로 거르지 않음)
+        """
+        self.block_types = frozenset(block_types or ())
+        self.allowed_domains = tuple(d.lower().lstrip(".") for d in allowed_domains) if allowed_domains else None
+        self.total = PageResourceStats()
+        self._pages: Dict[int, PageResourceStats] = {}
+        self._observed_sizes: Dict[str, list] = {}  # 종류별 [누적 바이트, 개수]
+
+    @classmethod
+    def from_config(cls, config, profile: str = "resume") -> Optional["ResourceBlocker"]:
+        """
+        config.RESOURCE_BLOCKING[profile] 설정으로 생성 (설정이 없으면 None → 차단 안 함)
+
+        예: {"resume": {"block_types": ["image", "font"], "allowed_domains": ["jobkorea.co.kr"]}}
+        """
+        settings = (getattr(config, "RESOURCE_BLOCKING", None) or {}).get(profile)
+        if not settings:
+            return None
+        return cls(settings.get("block_types", ()), settings.get("allowed_domains"))
+
+    def should_block(self, resource_type: str, url: str, is_main_frame_navigation: bool = False) -> bool:
+        """요청을 차단할지 판단"""
+        if is_main_frame_navigation:
+            return False
+        if resource_type in self.block_types:
+            return True
+        if self.allowed_domains is not None:
+            host = (urlparse(url).hostname or "").lower()
+            if host and not any(host == d or host.endswith("." + d) for d in self.allowed_domains):
+                return True
+        return False
+
+    def _decide(self, page_key: int, request) -> bool:
+        """요청 1개 판단 후 통계 기록 (차단하면 True)"""
+        resource_type = request.resource_type
+        try:
+            main_navigation = request.is_navigation_request() and request.frame.parent_frame is None
+        except Exception:  # 서비스 워커 요청은 frame이 없음
+            main_navigation = False
+        block = self.should_block(resource_type, request.url, main_navigation)
+
+        for stats in (self.total, self._pages.setdefault(page_key, PageResourceStats())):
+            if block:
+                stats.blocked += 1
+                stats.bytes_saved += self._estimated_size(resource_type)
+                stats.blocked_by_type[resource_type] = stats.blocked_by_type.get(resource_type, 0) + 1
+            else:
+                stats.allowed += 1
+        return block
+
+    def _record_loaded(self, page_key: int, resource_type: str, size: int):
+        for stats in (self.total, self._pages.setdefault(page_key, PageResourceStats())):
+            stats.bytes_loaded += size
+        observed = self._observed_sizes.setdefault(resource_type, [0, 0])
+        observed[0] += size
+        observed[1] += 1
+
+    def _estimated_size(self, resource_type: str) -> int:
+        total, count = self._observed_sizes.get(resource_type, (0, 0))
+        if count:
+            return total // count
+        return DEFAULT_RESOURCE_SIZES.get(resource_type, DEFAULT_RESOURCE_SIZE)
+
+    def take_page_stats(self, page) -> PageResourceStats:
+        """탭의 통계를 반환하고 초기화 (이력서 1개 처리 후 호출)"""
+        return self._pages.pop(id(page), PageResourceStats())
+
+    # ---------- 비동기 API (playwright.async_api) ----------
+
+    async def attach_async(self, target):
+        """Page 또는 BrowserContext에 차단 규칙 연결 (비동기 API)"""
+        key = id(target)
+
+        async def handle(route):
+            if self._decide(key, route.request):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        async def on_finished(request):
+            sizes = await request.sizes()
+            self._record_loaded(key, request.resource_type, sizes["responseBodySize"] + sizes["responseHeadersSize"])
+
+        await target.route("**/*", handle)
+        target.on("requestfinished", on_finished)
+
+    # ---------- 동기 API (playwright.sync_api) ----------
+
+    def attach(self, target):
+        """Page 또는 BrowserContext에 차단 규칙 연결 (동기 API)"""
+        key = id(target)
+
+        def handle(route):
+            if self._decide(key, route.request):
+                route.abort()
+            else:
+                route.continue_()
+
+        def on_finished(request):
+            sizes = request.sizes()
+            self._record_loaded(key, request.resource_type, sizes["responseBodySize"] + sizes["responseHeadersSize"])
+
+        target.route("**/*", handle)
+        target.on("requestfinished", on_finished)
+
+    def print_summary(self, label: str = "리소스"):
+        stats = self.total.as_dict()
+        by_type = ", ".join(f"{name} {count}" for name, count in sorted(stats["blocked_by_type"].items()))
+        print(f"🚫 {label} 차단 {stats['blocked']}개 ({by_type or '-'}), 허용 {stats['allowed']}개")
+        print(f"   받은 용량 {stats['bytes_loaded'] / 1024:.0f}KB, 절약 약 {stats['bytes_saved_estimate'] / 1024:.0f}KB (추정)")
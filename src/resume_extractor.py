@@ -0,0 +1,199 @@
+"""
+이력서 상세(자기소개서/경력/학력/자격증/어학) 추출
+
+브라우저 탭 N개가 큐에서 이력서 링크를 하나씩 꺼내 동시에 처리합니다.
+- 고정 대기(time.sleep) 대신 모든 이력서에 있는 본문 영역(div.base)이 나타날 때까지만 대기
+  (자기소개서 영역이 없으면 기다리지 않고 '없음'으로 추출)
+- 탭별 실패 허용 횟수를 넘으면 그 탭은 중단하고 나머지 탭이 계속 처리
+- 페이지 HTML은 한 번만 가져와 ResumeParser로 모든 영역을 한 번에 파싱
+- 실패한 이력서는 다른 탭에서 한 번 더 시도
+- 이력서별 소요 시간 백분위수와 전체 처리량 집계 (LatencyStats)
+- 리소스 차단(ResourceBlocker) 사용 시 이력서별 차단 요청 수/절약 용량(추정) 출력
+"""
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+except ImportError:  # HTML 추출 함수만 사용할 때는 필요 없음
+    PlaywrightTimeoutError = asyncio.TimeoutError
+
+from src.metrics import LatencyStats
+from src.rate_limiter import RateLimiter
+from src.resource_blocker import PageResourceStats, ResourceBlocker
+from src.resume_parser import ResumeDetail, parse_resume_detail
+
+RESUME_READY_SELECTOR = "div.base"  # 자기소개서가 없는 이력서에도 있는 본문 영역
+
+
+def extract_resume_detail(html: str) -> Dict:
+    """이력서 HTML을 한 번 파싱하여 자기소개서/경력/학력/자격증/어학 추출"""
+    return parse_resume_detail(html).to_dict()
+
+
+class ResumeWorkerPool:
+    """브라우저 탭 여러 개로 이력서 상세를 동시에 추출 (Playwright async API)"""
+
+    def __init__(
+        self,
+        context,
+        workers: int = 4,
+        rate_limiter: Optional[RateLimiter] = None,
+        account: Optional[str] = None,
+        ready_selector: str = RESUME_READY_SELECTOR,
+        ready_timeout: float = 10.0,
+        goto_timeout: float = 30.0,
+        failure_budget: int = 5,
+        max_attempts: int = 2,
+        resource_blocker: Optional[ResourceBlocker] = None
+    ):
+        """
+        Args:
+            context: Playwright BrowserContext (로그인 쿠키가 들어 있는 컨텍스트)
+            workers: 동시에 사용할 탭 수
+            rate_limiter: 요청 속도 제한 (None이면 제한 없음)
+            account: 속도 제한에 사용할 계정명
+            ready_selector: 이 요소가 나타나면 렌더링 완료로 판단
+            ready_timeout: ready_selector 대기 시간(초), 지나면 그때까지 받은 HTML로 추출
+            goto_timeout: 페이지 이동 제한 시간(초)
+            failure_budget: 탭 1개가 허용하는 실패 횟수 (넘으면 그 탭은 중단)
+            max_attempts: 이력서 1개당 최대 시도 횟수
+            resource_blocker: 탭마다 연결할 리소스 차단 규칙 (None이면 모든 리소스를 받음)
+        """
+        self.context = context
+        self.workers = max(1, workers)
+        self.rate_limiter = rate_limiter
+        self.account = account
+        self.ready_selector = ready_selector
+        self.ready_timeout = ready_timeout
+        self.goto_timeout = goto_timeout
+        self.failure_budget = max(1, failure_budget)
+        self.max_attempts = max(1, max_attempts)
+        self.resource_blocker = resource_blocker
+        self.latency = LatencyStats()
+
+    async def run(self, resumes: List[Dict]) -> List[Dict]:
+        """
+        모든 이력서 처리 후 결과 반환 (입력 순서 유지)
+
+        각 결과는 원래 이력서 데이터에 ResumeDetail.to_dict()의 영역들과 추출상태를 더한 딕셔너리입니다.
+        """
+        self.latency = LatencyStats()
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, resume in enumerate(resumes):
+            queue.put_nowait((index, resume, 1))
+
+        results: Dict[int, Dict] = {}
+        await asyncio.gather(*(
+            self._worker(worker_id, queue, results, len(resumes))
+            for worker_id in range(1, min(self.workers, len(resumes)) + 1)
+        ))
+
+        # 모든 탭이 중단되어 남은 이력서는 실패로 기록
+        while not queue.empty():
+            index, resume, _ = queue.get_nowait()
+            results[index] = self._failed(resume, "처리할 탭 없음 (모든 탭이 실패 허용 횟수 초과)")
+            self.latency.record_failure()
+
+        return [results[index] for index in range(len(resumes))]
+
+    async def _worker(self, worker_id: int, queue: asyncio.Queue, results: Dict[int, Dict], total: int):
+        """탭 1개: 큐에서 이력서를 꺼내 처리 (실패 허용 횟수를 넘으면 중단)"""
+        page = await self.context.new_page()
+        if self.resource_blocker is not None:
+            await self.resource_blocker.attach_async(page)
+        failures = 0
+        try:
+            while True:
+                try:
+                    index, resume, attempt = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                name = resume.get('이름', 'Unknown')
+                link = resume.get('이력서링크')
+                try:
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.acquire_async(link, account=self.account)
+                    if self.resource_blocker is not None:
+                        self.resource_blocker.take_page_stats(page)  # 이전 이력서에서 늦게 끝난 요청 제외
+                    started = time.perf_counter()
+                    detail = await self._extract(page, link)
+                except Exception as e:
+                    failures += 1
+                    if attempt < self.max_attempts:
+                        print(f"   ❌ [탭{worker_id}] {name} 오류: {e} - 다시 시도 대기열에 추가")
+                        queue.put_nowait((index, resume, attempt + 1))
+                    else:
+                        print(f"   ❌ [탭{worker_id}] {name} 오류: {e}")
+                        results[index] = self._failed(resume, str(e))
+                        self.latency.record_failure()
+
+                    if failures >= self.failure_budget:
+                        print(f"🛑 [탭{worker_id}] 실패 {failures}회 - 이 탭은 중단합니다")
+                        return
+                    continue
+
+                elapsed = time.perf_counter() - started
+                self.latency.record(elapsed)
+                resources = self.resource_blocker.take_page_stats(page) if self.resource_blocker is not None else None
+                results[index] = {**resume, **detail, "추출상태": "성공"}
+                self._print_result(worker_id, len(results), total, resume, detail, elapsed, resources)
+        finally:
+            await page.close()
+
+    async def _extract(self, page, link: str) -> Dict:
+        """이력서 페이지 이동 → 본문 영역 대기 → HTML 추출 (파싱은 스레드에서)"""
+        await page.goto(link, wait_until='domcontentloaded', timeout=self.goto_timeout * 1000)
+        try:
+            await page.wait_for_selector(self.ready_selector, timeout=self.ready_timeout * 1000)
+        except PlaywrightTimeoutError:
+            pass  # 본문이 끝내 나타나지 않은 페이지 (받은 HTML로 추출, 없는 영역은 빈 값)
+
+        html = await page.content()
+        return await asyncio.get_running_loop().run_in_executor(None, extract_resume_detail, html)
+
+    @staticmethod
+    def _failed(resume: Dict, error: str) -> Dict:
+        return {
+            **resume,
+            **ResumeDetail().to_dict(),
+            "추출상태": f"오류: {error}"
+        }
+
+    @staticmethod
+    def _print_result(
+        worker_id: int, done: int, total: int, resume: Dict, detail: Dict,
+        elapsed: float, resources: Optional[PageResourceStats] = None
+    ):
+        intro_data = detail["자기소개서"]
+        cert_data = detail["자격증"]
+
+        lines = [f"[{done}/{total}] [탭{worker_id}] {resume.get('이름', 'Unknown')} (rNo={resume.get('이력서번호')})"]
+        if resources is not None:
+            lines.append(
+                f"   ⏱️  {elapsed:.2f}초, 요청 {resources.allowed}개 ({resources.bytes_loaded / 1024:.0f}KB), "
+                f"차단 {resources.blocked}개 (약 {resources.bytes_saved / 1024:.0f}KB 절약)"
+            )
+        else:
+            lines.append(f"   ⏱️  {elapsed:.2f}초")
+        if intro_data:
+            lines.append(f"   ✅ 자기소개서 {len(intro_data)}개 추출")
+            if intro_data[0]['body_text']:
+                lines.append(f"   📝 {intro_data[0]['body_text'][:100]}...")
+        else:
+            lines.append(f"   ⚠️  자기소개서 없음")
+
+        if cert_data:
+            cert_names = [c['자격증명'] for c in cert_data[:3]]
+            lines.append(f"   ✅ 자격증 {len(cert_data)}개 추출")
+            lines.append(f"   🏆 {', '.join(cert_names)}{'...' if len(cert_data) > 3 else ''}")
+        else:
+            lines.append(f"   ⚠️  자격증 없음")
+
+        others = [f"{key} {len(detail[key])}개" for key in ("경력상세", "학력상세", "어학") if detail.get(key)]
+        if others:
+            lines.append(f"   📋 {', '.join(others)}")
+
+        print("\n".join(lines) + "\n")
@@ -0,0 +1,135 @@
+"""
+브라우저 없이 이력서 상세 가져오기
+
+로그인 세션(requests)으로 이력서링크 페이지를 직접 요청하고 HTML을 한 번만 파싱합니다(ResumeParser).
+서버에서 렌더링된 이력서(div.base 영역이 있는 HTML)만 여기서 처리하고,
+렌더링되지 않았거나 요청에 실패한 이력서는 브라우저(ResumeWorkerPool)로 넘깁니다.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from src.auth import JobKoreaAuth
+from src.metrics import LatencyStats
+from src.rate_limiter import RateLimiter
+from src.resume_parser import parse_resume_detail
+
+DOCUMENT_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+
+class ResumeFetcher:
+    """로그인 세션으로 이력서 페이지를 직접 요청하여 이력서 상세 추출"""
+
+    def __init__(
+        self,
+        session: requests.Session,
+        rate_limiter: Optional[RateLimiter] = None,
+        account: Optional[str] = None,
+        timeout=(5.0, 30.0),
+        relogin: Optional[Callable[[], bool]] = None
+    ):
+        """
+        Args:
+            session: 로그인된 세션 (JobKoreaAuth.login 결과)
+            rate_limiter: 요청 속도 제한 (None이면 제한 없음)
+            account: 속도 제한에 사용할 계정명
+            timeout: 요청 제한 시간 (초 또는 (연결, 응답) 튜플)
+            relogin: 비로그인 응답일 때 호출할 재로그인 함수 (session의 쿠키를 갱신하고 성공 여부 반환)
+        """
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self.account = account
+        self.timeout = timeout
+        self.relogin = relogin
+        self.latency = LatencyStats()
+        self._relogin_lock = threading.Lock()
+        self._login_generation = 0  # 재로그인할 때마다 증가 (동시 요청의 중복 재로그인 방지)
+
+    def fetch(self, link: str) -> Optional[Dict]:
+        """
+        이력서 1개 추출
+
+        Returns:
+            ResumeDetail.to_dict() (서버에서 렌더링되지 않았거나 요청에 실패하면 None → 브라우저로 처리)
+        """
+        started = time.perf_counter()
+        try:
+            generation = self._login_generation
+            response = self._get(link)
+            if JobKoreaAuth.is_logged_out(response.status_code, response.url, response.text) and self._relogin(generation):
+                response = self._get(link)
+        except requests.RequestException as e:
+            print(f"   ⚠️  HTTP 요청 실패 ({type(e).__name__}) - 브라우저로 처리: {link}")
+            self.latency.record_failure()
+            return None
+
+        if not response.ok or JobKoreaAuth.is_logged_out(response.status_code, response.url, response.text):
+            print(f"   ⚠️  HTTP {response.status_code} - 브라우저로 처리: {link}")
+            self.latency.record_failure()
+            return None
+
+        detail = self.parse(response.text)
+        if detail is None:
+            print(f"   ⚠️  서버에서 렌더링되지 않은 이력서 - 브라우저로 처리: {link}")
+            self.latency.record_failure()
+            return None
+
+        self.latency.record(time.perf_counter() - started)
+        return detail
+
+    @staticmethod
+    def parse(html: str) -> Optional[Dict]:
+        """이력서 HTML을 한 번 파싱하여 추출 (본문 영역(div.base)이 없는, 스크립트로 그리는 페이지면 None)"""
+        detail = parse_resume_detail(html)
+        return detail.to_dict() if detail.rendered else None
+
+    def fetch_all(self, resumes: List[Dict], workers: int = 8) -> Tuple[Dict[int, Dict], List[int]]:
+        """
+        여러 이력서를 스레드 workers개로 동시에 추출
+
+        Returns:
+            ({입력 순서: 결과}, 브라우저로 처리해야 할 입력 순서 리스트)
+        """
+        self.latency = LatencyStats()
+
+        def fetch_one(index: int) -> Tuple[int, Optional[Dict]]:
+            return index, self.fetch(resumes[index].get('이력서링크'))
+
+        results: Dict[int, Dict] = {}
+        fallback: List[int] = []
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="resume") as executor:
+            for index, detail in executor.map(fetch_one, range(len(resumes))):
+                if detail is None:
+                    fallback.append(index)
+                else:
+                    results[index] = {**resumes[index], **detail, "추출상태": "성공"}
+
+        return results, fallback
+
+    def _get(self, link: str) -> requests.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(link, account=self.account)
+        return self.session.get(link, headers=DOCUMENT_HEADERS, timeout=self.timeout)
+
+    def _relogin(self, generation: int) -> bool:
+        """
+        세션 만료 시 다시 로그인
+
+        같은 세션(generation)으로 만료 응답을 받은 스레드들은 한 번만 재로그인하고,
+        그 뒤에 세션이 다시 만료되면 새로 로그인합니다.
+        """
+        if self.relogin is None:
+            return False
+        with self._relogin_lock:
+            if generation != self._login_generation:
+                return True  # 다른 스레드가 이미 재로그인함
+            if not self.relogin():
+                return False
+            self._login_generation += 1
+            return True
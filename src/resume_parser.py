@@ -0,0 +1,234 @@
+"""
+이력서 상세 파싱 (자기소개서/경력/학력/자격증/어학)
+
+이력서 HTML을 한 번만 파싱하여 모든 영역을 ResumeDetail 1개로 추출합니다.
+HTML 백엔드는 검색 결과 파싱과 같은 parser_engines를 사용합니다.
+- "lxml": 문서 전체를 libxml2로 파싱 + 미리 컴파일한 XPath (빠름)
+- "bs4":  본문 영역(div.base)만 BeautifulSoup으로 파싱 + CSS 선택자 (대체용)
+
+영역과 항목 선택자는 SECTION_FIELDS 한 곳에서 관리하고, lxml용 XPath는 같은 CSS 선택자에서 만듭니다.
+두 엔진은 같은 입력에 대해 같은 결과를 반환해야 합니다 (benchmarks/bench_resume_parser.py에서 확인).
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from src.parser_engines import get_engine
+
+# bs4 엔진: 이력서 본문 영역(div.base)만 트리로 만들어 파싱 시간 단축 (파싱 중에는 class가 나뉘기 전이라 정규식으로 비교)
+RESUME_SECTIONS = SoupStrainer("div", class_=re.compile(r"(^|\s)base(\s|$)"))
+
+# 영역별 (div.base의 두 번째 클래스, 항목 선택자, {필드: 항목 안의 선택자}, 필수 필드)
+SECTION_FIELDS = {
+    "careers": ("career", "div.list-career div.item", {
+        "기간": "div.date",
+        "회사명": "div.content-header div.name",
+        "부서": "div.content-header div.line",
+        "직급": "div.content-header div.position",
+        "담당업무": "div.content-body div.description",
+    }, "회사명"),
+    "educations": ("education", "div.list-education div.item", {
+        "기간": "div.date",
+        "학교명": "div.content-header div.name",
+        "전공": "div.content-header div.line",
+        "학위": "div.content-header div.degree",
+    }, "학교명"),
+    "certificates": ("certificate", "div.list-certificate div.item", {
+        "취득일": "div.date",
+        "자격증명": "div.content-header div.name",
+        "발행기관": "div.content-header div.agency",
+    }, "자격증명"),
+    "languages": ("language", "div.list-language div.item", {
+        "취득일": "div.date",
+        "외국어": "div.content-header div.name",
+        "시험명": "div.content-header div.exam",
+        "점수": "div.content-header div.score",
+    }, "외국어"),
+}
+
+# 자기소개서는 본문을 줄 단위로 읽으므로 따로 처리
+INTRODUCTION_CLASS = "introduction"
+INTRODUCTION_ITEMS = "ul.list-introduction > li.item"
+INTRODUCTION_TITLE = "div.header"
+INTRODUCTION_BODIES = ("div.content#pfl_original", "div.content")
+INTRODUCTION_PREFIX = "- 자기소개서-"
+
+# 결과 딕셔너리 키 (검색 결과의 경력/학력 요약과 겹치지 않도록 상세 영역은 "~상세")
+RESULT_KEYS = {
+    "introductions": "자기소개서",
+    "careers": "경력상세",
+    "educations": "학력상세",
+    "certificates": "자격증",
+    "languages": "어학",
+}
+
+_COMPOUND = re.compile(r"^([a-zA-Z][\w-]*)?((?:[.#][\w-]+)*)$")
+
+
+def _cls(name: str) -> str:
+    """CSS 클래스 선택자(.name)에 대응하는 XPath 조건"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def css_to_xpath(selector: str, prefix: str = ".//") -> str:
+    """
+    SECTION_FIELDS에서 쓰는 단순 CSS 선택자를 XPath로 변환
+
+    지원: 태그, .클래스, #아이디, 하위(공백)/자식(>) 결합자
+    """
+    parts = []
+    axis = prefix
+    for token in selector.replace(">", " > ").split():
+        if token == ">":
+            axis = "/"
+            continue
+        match = _COMPOUND.match(token)
+        if not match:
+            raise ValueError(f"지원하지 않는 선택자: {selector}")
+        tag, rest = match.groups()
+        conditions = []
+        for kind, name in re.findall(r"([.#])([\w-]+)", rest):
+            conditions.append(_cls(name) if kind == "." else f"@id='{name}'")
+        step = (tag or "*") + "".join(f"[{c}]" for c in conditions)
+        parts.append(axis + step)
+        axis = "//"
+    return "".join(parts)
+
+
+@dataclass
+class ResumeDetail:
+    """이력서 1개의 상세 정보"""
+    introductions: List[Dict] = field(default_factory=list)  # {"index", "title", "body_text"}
+    careers: List[Dict] = field(default_factory=list)        # {"기간", "회사명", "부서", "직급", "담당업무"}
+    educations: List[Dict] = field(default_factory=list)     # {"기간", "학교명", "전공", "학위"}
+    certificates: List[Dict] = field(default_factory=list)   # {"취득일", "자격증명", "발행기관"}
+    languages: List[Dict] = field(default_factory=list)      # {"취득일", "외국어", "시험명", "점수"}
+    rendered: bool = False  # 본문 영역(div.base)이 HTML에 있었는지 (False면 스크립트로 그리는 페이지)
+
+    def to_dict(self) -> Dict[str, Optional[List[Dict]]]:
+        """{"자기소개서", "경력상세", "학력상세", "자격증", "어학"} (없는 영역은 None)"""
+        return {key: getattr(self, name) or None for name, key in RESULT_KEYS.items()}
+
+
+class ResumeParser:
+    """이력서 HTML → ResumeDetail (한 번만 파싱)"""
+
+    def __init__(self, engine: str = "auto"):
+        """
+        Args:
+            engine: HTML 파싱 엔진 ("lxml", "bs4", "auto" - lxml이 없으면 bs4)
+        """
+        self.engine = get_engine(engine)
+        if self.engine.name == "lxml":
+            from lxml import etree
+
+            self._xpaths = {
+                name: (
+                    etree.XPath(f"(//div[{_cls('base')} and {_cls(section_class)}])[1]"),
+                    etree.XPath(css_to_xpath(items)),
+                    {key: etree.XPath(f"({css_to_xpath(selector)})[1]") for key, selector in fields.items()},
+                )
+                for name, (section_class, items, fields, _) in SECTION_FIELDS.items()
+            }
+            self._base = etree.XPath(f"(//div[{_cls('base')}])[1]")
+            self._intro = etree.XPath(f"(//div[{_cls('base')} and {_cls(INTRODUCTION_CLASS)}])[1]")
+            self._intro_items = etree.XPath(css_to_xpath(INTRODUCTION_ITEMS))
+            self._intro_title = etree.XPath(f"({css_to_xpath(INTRODUCTION_TITLE)})[1]")
+            self._intro_bodies = [etree.XPath(f"({css_to_xpath(selector)})[1]") for selector in INTRODUCTION_BODIES]
+
+    def parse(self, html: str) -> ResumeDetail:
+        """이력서 HTML 1개 파싱"""
+        if not html or not html.strip():
+            return ResumeDetail()
+        if self.engine.name == "lxml":
+            return self._parse_lxml(html)
+        return self._parse_bs4(html)
+
+    # ---------- lxml ----------
+
+    def _parse_lxml(self, html: str) -> ResumeDetail:
+        doc = self.engine.parse(html)
+        detail = ResumeDetail(rendered=bool(self._base(doc)))
+        if not detail.rendered:
+            return detail
+
+        for name, (section_xpath, items_xpath, field_xpaths) in self._xpaths.items():
+            section = section_xpath(doc)
+            if not section:
+                continue
+            required = SECTION_FIELDS[name][3]
+            for item in items_xpath(section[0]):
+                row = {}
+                for key, xpath in field_xpaths.items():
+                    found = xpath(item)
+                    row[key] = self.engine.text(found[0]) or None if found else None
+                if row[required]:
+                    getattr(detail, name).append(row)
+
+        intro = self._intro(doc)
+        if intro:
+            for index, item in enumerate(self._intro_items(intro[0]), 1):
+                title = self._intro_title(item)
+                body = next((found[0] for found in (xpath(item) for xpath in self._intro_bodies) if found), None)
+                detail.introductions.append(self._introduction(
+                    index,
+                    self.engine.text(title[0]) if title else None,
+                    self.engine.text_lines(body) if body is not None else None
+                ))
+        return detail
+
+    # ---------- bs4 ----------
+
+    def _parse_bs4(self, html: str) -> ResumeDetail:
+        soup = parse_resume_sections(html)
+        detail = ResumeDetail(rendered=soup.select_one("div.base") is not None)
+        if not detail.rendered:
+            return detail
+
+        for name, (section_class, items, fields, required) in SECTION_FIELDS.items():
+            section = soup.select_one(f"div.base.{section_class}")
+            if section is None:
+                continue
+            for item in section.select(items):
+                row = {}
+                for key, selector in fields.items():
+                    elem = item.select_one(selector)
+                    row[key] = elem.get_text(strip=True) or None if elem is not None else None
+                if row[required]:
+                    getattr(detail, name).append(row)
+
+        intro = soup.select_one(f"div.base.{INTRODUCTION_CLASS}")
+        if intro is not None:
+            for index, item in enumerate(intro.select(INTRODUCTION_ITEMS), 1):
+                title = item.select_one(INTRODUCTION_TITLE)
+                body = next((found for found in (item.select_one(s) for s in INTRODUCTION_BODIES) if found is not None), None)
+                detail.introductions.append(self._introduction(
+                    index,
+                    title.get_text(strip=True) if title is not None else None,
+                    body.get_text(separator="\n", strip=True) if body is not None else None
+                ))
+        return detail
+
+    @staticmethod
+    def _introduction(index: int, title: Optional[str], body_text: Optional[str]) -> Dict:
+        if body_text and body_text.startswith(INTRODUCTION_PREFIX):
+            body_text = body_text.replace(INTRODUCTION_PREFIX, "", 1).strip()
+        return {"index": index, "title": title or None, "body_text": body_text or None}
+
+
+def parse_resume_sections(html: str) -> BeautifulSoup:
+    """이력서 HTML에서 본문 영역(div.base)만 파싱 (bs4 엔진)"""
+    return BeautifulSoup(html, 'html.parser', parse_only=RESUME_SECTIONS)
+
+
+_default_parser: Optional[ResumeParser] = None
+
+
+def parse_resume_detail(html: str) -> ResumeDetail:
+    """기본 엔진(auto)으로 이력서 HTML 파싱 (파서는 한 번만 생성)"""
+    global _default_parser
+    if _default_parser is None:
+        _default_parser = ResumeParser()
+    return _default_parser.parse(html)
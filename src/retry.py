@@ -0,0 +1,157 @@
+"""
+검색 요청 재시도 / 서킷 브레이커
+
+- RetryPolicy: 일시적인 오류(연결 실패, 타임아웃, 429/5xx)에 지터를 넣은 지수 백오프로 재시도
+- CircuitBreaker: 계정별로 연속 실패가 쌓이면 일정 시간 요청을 멈춤 (사이트 장애/차단 시 계속 두드리지 않도록)
+"""
+import random
+import threading
+import time
+from typing import Optional
+
+
+class SearchRequestError(Exception):
+    """재시도 후에도 검색 요청이 실패함"""
+
+    def __init__(self, message: str, page: Optional[int] = None, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.page = page
+        self.status_code = status_code
+
+
+class CircuitOpenError(SearchRequestError):
+    """서킷 브레이커가 열려 있어 요청하지 않음"""
+
+
+class RetryPolicy:
+    """지수 백오프 재시도 정책 (full jitter)"""
+
+    RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0
+    ):
+        """
+        Args:
+            max_attempts: 최대 시도 횟수 (첫 요청 포함)
+            base_delay: 첫 재시도 대기 시간 상한(초), 시도할 때마다 2배
+            max_delay: 재시도 대기 시간 상한(초)
+            connect_timeout: 연결 제한 시간(초)
+            read_timeout: 응답 대기 제한 시간(초)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+    @classmethod
+    def from_config(cls, config) -> "RetryPolicy":
+        """config의 REQUEST_*_TIMEOUT, RETRY_* 설정으로 생성"""
+        return cls(
+            max_attempts=getattr(config, "RETRY_MAX_ATTEMPTS", 4),
+            base_delay=getattr(config, "RETRY_BASE_DELAY", 1.0),
+            max_delay=getattr(config, "RETRY_MAX_DELAY", 30.0),
+            connect_timeout=getattr(config, "REQUEST_CONNECT_TIMEOUT", 5.0),
+            read_timeout=getattr(config, "REQUEST_READ_TIMEOUT", 30.0)
+        )
+
+    @property
+    def timeout(self):
+        """requests에 전달할 (연결, 응답) 제한 시간"""
+        return (self.connect_timeout, self.read_timeout)
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.RETRYABLE_STATUS
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        attempt번째 시도가 실패한 뒤 기다릴 시간(초)
+
+        0 ~ min(max_delay, base_delay * 2^(attempt-1)) 사이에서 무작위로 고르고,
+        서버가 Retry-After(초)를 보냈으면 그보다 짧게 기다리지 않습니다.
+        """
+        wait = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        if retry_after:
+            try:
+                wait = max(wait, min(self.max_delay, float(retry_after)))
+            except ValueError:
+                pass  # HTTP 날짜 형식은 무시
+        return wait
+
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 서킷 브레이커 (스레드 안전)
+
+    closed: 정상 요청
+    open: failure_threshold번 연속 실패 → reset_timeout 동안 요청하지 않음
+    half_open: reset_timeout이 지나면 요청 1개만 시험 삼아 허용 (성공하면 closed, 실패하면 다시 open)
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0, name: str = ""):
+        """
+        Args:
+            failure_threshold: 열리기까지의 연속 실패 횟수
+            reset_timeout: 열린 뒤 다시 시험 요청을 허용하기까지의 시간(초)
+            name: 로그에 표시할 이름 (계정명)
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.name = name
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config, name: str = "") -> "CircuitBreaker":
+        """config의 CIRCUIT_* 설정으로 생성"""
+        return cls(
+            failure_threshold=getattr(config, "CIRCUIT_FAILURE_THRESHOLD", 5),
+            reset_timeout=getattr(config, "CIRCUIT_RESET_TIMEOUT", 60.0),
+            name=name
+        )
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """지금 요청해도 되는지 (half_open에서는 시험 요청 1개만 허용)"""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                if self._opened_at is None or self._trial_in_flight:
+                    print(f"🚫 [{self.name}] 연속 {self.failures}회 실패 - {self.reset_timeout:.0f}초 동안 요청 중단")
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
@@ -0,0 +1,400 @@
+"""
+인재 채점 (grade/grade.js 이식)
+
+검색 결과(PersonDataParser)와 이력서 상세(ResumeParser) 레코드에 점수를 매겨 "점수" 열로 저장합니다.
+JS로 JSON 파일을 다시 읽어 채점하던 단계를 수집 파이프라인 안으로 옮긴 것입니다.
+
+- 채점 규칙(키워드 사전/정규식/항목별 점수)은 코드가 아니라 data/scoring_rules/*.json에 정의하고 엔진이 해석
+  (직무별 규칙 선택과 변경 시 다시 읽기는 src/scoring_rules.py의 RuleSetRegistry)
+- 키워드 사전은 채점기 생성 시 Aho–Corasick 매처 1개로, 조건은 미리 함수로 컴파일
+- 같은 텍스트의 키워드 그룹과 구성 요소 점수는 채점기에 캐시 (레코드가 많아도 반복되는 값은 한 번만 계산)
+- score_batch()로 페이지 단위 채점
+
+grade.js와 같은 입력에 대해 같은 점수를 반환합니다 (정규화: 소문자 + 공백 정리, 키워드는 부분 문자열 일치).
+
+규칙 파일 형식:
+    {
+      "name": "보험 영업직",
+      "categories": [대분류...], "job_names": [중분류 직무...],   # 검색 조건으로 규칙을 고를 때 사용
+      "keywords": {그룹: [키워드...]},
+      "patterns": {이름: 정규식},                                # 대소문자 구분 없음, 값은 (?P<value>...) 그룹
+      "criteria": [{"name": 항목, "max": 상한, "components": [{"fields": [필드...], "tiers": [{"when": [조건...], "points": 점수}]}]}]
+    }
+항목(criteria)마다 구성 요소(components)의 점수를 더하고 max로 상한을 둡니다.
+구성 요소는 fields의 텍스트를 보고 tiers를 위에서부터 확인하여 처음 만족한 단계의 점수를 줍니다.
+조건(when)은 모두 만족해야 합니다:
+    {"any": [키워드 그룹]}                        그룹 중 하나라도 포함
+    {"pattern": "numberHit"}                      patterns의 정규식과 일치
+    {"pattern": "toeic", "value_gte": 900}        처음 일치한 value 그룹의 숫자가 값 이상
+    {"pattern": "opic", "value_match": "AL|IH"}   처음 일치한 value 그룹이 정규식과 일치 (빈 문자열이면 일치하기만 하면 만족)
+    {"nonempty": true}                            텍스트가 비어 있지 않음
+"""
+import json
+import re
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Union
+
+SCORE_COLUMN = "점수"
+
+# 기본 규칙 파일 (grade.js의 KW/RX/채점 기준을 옮긴 보험 영업직 규칙)
+RULES_DIR = "data/scoring_rules"
+DEFAULT_RULE_SET = "insurance_sales"
+
+# 한 채점기가 기억하는 (텍스트 → 키워드 그룹), (구성 요소 + 텍스트 → 점수) 수 (넘으면 비우고 다시 채움)
+GROUP_CACHE_SIZE = 200_000
+
+# grade.js 입력 필드 ← 검색 결과(PersonDataParser) 필드 (grade.js 형식 필드가 없을 때 사용)
+FIELD_ALIASES = {
+    "title": "제목",
+    "career": "경력",
+    "education": "학력",
+    "skills": "기술스택",
+    "지원분야_직무": "직무",
+}
+
+# 이력서 상세 목록 → grade.js 입력 필드: (목록 키, 입력 필드, 항목에서 이어 붙일 키, grade.js 형식 필드가 있으면 그대로 사용)
+DETAIL_FIELDS = (
+    ("경력상세", "경력상세", ("회사명", "부서", "직급", "담당업무"), False),
+    ("학력상세", "학력상세", ("학교명", "전공", "학위"), False),
+    ("자격증", "자격증상세", ("자격증명", "발행기관"), True),
+    ("어학", "어학능력상세", ("외국어", "시험명", "점수"), True),
+)
+ESSAY_SOURCE = "자기소개서"
+
+# 이력서 상세 자기소개서 문항 제목 → grade.js 입력 필드
+ESSAY_FIELDS = (
+    (("지원동기", "포부", "입사 후"), "자기소개서_지원동기및포부"),
+    (("성장", "성격", "장단점"), "자기소개서_성장과정및성격"),
+)
+ESSAY_DEFAULT_FIELD = "자기소개서_경험및역량"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text) -> str:
+    """grade.js norm(): 소문자 + 연속 공백을 한 칸으로 + 앞뒤 공백 제거"""
+    if text is None:
+        return ""
+    return _WHITESPACE.sub(" ", str(text).lower()).strip()
+
+
+def _to_text(value) -> str:
+    """grade.js bagJoin()의 원소 처리: 리스트는 공백으로, 나머지는 문자열로"""
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(v) for v in value)
+    return str(value)
+
+
+class KeywordMatcher:
+    """
+    키워드 그룹 사전을 Aho–Corasick 오토마톤으로 컴파일
+
+    groups_in(text)는 텍스트를 한 번만 훑어 키워드가 하나라도 포함된 그룹 이름을 모두 반환합니다.
+    키워드와 텍스트는 normalize_text로 정규화하여 비교합니다.
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        outputs: List[Set[str]] = [set()]
+
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                word = normalize_text(keyword)
+                if not word:
+                    continue
+                node = 0
+                for ch in word:
+                    child = self._goto[node].get(ch)
+                    if child is None:
+                        child = len(self._goto)
+                        self._goto[node][ch] = child
+                        self._goto.append({})
+                        self._fail.append(0)
+                        outputs.append(set())
+                    node = child
+                outputs[node].add(group)
+
+        # 실패 링크 (너비 우선), 실패 링크로 이어진 노드의 출력도 합침
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                outputs[child] |= outputs[self._fail[child]]
+
+        self._outputs: List[FrozenSet[str]] = [frozenset(o) for o in outputs]
+
+    def groups_in(self, normalized_text: str) -> FrozenSet[str]:
+        """정규화된 텍스트에 포함된 키워드 그룹"""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        node = 0
+        found: Set[str] = set()
+        for ch in normalized_text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if outputs[node]:
+                found |= outputs[node]
+        return frozenset(found)
+
+
+def scoring_fields(person: Dict) -> Dict[str, str]:
+    """
+    검색 결과/이력서 상세 레코드 → grade.js 입력 필드
+
+    grade.js 형식의 필드(경력요약, 자격증상세 등)가 이미 있으면 그대로 사용하고,
+    없으면 PersonDataParser 필드(제목/경력/학력/직무/기술스택)와
+    ResumeDetail.to_dict() 필드(자기소개서/경력상세/학력상세/자격증/어학)에서 만듭니다.
+    """
+    fields = {}
+    for key, value in person.items():
+        text = own_text(value)
+        if text is not None:
+            fields[key] = text
+
+    for field, source in FIELD_ALIASES.items():
+        fields.setdefault(field, _to_text(person.get(source)))
+
+    for source, field, keys, keep_existing in DETAIL_FIELDS:
+        items = item_list(person.get(source))
+        if items is not None and not (keep_existing and field in person):
+            fields[field] = detail_text(items, keys)
+    essays = item_list(person.get(ESSAY_SOURCE))
+    if essays is not None:
+        for field, text in essay_texts(essays).items():
+            fields.setdefault(field, text)
+    return fields
+
+
+def item_list(value) -> Optional[List]:
+    """목록 값(list/tuple, parquet/arrow에서 읽은 1차원 numpy 배열) → 리스트 (목록이 아니면 None)"""
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    if getattr(value, "ndim", None) == 1:
+        return list(value)
+    return None
+
+
+def own_text(value) -> Optional[str]:
+    """
+    레코드 값 → 그 필드 자체의 채점 텍스트
+
+    문자열/숫자는 문자열로, 딕셔너리가 없는 목록은 공백으로 이은 문자열로,
+    그 밖의 값(없음, 이력서 상세 딕셔너리 목록)은 None (BatchScorer도 같은 규칙 사용)
+    """
+    if isinstance(value, (str, int, float)):
+        return str(value)
+    items = item_list(value)
+    if items is not None and not any(isinstance(v, dict) for v in items):
+        return " ".join(str(v) for v in items)
+    return None
+
+
+def detail_text(items: List, keys: Iterable[str]) -> str:
+    """
+    이력서 상세 항목 목록 → 텍스트
+
+    딕셔너리 항목은 keys 순서의 값을 공백으로 잇고,
+    문자열 등 그 밖의 항목은 grade.js bagJoin()처럼 그대로 문자열로 이어 붙입니다 (None은 건너뜀).
+    """
+    keys = tuple(keys)
+    return " ".join(
+        " ".join(str(v) for v in (item.get(key) for key in keys) if v) if isinstance(item, dict) else _to_text(item)
+        for item in items if item is not None
+    )
+
+
+def essay_texts(items: List) -> Dict[str, str]:
+    """자기소개서 문항 목록 → {grade.js 자기소개서 필드: 본문} (문항 제목으로 분류, 문자열 항목은 제목 없는 본문)"""
+    essays: Dict[str, List[str]] = {}
+    for item in items:
+        if item is None:
+            continue
+        if not isinstance(item, dict):
+            essays.setdefault(ESSAY_DEFAULT_FIELD, []).append(_to_text(item))
+            continue
+        title = item.get("title") or ""
+        field = next((name for words, name in ESSAY_FIELDS if any(w in title for w in words)), ESSAY_DEFAULT_FIELD)
+        essays.setdefault(field, []).append(item.get("body_text") or "")
+    return {field: " ".join(bodies) for field, bodies in essays.items()}
+
+
+def load_rule_file(path: Union[str, Path]) -> Dict:
+    """규칙 파일(JSON) 읽기"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def default_rules() -> Dict:
+    """기본 규칙 (data/scoring_rules/insurance_sales.json)"""
+    return load_rule_file(Path(RULES_DIR) / f"{DEFAULT_RULE_SET}.json")
+
+
+class _RecordTexts:
+    """레코드 1개의 필드 묶음별 키워드 그룹 / 정규식 결과 캐시 (같은 필드를 보는 구성 요소끼리 공유)"""
+
+    def __init__(self, fields: Dict[str, str], scorer: "CandidateScorer"):
+        self.fields = fields
+        self.scorer = scorer
+        self._groups: Dict[tuple, FrozenSet[str]] = {}
+        self._patterns: Dict[tuple, Optional[re.Match]] = {}
+
+    def groups(self, fields: tuple) -> FrozenSet[str]:
+        """필드들의 텍스트에 포함된 키워드 그룹 (합집합)"""
+        found = self._groups.get(fields)
+        if found is None:
+            found = frozenset().union(*(self.scorer.groups_in(self.fields[f]) for f in fields if self.fields.get(f)))
+            self._groups[fields] = found
+        return found
+
+    def first_match(self, pattern: str, fields: tuple) -> Optional[re.Match]:
+        """필드를 순서대로 보며 처음 일치한 결과 (grade.js는 " | "로 이은 텍스트에서 첫 일치를 사용)"""
+        key = (pattern, fields)
+        if key not in self._patterns:
+            compiled = self.scorer.patterns[pattern]
+            matches = (compiled.search(self.fields[f]) for f in fields if self.fields.get(f))
+            self._patterns[key] = next((m for m in matches if m), None)
+        return self._patterns[key]
+
+
+Condition = Callable[[_RecordTexts, tuple], bool]
+
+
+class CandidateScorer:
+    """채점 규칙으로 인재 레코드에 점수 매기기"""
+
+    def __init__(self, rules: Optional[Dict] = None):
+        """
+        Args:
+            rules: 채점 규칙 (None이면 data/scoring_rules/insurance_sales.json)
+
+        Raises:
+            ValueError: 규칙에 없는 키워드 그룹/정규식을 쓰거나 조건 형식이 잘못된 경우
+        """
+        self.rules = rules or default_rules()
+        self.name = self.rules.get("name", "")
+        self.matcher = KeywordMatcher(self.rules["keywords"])
+        try:
+            self.patterns = {name: re.compile(expr, re.IGNORECASE) for name, expr in self.rules.get("patterns", {}).items()}
+        except re.error as e:
+            raise ValueError(f"채점 규칙 '{self.name}'의 정규식 오류: {e}") from e
+        # [(항목 이름, 상한, [(구성 요소 번호, 필드 묶음, [(조건 함수들, 점수)])])]
+        self.criteria = []
+        index = 0
+        for criterion in self.rules["criteria"]:
+            components = []
+            for component in criterion["components"]:
+                tiers = [(self._compile_tier(tier["when"]), tier["points"]) for tier in component["tiers"]]
+                components.append((index, tuple(component["fields"]), tiers))
+                index += 1
+            self.criteria.append((criterion["name"], criterion.get("max"), components))
+        self._group_cache: Dict[str, FrozenSet[str]] = {}
+        self._component_cache: Dict[tuple, int] = {}
+
+    def score(self, person: Dict) -> int:
+        """레코드 1개의 총점"""
+        return sum(self.score_detail(person).values())
+
+    def score_detail(self, person: Dict) -> Dict[str, int]:
+        """항목별 점수"""
+        fields = scoring_fields(person)
+        texts = None
+        cache = self._component_cache
+        detail = {}
+        for name, maximum, components in self.criteria:
+            points = 0
+            for index, names, tiers in components:
+                # 구성 요소 점수는 그 필드들의 텍스트로만 정해지므로 (구성 요소, 텍스트)로 캐시
+                key = (index, tuple(fields.get(f, "") for f in names))
+                component_points = cache.get(key)
+                if component_points is None:
+                    if texts is None:
+                        texts = _RecordTexts(fields, self)
+                    if len(cache) >= GROUP_CACHE_SIZE:
+                        cache.clear()
+                    component_points = cache[key] = self._component(texts, names, tiers)
+                points += component_points
+            if maximum is not None:
+                points = min(maximum, points)
+            detail[name] = points
+        return detail
+
+    def score_batch(self, people: List[Dict], column: str = SCORE_COLUMN) -> List[Dict]:
+        """페이지 1개 분량의 레코드에 점수 열 추가 (같은 리스트 반환)"""
+        for person in people:
+            person[column] = self.score(person)
+        return people
+
+    def groups_in(self, text: str) -> FrozenSet[str]:
+        """텍스트에 포함된 키워드 그룹 (같은 텍스트는 캐시)"""
+        found = self._group_cache.get(text)
+        if found is None:
+            if len(self._group_cache) >= GROUP_CACHE_SIZE:
+                self._group_cache.clear()
+            found = self._group_cache[text] = self.matcher.groups_in(normalize_text(text))
+        return found
+
+    @staticmethod
+    def _component(texts: _RecordTexts, fields: tuple, tiers: List[tuple]) -> int:
+        for conditions, points in tiers:
+            if all(check(texts, fields) for check in conditions):
+                return points
+        return 0
+
+    def _compile_tier(self, conditions: List[Dict]) -> List[Condition]:
+        return [self._compile_condition(condition) for condition in conditions]
+
+    def _compile_condition(self, condition: Dict) -> Condition:
+        """조건 1개 → check(texts, fields) 함수"""
+        if "any" in condition:
+            wanted = frozenset(condition["any"])
+            unknown = wanted - set(self.rules["keywords"])
+            if unknown:
+                raise ValueError(f"채점 규칙 '{self.name}'에 없는 키워드 그룹: {sorted(unknown)}")
+            return lambda texts, fields: not texts.groups(fields).isdisjoint(wanted)
+
+        if "pattern" in condition:
+            name = condition["pattern"]
+            if name not in self.patterns:
+                raise ValueError(f"채점 규칙 '{self.name}'에 없는 정규식: {name}")
+            if "value_gte" in condition:
+                threshold = condition["value_gte"]
+                return lambda texts, fields: _value_gte(texts.first_match(name, fields), threshold)
+            if "value_match" in condition:
+                expected = re.compile(condition["value_match"], re.IGNORECASE)
+                return lambda texts, fields: _value_match(texts.first_match(name, fields), expected)
+            return lambda texts, fields: texts.first_match(name, fields) is not None
+
+        if "nonempty" in condition:
+            expected = bool(condition["nonempty"])
+            return lambda texts, fields: any(texts.fields.get(field) for field in fields) == expected
+
+        raise ValueError(f"알 수 없는 채점 조건: {condition}")
+
+
+def _match_value(match: re.Match) -> str:
+    """정규식 결과의 value 그룹 (없으면 일치한 전체 문자열)"""
+    if "value" in match.re.groupindex:
+        return match.group("value") or ""
+    return match.group(0)
+
+
+def _value_gte(match: Optional[re.Match], threshold: float) -> bool:
+    if match is None:
+        return False
+    try:
+        return float(_match_value(match)) >= threshold
+    except ValueError:
+        return False
+
+
+def _value_match(match: Optional[re.Match], expected: re.Pattern) -> bool:
+    return match is not None and bool(expected.search(_match_value(match)))
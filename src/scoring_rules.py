@@ -0,0 +1,284 @@
+"""
+채점 규칙 관리 (직무별 규칙 선택 + 변경 시 다시 읽기)
+
+규칙은 두 곳에서 읽습니다.
+- data/scoring_rules/<이름>.json: 규칙 1개 (형식은 src/scoring.py 참고)
+- 엑셀 설정 파일의 "채점규칙" 시트: JSON 규칙을 기반으로 키워드 그룹만 바꾼 규칙 (채용 담당자가 엑셀에서 수정)
+
+    | 규칙셋    | 기반규칙         | 직무              | 대분류          | 그룹         | 키워드               |
+    | 신입영업  | insurance_sales  | 영업관리, 영업기획 | 영업·판매·무역 | generalSales | 영업, 세일즈, 판매   |
+
+    - 규칙셋: 규칙 이름 (JSON 파일 이름과 같으면 그 규칙을 덮어씀)
+    - 기반규칙: 항목/점수/정규식을 가져올 JSON 규칙 (비우면 같은 이름의 JSON, 없으면 insurance_sales)
+    - 직무: 이 규칙을 쓸 중분류 직무 (쉼표 구분, 선택)
+    - 대분류: 이 규칙을 쓸 대분류 (쉼표 구분, 선택, 비우면 기반규칙의 대분류)
+    - 그룹/키워드: 바꿀 키워드 그룹과 키워드 (쉼표 구분)
+
+파일은 SHA-256 해시로 변경을 감지하고(수정 시각/크기가 그대로면 해시도 다시 계산하지 않음),
+컴파일한 채점기는 규칙 내용의 해시로 캐시하므로 바뀐 규칙만 다시 컴파일합니다.
+get()은 check_interval초마다 파일을 확인하므로 오래 실행 중인 스크래퍼도 재시작 없이 새 규칙을 씁니다.
+잘못된 규칙 파일은 경고만 출력하고 이전 규칙을 계속 사용합니다.
+"""
+import copy
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from src.scoring import DEFAULT_RULE_SET, RULES_DIR, SCORE_COLUMN, CandidateScorer, load_rule_file
+
+RULES_SHEET = "채점규칙"
+
+
+def _file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _rules_hash(rules: Dict) -> str:
+    return hashlib.sha256(json.dumps(rules, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _split(value) -> List[str]:
+    """엑셀 셀의 쉼표 구분 값 → 리스트"""
+    if pd.isna(value):
+        return []
+    return [item.strip() for item in str(value).split(",") if item.strip()]
+
+
+def load_rule_sheet(excel_path: str, base_rules: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    엑셀 "채점규칙" 시트 → {규칙셋: 규칙}
+
+    Args:
+        excel_path: 엑셀 파일 경로
+        base_rules: 기반이 되는 JSON 규칙 {이름: 규칙}
+
+    Returns:
+        시트에 정의된 규칙 (시트가 없으면 빈 딕셔너리)
+    """
+    if RULES_SHEET not in pd.ExcelFile(excel_path).sheet_names:
+        return {}
+    df = pd.read_excel(excel_path, sheet_name=RULES_SHEET)
+
+    rule_sets: Dict[str, Dict] = {}
+    base_names: Dict[str, str] = {}
+    for _, row in df.iterrows():
+        if pd.isna(row.get("규칙셋")):
+            continue
+        name = str(row["규칙셋"]).strip()
+
+        if name not in rule_sets:
+            base_name = str(row["기반규칙"]).strip() if pd.notna(row.get("기반규칙")) else ""
+            base_name = base_name or (name if name in base_rules else DEFAULT_RULE_SET)
+            if base_name not in base_rules:
+                raise ValueError(f"'{RULES_SHEET}' 시트의 {name}: 기반규칙 '{base_name}'이 없습니다")
+            rules = copy.deepcopy(base_rules[base_name])
+            rules["name"] = name
+            rules["job_names"] = []
+            rules["categories"] = []
+            rule_sets[name] = rules
+            base_names[name] = base_name
+        rules = rule_sets[name]
+
+        for job in _split(row.get("직무")):
+            if job not in rules["job_names"]:
+                rules["job_names"].append(job)
+        for category in _split(row.get("대분류")):
+            if category not in rules["categories"]:
+                rules["categories"].append(category)
+        if pd.notna(row.get("그룹")):
+            rules["keywords"][str(row["그룹"]).strip()] = _split(row.get("키워드"))
+
+    # 대분류를 지정하지 않은 규칙은 기반규칙의 대분류를 그대로 사용
+    for name, rules in rule_sets.items():
+        if not rules["categories"]:
+            rules["categories"] = list(base_rules[base_names[name]].get("categories") or [])
+    return rule_sets
+
+
+class RuleSetRegistry:
+    """규칙 파일/시트를 읽어 규칙 이름별 CandidateScorer 제공 (변경되면 다시 읽기, 스레드 안전)"""
+
+    def __init__(self, rules_dir: str = RULES_DIR, excel_path: Optional[str] = None, check_interval: float = 2.0):
+        """
+        Args:
+            rules_dir: JSON 규칙 디렉토리
+            excel_path: "채점규칙" 시트를 읽을 엑셀 파일 (None이면 JSON만)
+            check_interval: 파일 변경을 확인하는 최소 간격(초), 0이면 get()마다 확인
+        """
+        self.rules_dir = Path(rules_dir)
+        self.excel_path = Path(excel_path) if excel_path else None
+        self.check_interval = check_interval
+        self.version = 0  # 규칙이 바뀔 때마다 1 증가
+
+        self._lock = threading.Lock()
+        self._last_check = 0.0
+        self._stats: Dict[Path, Tuple[int, int, str]] = {}  # 경로 → (수정 시각, 크기, 해시)
+        self._file_rules: Dict[Path, Dict] = {}             # 마지막으로 정상적으로 읽은 JSON 규칙
+        self._sheet_rules: Dict[str, Dict] = {}
+        self._signature: Optional[tuple] = None
+        self._rules: Dict[str, Dict] = {}
+        self._scorers: Dict[str, CandidateScorer] = {}
+        self._compiled: Dict[str, CandidateScorer] = {}     # 규칙 내용 해시 → 채점기
+        self.reload()
+
+    # ---------- 조회 ----------
+
+    def get(self, name: Optional[str] = None) -> CandidateScorer:
+        """규칙 이름의 채점기 (None이면 기본 규칙, 파일이 바뀌었으면 다시 읽은 뒤 반환)"""
+        if time.monotonic() - self._last_check >= self.check_interval:
+            self.reload()
+        name = name or self.default_name()
+        try:
+            return self._scorers[name]
+        except KeyError:
+            raise KeyError(f"채점 규칙이 없습니다: {name} (있는 규칙: {', '.join(self.names()) or '-'})") from None
+
+    def names(self) -> List[str]:
+        return sorted(self._scorers)
+
+    def default_name(self) -> str:
+        if DEFAULT_RULE_SET in self._scorers or not self._scorers:
+            return DEFAULT_RULE_SET
+        return self.names()[0]
+
+    def select(self, search_config: Dict) -> str:
+        """
+        검색 조건(ExcelConfigParser.parse 결과)에 맞는 규칙 이름
+
+        중분류 직무가 가장 많이 겹치는 규칙, 없으면 대분류가 겹치는 규칙, 둘 다 없으면 기본 규칙.
+        겹치는 수가 같으면 "채점규칙" 시트의 규칙을 JSON 규칙보다 먼저 고릅니다 (채용 담당자가 수정한 규칙 우선).
+        """
+        jobs = set(search_config.get("job_names") or ())
+        categories = set(search_config.get("categories") or ())
+        best, best_key = self.default_name(), (0, 0, False)
+        for name in self.names():
+            rules = self._rules[name]
+            overlap = (len(jobs & set(rules.get("job_names") or ())), len(categories & set(rules.get("categories") or ())))
+            if not any(overlap):
+                continue
+            key = overlap + (name in self._sheet_rules,)
+            if key > best_key:
+                best, best_key = name, key
+        return best
+
+    def scorer(self, name: Optional[str] = None) -> "ReloadingScorer":
+        """규칙이 바뀌면 자동으로 새 규칙을 쓰는 채점기 (JobKoreaScraper의 scorer로 전달)"""
+        return ReloadingScorer(self, name or self.default_name())
+
+    # ---------- 다시 읽기 ----------
+
+    def reload(self) -> bool:
+        """파일이 바뀌었으면 다시 읽고 바뀐 규칙만 컴파일 (바뀐 것이 있으면 True)"""
+        with self._lock:
+            self._last_check = time.monotonic()
+            paths = sorted(self.rules_dir.glob("*.json")) if self.rules_dir.is_dir() else []
+            if self.excel_path is not None and self.excel_path.exists():
+                paths.append(self.excel_path)
+
+            signature = tuple((path, digest) for path in paths for digest in [self._hash(path)] if digest)
+            if signature == self._signature:
+                return False
+            previous, current = dict(self._signature or ()), dict(signature)
+            self._signature = signature
+            self._stats = {path: stat for path, stat in self._stats.items() if path in current}
+
+            # 바뀐 JSON만 다시 파싱, 삭제된 파일의 규칙은 제거
+            for path, digest in current.items():
+                if path != self.excel_path and previous.get(path) != digest:
+                    self._load_file(path)
+            self._file_rules = {path: rules for path, rules in self._file_rules.items() if path in current}
+            base_rules = {path.stem: rules for path, rules in self._file_rules.items()}
+
+            # 시트 규칙은 기반 JSON 규칙에도 의존하므로 무엇이든 바뀌면 다시 만듦
+            if self.excel_path in current:
+                self._load_sheet(base_rules)
+            else:
+                self._sheet_rules = {}
+
+            self._rules = {**base_rules, **self._sheet_rules}
+            self._compile()
+            self.version += 1
+            return True
+
+    def _hash(self, path: Path) -> str:
+        """파일 해시 (수정 시각/크기가 그대로면 이전 값, 그 사이 삭제되었으면 빈 문자열)"""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return ""
+        cached = self._stats.get(path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        try:
+            digest = _file_hash(path)
+        except FileNotFoundError:
+            return ""
+        self._stats[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def _load_file(self, path: Path):
+        try:
+            self._file_rules[path] = load_rule_file(path)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  채점 규칙 파일을 읽지 못해 이전 규칙을 사용합니다: {path} ({e})")
+
+    def _load_sheet(self, base_rules: Dict[str, Dict]):
+        try:
+            self._sheet_rules = load_rule_sheet(str(self.excel_path), base_rules)
+        except Exception as e:  # 엑셀 저장 중 읽기, 잘못된 시트 형식 등
+            print(f"⚠️  '{RULES_SHEET}' 시트를 읽지 못해 이전 규칙을 사용합니다: {self.excel_path} ({e})")
+
+    def _compile(self):
+        """규칙 내용 해시로 캐시된 채점기 재사용, 바뀐 규칙만 컴파일"""
+        scorers, compiled = {}, {}
+        for name, rules in self._rules.items():
+            digest = _rules_hash(rules)
+            scorer = self._compiled.get(digest)
+            if scorer is None:
+                try:
+                    scorer = CandidateScorer(rules)
+                except (KeyError, TypeError, ValueError) as e:
+                    print(f"⚠️  채점 규칙 '{name}' 컴파일 실패, 이전 규칙을 사용합니다: {e!r}")
+                    scorer = self._scorers.get(name)
+                    if scorer is None:
+                        continue
+                else:
+                    if name in self._scorers:
+                        print(f"🔄 채점 규칙 다시 읽음: {name}")
+            scorers[name] = scorer
+            compiled[_rules_hash(scorer.rules)] = scorer
+        self._scorers = scorers
+        self._compiled = compiled
+
+
+class ReloadingScorer:
+    """RuleSetRegistry의 규칙 1개를 가리키는 채점기 (호출할 때마다 최신 규칙 사용)"""
+
+    def __init__(self, registry: RuleSetRegistry, name: str):
+        self.registry = registry
+        self.name = name
+        self._last: Optional[CandidateScorer] = None
+
+    @property
+    def current(self) -> CandidateScorer:
+        """최신 채점기 (규칙 파일이 삭제되었으면 마지막 채점기)"""
+        try:
+            self._last = self.registry.get(self.name)
+        except KeyError:
+            if self._last is None:
+                raise
+        return self._last
+
+    def score(self, person: Dict) -> int:
+        return self.current.score(person)
+
+    def score_detail(self, person: Dict) -> Dict[str, int]:
+        return self.current.score_detail(person)
+
+    def score_batch(self, people: List[Dict], column: str = SCORE_COLUMN) -> List[Dict]:
+        return self.current.score_batch(people, column)
@@ -1,14 +1,23 @@
 """잡코리아 스크래퍼 메인 클래스"""
+import asyncio
 import json
+import os
+import threading
 import time
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Union
 
 from src.config import JobKoreaConfig
 from src.payload_manager import PayloadManager
 from src.api_client import JobKoreaAPIClient
-from src.parser import PersonDataParser
+from src.checkpoint import CheckpointState, ScrapeCheckpoint
+from src.dedup import DedupIndex
+from src.candidate_store import CandidateStore
+from src.retry import CircuitOpenError, SearchRequestError
+from src.parser import ParsedPage, PersonDataParser
 from src.exporter import ExcelExporter
+from src.scoring import CandidateScorer
+from src.scoring_rules import ReloadingScorer
 
 
 class JobKoreaScraper:
@@ -19,20 +28,53 @@ class JobKoreaScraper:
         config: JobKoreaConfig,
         payload_manager: PayloadManager,
         output_dir: str = ".",
-        filter_active_within_minutes: Optional[int] = None
+        filter_active_within_minutes: Optional[int] = None,
+        dedup_index: Optional[DedupIndex] = None,
+        account_name: str = "",
+        candidate_store: Optional[CandidateStore] = None,
+        scorer: Optional[Union[CandidateScorer, ReloadingScorer]] = None
     ):
+        """
+        Args:
+            config: 잡코리아 설정
+            payload_manager: payload 관리자
+            output_dir: 출력 디렉토리
+            filter_active_within_minutes: 최근활동 필터링 (분 단위, None이면 필터링 안 함)
+            dedup_index: 이력서번호 중복 제거 인덱스 (여러 계정이 공유 가능, None이면 중복 제거 안 함)
+            account_name: 중복 제거 인덱스/변경 감지 저장소에 기록할 계정명
+            candidate_store: 변경 감지 저장소 (지정하면 새로 나타났거나 바뀐 인재만 수집하고,
+                페이지 전체가 변경 없는 인재면 다음 페이지를 요청하지 않음,
+                결과를 저장한 뒤 commit_changes()로 지문을 기록)
+            scorer: 인재 채점기 (지정하면 페이지마다 "점수" 열을 추가하고 엑셀에도 저장,
+                ReloadingScorer면 규칙 파일이 바뀔 때 수집 중에도 새 규칙 적용)
+        """
         self.config = config
         self.api_client = JobKoreaAPIClient(config, payload_manager)
         self.parser = PersonDataParser(config.BASE_URL, filter_active_within_minutes=filter_active_within_minutes)
-        self.exporter = ExcelExporter()
+        self.scorer = scorer
+        self.exporter = ExcelExporter(ExcelExporter.SCORED_COLUMNS if scorer is not None else None)
         self.output_dir = Path(output_dir)
+        self.pages_fetched = 0  # 실제로 요청한 페이지 수 (실행 통계용)
+        self.dedup_index = dedup_index
+        self.account_name = account_name
+        self.duplicates_removed = 0  # 중복으로 제외한 인재 수 (실행 통계용)
+        self.candidate_store = candidate_store
+        if candidate_store is not None:
+            candidate_store.discard(account_name)  # 이전 실행에서 저장하지 못한 지문은 버림
+        self.unchanged_skipped = 0  # 변경 없어 제외한 인재 수 (실행 통계용)
+        self.failed_pages: List[int] = []  # 재시도 후에도 수집하지 못한 페이지
 
     def scrape(
         self,
         start_page: int = 1,
-        end_page: int = 1,
+        end_page: Optional[int] = 1,
         page_size: int = 10,
-        delay: float = 1.0,
+        delay: float = 0.0,
+        on_page: Optional[Callable[[int, List[Dict[str, str]]], None]] = None,
+        keep_results: bool = True,
+        checkpoint: Optional[ScrapeCheckpoint] = None,
+        resume: bool = False,
+        adaptive: bool = False,
         **search_options
     ) -> List[Dict[str, str]]:
 
@@ -41,40 +83,391 @@ class JobKoreaScraper:
 
         Args:
             start_page: 시작 페이지
-            end_page: 종료 페이지
+            end_page: 종료 페이지 (None이면 카드가 페이지 크기보다 적은 페이지까지 수집, adaptive 모드로 동작)
             page_size: 페이지당 결과 수
-            delay: 페이지 간 지연 시간(초)
+            delay: 페이지 간 추가 지연 시간(초, 요청 간격은 RateLimiter가 조절하므로 기본 0)
+            on_page: 페이지 처리 후 호출할 콜백 (page, 해당 페이지 인재 리스트)
+            keep_results: False면 결과를 누적하지 않고 빈 리스트 반환 (on_page로 바로 저장하는 스트리밍용)
+            checkpoint: 페이지 단위 진행 저널 (None이면 기록 안 함)
+            resume: True면 checkpoint에 기록된 마지막 페이지 다음부터 이어서 수집
+            adaptive: True면 더 이상 결과가 없거나 최근활동 기간 안의 인재가 없는 페이지에서 수집 종료
             **search_options: 검색 옵션 (job_name, areas, education)
         """
         all_people = []
         current_index = 1  # 전체 누적 번호
         saveno = 0  # 🔥 검색 세션 ID (1페이지는 0, 2페이지부터 필요)
+        retry_queue: List[int] = []  # 요청에 실패한 페이지 (마지막에 다시 요청)
+        requested_end_page = end_page  # 체크포인트 완료 범위 (adaptive 모드에서 end_page가 바뀌기 전 값)
+        self.failed_pages = []
+
+        if checkpoint is not None:
+            state = self._restore_checkpoint(checkpoint, resume, end_page, on_page)
+            if state.last_page is not None:
+                start_page = state.last_page + 1
+                saveno = state.saveno
+                current_index = state.next_index
+                if keep_results:
+                    all_people = state.people
+            retry_queue = [p for p in state.failed_pages if p < start_page]
+            if state.done:
+                return all_people
+
+        adaptive = adaptive or end_page is None
+        circuit_open = False
 
-        for page in range(start_page, end_page + 1):
-            # saveno 포함하여 검색
-            response = self.api_client.search(page, page_size, saveno=saveno, **search_options)
+        page = start_page
+        while end_page is None or page <= end_page:
+            # saveno 포함하여 검색 (실패하면 재시도 대기열에 넣고 다음 페이지로)
+            try:
+                response = self.api_client.search(page, page_size, saveno=saveno, **search_options)
+            except SearchRequestError as e:
+                self._queue_failed_page(retry_queue, page, e, checkpoint)
+                if isinstance(e, CircuitOpenError):
+                    circuit_open = True
+                    break
+                if delay:
+                    time.sleep(delay)
+                page += 1
+                continue
+            self.pages_fetched += 1
 
             if "application/json" in response.headers.get("Content-Type", ""):
                 self._save_json(response.json(), page)
+                if end_page is None:
+                    break  # 다음 페이지 여부를 알 수 없음
             else:
-                # 🔥 HTML에서 saveNo 추출 (다음 페이지 요청용)
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.text, 'html.parser')
-                saveno_elem = soup.select_one('input#saveNo')
-                if saveno_elem and saveno_elem.get('value'):
-                    saveno = int(saveno_elem.get('value'))
+                # 데이터 파싱 (인재 목록 + saveNo 등 메타데이터를 한 번에)
+                parsed = self._process_html(response.text, page, start_index=current_index, page_size=page_size)
+                people = parsed.people
+
+                # 🔥 saveNo 갱신 (다음 페이지 요청용)
+                if parsed.saveno:
+                    saveno = parsed.saveno
                     print(f"📌 saveNo 추출: {saveno}")
 
-                # 데이터 파싱
-                people = self._process_html(response.text, page, start_index=current_index)
-                all_people.extend(people)
+                if keep_results:
+                    all_people.extend(people)
                 current_index += len(people)  # 다음 페이지 시작 번호
 
-            if page < end_page:
+                if checkpoint is not None:
+                    checkpoint.record_page(page, saveno, current_index, people)
+
+                if on_page:
+                    on_page(page, people)
+
+                stop_reason = self._stop_reason(parsed, adaptive)
+                if stop_reason:
+                    print(f"⏹️  {stop_reason} - page {page}에서 수집 종료")
+                    break
+
+            if delay and (end_page is None or page < end_page):
                 time.sleep(delay)
+            page += 1
+
+        # 실패한 페이지 재요청 (번호는 이미 수집한 인재 뒤에 이어서 붙임)
+        if retry_queue and not circuit_open:
+            for page in list(retry_queue):
+                if delay:
+                    time.sleep(delay)
+                print(f"🔁 실패한 page {page} 다시 요청")
+                try:
+                    response = self.api_client.search(page, page_size, saveno=saveno, **search_options)
+                except SearchRequestError as e:
+                    print(f"❌ page {page} 다시 실패: {e}")
+                    continue
+                self.pages_fetched += 1
+                retry_queue.remove(page)
+                if "application/json" in response.headers.get("Content-Type", ""):
+                    self._save_json(response.json(), page)
+                    continue
+
+                parsed = self._process_html(response.text, page, start_index=current_index, page_size=page_size)
+                people = parsed.people
+                if keep_results:
+                    all_people.extend(people)
+                current_index += len(people)
+                if checkpoint is not None:
+                    checkpoint.record_page(page, saveno, current_index, people)
+                if on_page:
+                    on_page(page, people)
+
+        self._finish(retry_queue, checkpoint, requested_end_page)
+        return all_people
+
+    async def scrape_async(
+        self,
+        start_page: int = 1,
+        end_page: Optional[int] = 1,
+        page_size: int = 10,
+        delay: float = 0.0,
+        max_in_flight: int = 4,
+        on_page: Optional[Callable[[int, List[Dict[str, str]]], None]] = None,
+        keep_results: bool = True,
+        checkpoint: Optional[ScrapeCheckpoint] = None,
+        resume: bool = False,
+        adaptive: bool = False,
+        **search_options
+    ) -> List[Dict[str, str]]:
+        """
+        인재 검색 및 데이터 수집 (비동기)
+
+        첫 페이지로 saveNo를 받은 뒤 처리 중인 페이지 다음 max_in_flight개 페이지를 미리 요청하고,
+        도착한 페이지는 순서대로 별도 스레드에서 파싱하여 네트워크와 파싱이 겹치도록 합니다.
+        (수집을 일찍 끝내면 미리 요청한 페이지는 취소)
+
+        Args:
+            start_page: 시작 페이지
+            end_page: 종료 페이지 (None이면 카드가 페이지 크기보다 적은 페이지까지 수집, adaptive 모드로 동작)
+            page_size: 페이지당 결과 수
+            delay: 요청 시작 간격(초, 요청 간격은 RateLimiter가 조절하므로 기본 0)
+            max_in_flight: 동시에 진행할 최대 요청 수
+            on_page: 페이지 처리 후 호출할 콜백 (page, 해당 페이지 인재 리스트)
+            keep_results: False면 결과를 누적하지 않고 빈 리스트 반환 (on_page로 바로 저장하는 스트리밍용)
+            checkpoint: 페이지 단위 진행 저널 (None이면 기록 안 함)
+            resume: True면 checkpoint에 기록된 마지막 페이지 다음부터 이어서 수집
+            adaptive: True면 더 이상 결과가 없거나 최근활동 기간 안의 인재가 없는 페이지에서 수집 종료
+            **search_options: 검색 옵션 (job_name, areas, education)
+        """
+        from src.async_api_client import AsyncJobKoreaAPIClient
+
+        loop = asyncio.get_running_loop()
+        all_people = []
+        current_index = 1
+        saveno = 0
+        retry_queue: List[int] = []  # 요청에 실패한 페이지 (마지막에 다시 요청)
+        requested_end_page = end_page  # 체크포인트 완료 범위 (adaptive 모드에서 end_page가 바뀌기 전 값)
+        self.failed_pages = []
+
+        if checkpoint is not None:
+            state = self._restore_checkpoint(checkpoint, resume, end_page, on_page)
+            if state.last_page is not None:
+                start_page = state.last_page + 1
+                saveno = state.saveno
+                current_index = state.next_index
+                if keep_results:
+                    all_people = state.people
+            retry_queue = [p for p in state.failed_pages if p < start_page]
+            if state.done:
+                return all_people
+
+        if end_page is not None and start_page > end_page and not retry_queue:
+            if checkpoint is not None:
+                checkpoint.mark_done(requested_end_page)
+            return all_people
+
+        auto_end_page = end_page is None
+        adaptive = adaptive or auto_end_page
+        circuit_open = False
+
+        async with AsyncJobKoreaAPIClient.from_sync_client(self.api_client, max_in_flight=max_in_flight) as client:
+            if end_page is None or start_page <= end_page:
+                # 첫 페이지: saveNo 획득 (이후 페이지는 같은 saveNo 재사용, 이어서 수집하면 저장된 saveNo 사용)
+                try:
+                    first = await client.search(start_page, page_size, saveno=saveno, **search_options)
+                    self.pages_fetched += 1
+                except SearchRequestError as e:
+                    first = None
+                    self._queue_failed_page(retry_queue, start_page, e, checkpoint)
+                    circuit_open = isinstance(e, CircuitOpenError)
+
+                first_parsed = None
+                if first is None:
+                    pass  # 다음 페이지 여부는 다음에 받은 페이지로 판단
+                elif "application/json" not in first.headers.get("Content-Type", ""):
+                    first_parsed = await loop.run_in_executor(
+                        None, self._process_html, first.text, start_page, current_index, page_size
+                    )
+                    if first_parsed.saveno:
+                        saveno = first_parsed.saveno
+                        print(f"📌 saveNo 추출: {saveno}")
+                elif auto_end_page:
+                    end_page = start_page  # 다음 페이지 여부를 알 수 없음
+
+                async def fetch(page: int, wait: float):
+                    await asyncio.sleep(wait)
+                    response = await client.search(page, page_size, saveno=saveno, **search_options)
+                    self.pages_fetched += 1
+                    return response
 
+                pending: Dict[int, asyncio.Future] = {}
+                next_page = start_page + 1
+                launch_at = loop.time()
+
+                def launch_ahead(current: int):
+                    """current 다음 max_in_flight개 페이지까지 요청 시작 (요청 시작 간격은 delay 유지)"""
+                    nonlocal next_page, launch_at
+                    while next_page <= current + max_in_flight and (end_page is None or next_page <= end_page):
+                        launch_at = max(launch_at + delay, loop.time())
+                        pending[next_page] = asyncio.ensure_future(fetch(next_page, launch_at - loop.time()))
+                        next_page += 1
+
+                try:
+                    page = start_page
+                    while not circuit_open and (end_page is None or page <= end_page):
+                        launch_ahead(page)
+                        if page == start_page:
+                            response = first
+                        else:
+                            try:
+                                response = await pending.pop(page)
+                            except SearchRequestError as e:
+                                response = None
+                                self._queue_failed_page(retry_queue, page, e, checkpoint)
+                                circuit_open = isinstance(e, CircuitOpenError)
+
+                        if response is None:
+                            page += 1
+                            continue
+
+                        if "application/json" in response.headers.get("Content-Type", ""):
+                            self._save_json(response.json(), page)
+                            if end_page is None:
+                                break  # 다음 페이지 여부를 알 수 없음
+                            page += 1
+                            continue
+
+                        if page == start_page:
+                            parsed = first_parsed
+                        else:
+                            # 파싱은 스레드에서 실행 (그동안 다음 페이지 요청은 계속 진행)
+                            parsed = await loop.run_in_executor(
+                                None, self._process_html, response.text, page, current_index, page_size
+                            )
+                            if parsed.saveno and not saveno:
+                                saveno = parsed.saveno
+                        people = parsed.people
+                        if keep_results:
+                            all_people.extend(people)
+                        current_index += len(people)
+
+                        if checkpoint is not None:
+                            checkpoint.record_page(page, saveno, current_index, people)
+
+                        if on_page:
+                            on_page(page, people)
+
+                        stop_reason = self._stop_reason(parsed, adaptive)
+                        if stop_reason:
+                            print(f"⏹️  {stop_reason} - page {page}에서 수집 종료")
+                            break
+                        page += 1
+                finally:
+                    for task in pending.values():
+                        task.cancel()
+
+            # 실패한 페이지 재요청 (번호는 이미 수집한 인재 뒤에 이어서 붙임)
+            if retry_queue and not circuit_open:
+                for page in list(retry_queue):
+                    if delay:
+                        await asyncio.sleep(delay)
+                    print(f"🔁 실패한 page {page} 다시 요청")
+                    try:
+                        response = await client.search(page, page_size, saveno=saveno, **search_options)
+                    except SearchRequestError as e:
+                        print(f"❌ page {page} 다시 실패: {e}")
+                        continue
+                    self.pages_fetched += 1
+                    retry_queue.remove(page)
+                    if "application/json" in response.headers.get("Content-Type", ""):
+                        self._save_json(response.json(), page)
+                        continue
+
+                    parsed = await loop.run_in_executor(
+                        None, self._process_html, response.text, page, current_index, page_size
+                    )
+                    people = parsed.people
+                    if keep_results:
+                        all_people.extend(people)
+                    current_index += len(people)
+                    if checkpoint is not None:
+                        checkpoint.record_page(page, saveno, current_index, people)
+                    if on_page:
+                        on_page(page, people)
+
+        self._finish(retry_queue, checkpoint, requested_end_page)
         return all_people
 
+    def _queue_failed_page(
+        self,
+        retry_queue: List[int],
+        page: int,
+        error: SearchRequestError,
+        checkpoint: Optional[ScrapeCheckpoint] = None
+    ):
+        """요청에 실패한 페이지를 재시도 대기열에 추가 (체크포인트에도 기록하여 중단되어도 잃지 않도록)"""
+        print(f"❌ page {page} 요청 실패: {error} - 나중에 다시 요청")
+        if page not in retry_queue:
+            retry_queue.append(page)
+        if checkpoint is not None:
+            checkpoint.record_failed(page, str(error))
+
+    def _finish(
+        self,
+        retry_queue: List[int],
+        checkpoint: Optional[ScrapeCheckpoint] = None,
+        end_page: Optional[int] = None
+    ):
+        """수집 종료 (수집하지 못한 페이지가 없을 때만 체크포인트에 완료 표시, end_page는 요청한 끝 페이지)"""
+        self.failed_pages = sorted(retry_queue)
+        if self.failed_pages:
+            print(f"⚠️  수집하지 못한 페이지: {self.failed_pages} (resume=True로 다시 실행하면 이 페이지부터 다시 요청)")
+        elif checkpoint is not None:
+            checkpoint.mark_done(end_page)
+
+    def _stop_reason(self, parsed: ParsedPage, adaptive: bool = False) -> Optional[str]:
+        """
+        다음 페이지를 요청하지 않아도 되는 이유 (계속 수집하면 None)
+
+        adaptive 모드에서는 검색 결과가 최근활동 순으로 정렬되어 있으므로
+        기간 안의 인재가 한 명도 없는 페이지 이후는 요청하지 않습니다.
+        """
+        if self.candidate_store is not None and parsed.unchanged_count and not parsed.people:
+            return "페이지 전체가 변경 없는 인재"
+
+        if adaptive:
+            if not parsed.card_count:
+                return "검색 결과 없음"
+            window = self.parser.filter_active_within_minutes
+            if window is not None and not parsed.active_count:
+                return f"최근 {window}분 이내 활동한 인재 없음"
+            if not parsed.has_next:
+                return "마지막 페이지"
+        return None
+
+    def _restore_checkpoint(
+        self,
+        checkpoint: ScrapeCheckpoint,
+        resume: bool,
+        end_page: Optional[int] = None,
+        on_page: Optional[Callable[[int, List[Dict[str, str]]], None]] = None
+    ) -> CheckpointState:
+        """
+        체크포인트 복원 (resume=False면 저널을 비우고 처음부터)
+
+        완료된 저널이라도 이번 end_page가 완료 당시보다 뒤면 이어서 수집합니다.
+        이미 수집한 페이지는 on_page로 다시 전달하여 스트리밍 저장 결과에도 포함되도록 합니다.
+        """
+        if not resume:
+            checkpoint.reset()
+            return CheckpointState()
+
+        state = checkpoint.load(end_page)
+        if state.last_page is None:
+            return state
+        if not state.done and state.saveno_expired:
+            print("⏯️  저장된 saveNo가 만료되어 새 검색 세션으로 이어서 수집")
+
+        status = "이미 완료됨" if state.done else f"{state.last_page + 1}페이지부터 이어서 수집"
+        print(f"⏯️  체크포인트 복원: {state.last_page}페이지까지 {len(state.people)}명 ({status})")
+        for entry in state.pages:
+            if self.dedup_index is not None:
+                self.dedup_index.register(entry["records"], self.account_name, entry["page"])
+            if self.candidate_store is not None:
+                self.candidate_store.stage(entry["records"], self.account_name)
+            if on_page:
+                on_page(entry["page"], entry["records"])
+        return state
+
     def _save_json(self, data: dict, page: int):
         """JSON 응답 저장"""
         filepath = self.output_dir / f"result_page{page}.json"
@@ -82,18 +475,54 @@ class JobKoreaScraper:
             json.dump(data, f, ensure_ascii=False, indent=2)
         print(f"✅ {filepath} 저장 완료")
 
-    def _process_html(self, html: str, page: int, start_index: int = 1) -> List[Dict[str, str]]:
-        """HTML 응답 처리 및 저장"""
-        # HTML 파일 저장
+    def _process_html(
+        self,
+        html: str,
+        page: int,
+        start_index: int = 1,
+        page_size: Optional[int] = None
+    ) -> ParsedPage:
+        """HTML 응답 처리 및 저장 (한 번의 파싱으로 인재 목록과 페이지 메타데이터 반환)"""
+        # HTML 파일 저장 (병렬 실행 시 같은 파일을 동시에 쓰지 않도록 임시 파일 후 교체)
         html_filepath = self.output_dir / f"result_page{page}.html"
-        with open(html_filepath, "w", encoding="utf-8") as f:
+        tmp_filepath = html_filepath.with_name(f"{html_filepath.name}.{threading.get_ident()}.tmp")
+        with open(tmp_filepath, "w", encoding="utf-8") as f:
             f.write(html)
+        os.replace(tmp_filepath, html_filepath)
+
+        # 데이터 파싱 (시작 번호 전달, 이미 수집한 인재의 카드는 건너뛰고 인덱스의 중복 통계에 집계)
+        skip_rno = None
+        if self.dedup_index is not None:
+            skip_rno = lambda rno: self.dedup_index.seen(rno, self.account_name)
+        parsed = self.parser.parse_page(html, start_index=start_index, page_size=page_size, skip_rno=skip_rno)
 
-        # 데이터 파싱 (시작 번호 전달)
-        people = self.parser.parse_html(html, start_index=start_index)
+        if self.dedup_index is not None:
+            # 같은 페이지 안의 중복과 동시에 실행 중인 다른 계정이 먼저 등록한 인재까지 제외
+            new_people = self.dedup_index.add_new(parsed.people, self.account_name, page)
+            parsed.duplicate_count += len(parsed.people) - len(new_people)
+            parsed.people = new_people
+            self.duplicates_removed += parsed.duplicate_count
+
+        if self.candidate_store is not None:
+            parsed.people, parsed.unchanged_count = self.candidate_store.filter_changed(parsed.people, self.account_name)
+            self.unchanged_skipped += parsed.unchanged_count
+
+        if self.scorer is not None:
+            self.scorer.score_batch(parsed.people)
+
+        people = parsed.people
         print(f"✅ {len(people)}명 파싱 완료 (page {page}, 번호 {start_index}~{start_index+len(people)-1})")
+        if parsed.duplicate_count:
+            print(f"🔁 중복 {parsed.duplicate_count}명 제외 (page {page})")
+        if parsed.unchanged_count:
+            print(f"♻️  변경 없음 {parsed.unchanged_count}명 제외 (page {page})")
+
+        return parsed
 
-        return people
+    def commit_changes(self):
+        """변경 감지 저장소에 이번 수집에서 확인한 지문 기록 (결과 파일을 저장한 뒤 호출)"""
+        if self.candidate_store is not None:
+            self.candidate_store.commit(self.account_name)
 
     def save_results(self, people: List[Dict[str, str]]):
         """수집한 데이터 저장 (JSON + Excel)"""
@@ -111,3 +540,4 @@ class JobKoreaScraper:
         # 엑셀 저장
         excel_filepath = self.output_dir / "백엔드개발자_검색결과.xlsx"
         self.exporter.save(people, str(excel_filepath))
+        self.commit_changes()
@@ -0,0 +1,151 @@
+"""
+로그인 세션 캐시
+
+계정별 로그인 쿠키(jkat, jkrt, JSESSIONID 등)를 디스크에 저장해 두고
+만료 전까지 재사용하여 실행할 때마다 Login.asp에 로그인하지 않도록 합니다.
+
+만료 시각은 다음 중 가장 이른 시각입니다.
+- 로그인 쿠키의 expires
+- jkat(JWT)의 exp
+- 저장 시각 + ttl
+"""
+import base64
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from requests.cookies import RequestsCookieJar
+
+
+class SessionCache:
+    """계정별 로그인 쿠키 파일 캐시"""
+
+    LOGIN_COOKIES = ['JSESSIONID', 'JKUID', 'jkat', 'jkrt', 'JK_User']
+    TOKEN_COOKIE = "jkat"
+    EXPIRY_MARGIN = 60  # 만료 직전 세션은 사용하지 않음(초)
+
+    def __init__(self, cache_dir: str = ".session_cache", ttl: float = 6 * 60 * 60):
+        """
+        Args:
+            cache_dir: 캐시 파일 디렉토리
+            ttl: 쿠키에 만료 정보가 없을 때 최대 재사용 시간(초)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    @classmethod
+    def from_config(cls, config) -> Optional["SessionCache"]:
+        """config의 SESSION_CACHE_* 설정으로 생성 (SESSION_CACHE_DIR이 없으면 None, 캐시 사용 안 함)"""
+        cache_dir = getattr(config, "SESSION_CACHE_DIR", None)
+        if not cache_dir:
+            return None
+        return cls(cache_dir, ttl=getattr(config, "SESSION_CACHE_TTL", 6 * 60 * 60))
+
+    def path_for(self, username: str) -> Path:
+        """계정별 캐시 파일 경로 (파일명에 아이디가 드러나지 않도록 해시 사용)"""
+        digest = hashlib.sha256(username.encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{digest}.json"
+
+    def load(self, username: str) -> Optional[RequestsCookieJar]:
+        """
+        저장된 쿠키 로드
+
+        Returns:
+            만료되지 않은 쿠키 저장소, 없거나 만료되었으면 None
+        """
+        path = self.path_for(username)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("username") != username:
+            return None
+
+        if entry.get("expires_at", 0) - self.EXPIRY_MARGIN <= time.time():
+            print(f"⌛ 저장된 로그인 세션 만료: {username}")
+            self.invalidate(username)
+            return None
+
+        jar = RequestsCookieJar()
+        for cookie in entry.get("cookies", []):
+            jar.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain") or "",
+                path=cookie.get("path") or "/",
+                expires=cookie.get("expires"),
+                secure=cookie.get("secure", False)
+            )
+        return jar
+
+    def save(self, username: str, cookies: RequestsCookieJar):
+        """로그인 쿠키 저장 (소유자만 읽을 수 있는 파일로 원자적 기록)"""
+        saved_at = time.time()
+        entry = {
+            "username": username,
+            "saved_at": saved_at,
+            "expires_at": self.expires_at(cookies, saved_at),
+            "cookies": [
+                {
+                    "name": cookie.name,
+                    "value": cookie.value,
+                    "domain": cookie.domain,
+                    "path": cookie.path,
+                    "expires": cookie.expires,
+                    "secure": cookie.secure,
+                }
+                for cookie in cookies
+            ],
+        }
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(username)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def invalidate(self, username: str):
+        """저장된 쿠키 삭제"""
+        try:
+            self.path_for(username).unlink()
+        except FileNotFoundError:
+            pass
+
+    def expires_at(self, cookies: RequestsCookieJar, saved_at: Optional[float] = None) -> float:
+        """로그인 쿠키의 만료 시각 (epoch 초)"""
+        saved_at = time.time() if saved_at is None else saved_at
+        candidates: List[float] = [saved_at + self.ttl]
+
+        for cookie in cookies:
+            if cookie.name in self.LOGIN_COOKIES and cookie.expires:
+                candidates.append(float(cookie.expires))
+
+        token_exp = self._jwt_exp(cookies.get(self.TOKEN_COOKIE))
+        if token_exp:
+            candidates.append(token_exp)
+
+        return min(candidates)
+
+    @staticmethod
+    def _jwt_exp(token: Optional[str]) -> Optional[float]:
+        """JWT payload의 exp (JWT가 아니거나 exp가 없으면 None)"""
+        if not token or token.count(".") != 2:
+            return None
+
+        payload = token.split(".")[1]
+        try:
+            decoded = base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+            claims: Dict = json.loads(decoded)
+        except (ValueError, TypeError):
+            return None
+
+        exp = claims.get("exp") if isinstance(claims, dict) else None
+        return float(exp) if isinstance(exp, (int, float)) else None
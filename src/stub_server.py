@@ -0,0 +1,209 @@
+"""
+로컬 스텁 서버 - detailsearchajax POST에 녹화된 result_page*.html을 응답
+
+실제 잡코리아에 요청하지 않고 스크래퍼/병렬 실행을 확인할 때 사용합니다.
+JobKoreaConfig.API_URL을 StubSearchServer.api_url로 덮어쓰면 됩니다.
+HTTP/1.1 keep-alive로 연결을 유지하고, Accept-Encoding에 gzip이 있으면 압축해서 응답합니다.
+"""
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+EMPTY_RESULT_PAGE = (
+    '<!DOCTYPE html>\n<html lang="ko">\n<body>\n'
+    '<div class="resultHeader">\n  <input type="hidden" id="saveNo" value="{saveno}">\n</div>\n'
+    '<table class="tblList">\n<tbody>\n</tbody>\n</table>\n</body>\n</html>\n'
+)
+
+
+class StubSearchServer:
+    """녹화된 검색 결과 페이지를 응답하는 로컬 HTTP 서버"""
+
+    SEARCH_PATH = "/corp/person/detailsearchajax"
+
+    def __init__(
+        self,
+        pages_dir: str = "data/fixtures",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0
+    ):
+        """
+        Args:
+            pages_dir: result_page{N}.html 파일이 있는 디렉토리
+            host: 바인딩 호스트
+            port: 바인딩 포트 (0이면 빈 포트 자동 선택)
+            latency: 응답 전 지연 시간(초)
+        """
+        self.pages_dir = Path(pages_dir)
+        self.latency = latency
+        self.pages = self._load_pages()
+        self.request_count = 0
+        self.bytes_sent = 0  # 응답 본문 누적 크기 (압축 후)
+        self.connection_count = 0  # 받은 TCP 연결 수 (연결 재사용 확인용)
+        self._gzip_cache: Dict[int, bytes] = {}
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    def _load_pages(self) -> Dict[int, bytes]:
+        """result_page{N}.html 파일을 페이지 번호별로 로드"""
+        pages = {}
+        for path in self.pages_dir.glob("result_page*.html"):
+            number = path.stem.replace("result_page", "")
+            if number.isdigit():
+                pages[int(number)] = path.read_bytes()
+
+        if not pages:
+            print(f"⚠️  녹화된 페이지가 없습니다: {self.pages_dir}/result_page*.html")
+        return pages
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self) -> str:
+        return self.url + self.SEARCH_PATH
+
+    def start(self) -> "StubSearchServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        print(f"🧪 스텁 서버 시작: {self.api_url} (녹화 페이지 {len(self.pages)}개)")
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "StubSearchServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def page_body(self, page: int, saveno: int = 0) -> bytes:
+        """페이지 번호에 해당하는 응답 본문 (녹화가 없으면 빈 결과 페이지)"""
+        if page in self.pages:
+            return self.pages[page]
+        return EMPTY_RESULT_PAGE.format(saveno=saveno).encode("utf-8")
+
+    def gzip_body(self, key, body: bytes) -> bytes:
+        """gzip으로 압축한 응답 본문 (key가 있으면 한 번만 압축, None이면 매번 압축)"""
+        if key is None:
+            return gzip.compress(body)
+        if key not in self._gzip_cache:
+            self._gzip_cache[key] = gzip.compress(body)
+        return self._gzip_cache[key]
+
+    def handle(self, handler: BaseHTTPRequestHandler, method: str):
+        """요청 1개 처리 (검색 POST만 응답, 하위 클래스에서 경로 추가)"""
+        if method != "POST" or not handler.path.startswith(self.SEARCH_PATH):
+            handler.send_error(404)
+            return
+
+        condition = self.read_search_condition(handler)
+        if condition is None:
+            return
+
+        with self._lock:
+            self.request_count += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        page = int(condition.get("p", 1))
+        body = self.page_body(page, int(condition.get("saveno", 0)))
+        self.send(handler, 200, body, cache_key=page if page in self.pages else None)
+
+    @staticmethod
+    def read_form(handler: BaseHTTPRequestHandler) -> Dict[str, list]:
+        """요청 본문(form) 읽기"""
+        length = int(handler.headers.get("Content-Length", 0))
+        return parse_qs(handler.rfile.read(length).decode("utf-8"))
+
+    def read_search_condition(self, handler: BaseHTTPRequestHandler) -> Optional[Dict]:
+        """검색 요청의 searchCondition (없으면 400 응답 후 None)"""
+        form = self.read_form(handler)
+        try:
+            return json.loads(form["searchCondition"][0])
+        except (KeyError, ValueError):
+            handler.send_error(400, "searchCondition missing")
+            return None
+
+    def send(
+        self,
+        handler: BaseHTTPRequestHandler,
+        status: int,
+        body: bytes,
+        cache_key=None,
+        headers: Optional[List[Tuple[str, str]]] = None,
+        content_type: str = "text/html; charset=utf-8"
+    ):
+        """응답 전송 (Accept-Encoding에 gzip이 있으면 압축, cache_key가 같은 본문은 한 번만 압축)"""
+        gzipped = "gzip" in handler.headers.get("Accept-Encoding", "")
+        if gzipped:
+            body = self.gzip_body(cache_key, body)
+
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        for name, value in headers or ():
+            handler.send_header(name, value)
+        if gzipped:
+            handler.send_header("Content-Encoding", "gzip")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+        with self._lock:
+            self.bytes_sent += len(body)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive (모든 응답에 Content-Length 포함)
+            disable_nagle_algorithm = True  # keep-alive 연결에서 작은 쓰기가 지연되지 않도록
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connection_count += 1
+
+            def do_POST(self):
+                server.handle(self, "POST")
+
+            def do_GET(self):
+                server.handle(self, "GET")
+
+            def log_message(self, format, *args):
+                pass  # 요청 로그 출력 안 함
+
+        return Handler
+
+
+if __name__ == "__main__":
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="녹화된 result_page*.html을 응답하는 스텁 서버")
+    arg_parser.add_argument("--pages-dir", default="data/fixtures")
+    arg_parser.add_argument("--port", type=int, default=8765)
+    arg_parser.add_argument("--latency", type=float, default=0.0)
+    args = arg_parser.parse_args()
+
+    stub = StubSearchServer(args.pages_dir, port=args.port, latency=args.latency).start()
+    try:
+        stub._thread.join()
+    except KeyboardInterrupt:
+        stub.stop()
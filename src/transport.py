@@ -0,0 +1,165 @@
+"""
+HTTP 전송 계층 (연결 풀 / 압축 / HTTP/2)
+
+검색 응답은 페이지당 수백 KB의 HTML이므로 연결 재사용과 압축 전송이 지연 시간과 대역폭에 큰 영향을 줍니다.
+
+- 프로세스 안의 모든 세션(계정별 검색 세션, 로그인 세션)이 어댑터 1개의 연결 풀을 공유
+  (HTTP_* 설정이 다른 config는 그 설정으로 만든 어댑터를 따로 공유)
+  (쿠키는 세션별로 따로 관리되므로 계정 간에 섞이지 않음)
+- Accept-Encoding으로 gzip/deflate(brotli 설치 시 br까지) 압축 응답 요청
+- HTTP2_ENABLED=True이고 httpx[http2]가 설치되어 있으면 HTTP/2로 요청 (한 연결에서 여러 요청 동시 처리)
+- RECORD_SESSION_PATH를 설정하면 모든 요청/응답을 아카이브에 녹화 (src/replay.py, 부하 테스트 재생용)
+"""
+import threading
+from email.message import Message
+from typing import Dict
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.util.request import ACCEPT_ENCODING
+
+from src.replay import RecordingAdapter, SessionRecorder
+
+try:
+    import httpx
+except ImportError:  # HTTP/2는 선택 기능
+    httpx = None
+
+
+class _Http2Raw:
+    """requests가 응답 쿠키를 세션에 반영할 때 읽는 raw 응답 흉내 (본문은 이미 읽은 상태)"""
+
+    def __init__(self, headers, http_version: str):
+        self._original_response = self
+        self.msg = Message()
+        for name, value in headers.multi_items():
+            self.msg[name] = value
+        self.version = 20 if http_version == "HTTP/2" else 11
+
+    def info(self):
+        return self.msg
+
+    def read(self, *args, **kwargs) -> bytes:
+        return b""
+
+    def close(self):
+        pass
+
+
+class Http2Adapter(BaseAdapter):
+    """
+    httpx 연결 풀로 요청을 보내는 requests 어댑터 (HTTP/2)
+
+    쿠키/리다이렉트는 requests.Session이 처리하고, 어댑터는 요청 1개를 전송만 합니다.
+    httpx의 쿠키 저장소를 거치지 않으므로 여러 계정의 세션이 공유해도 안전합니다.
+    """
+
+    def __init__(self, pool_maxsize: int = 32):
+        super().__init__()
+        if httpx is None:
+            raise ImportError("HTTP/2를 사용하려면 httpx[http2]를 설치하세요: pip install 'httpx[http2]'")
+        self._transport = httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize)
+        )
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        connect_timeout, read_timeout = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        http_request = httpx.Request(
+            request.method,
+            request.url,
+            headers=list(request.headers.items()),
+            content=request.body,
+            extensions={"timeout": {
+                "connect": connect_timeout, "read": read_timeout, "write": read_timeout, "pool": connect_timeout
+            }}
+        )
+
+        try:
+            http_response = self._transport.handle_request(http_request)
+            try:
+                content = http_response.read()  # Content-Encoding(gzip/br) 해제
+            finally:
+                http_response.close()
+        except httpx.ConnectTimeout as e:
+            raise requests.ConnectTimeout(e, request=request)
+        except httpx.TimeoutException as e:
+            raise requests.ReadTimeout(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e, request=request)
+
+        response = requests.Response()
+        response.status_code = http_response.status_code
+        response.reason = http_response.reason_phrase
+        response.headers = CaseInsensitiveDict(http_response.headers)
+        response.headers.pop("Content-Encoding", None)  # 본문은 이미 압축 해제됨
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = _Http2Raw(http_response.headers, http_response.extensions.get("http_version", b"").decode())
+        response._content = content
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        """세션을 닫아도 다른 세션이 쓰는 공유 연결 풀은 유지"""
+
+
+_shared_adapters: Dict[tuple, BaseAdapter] = {}
+_shared_lock = threading.Lock()
+
+
+def _adapter_settings(config=None) -> tuple:
+    """어댑터 생성에 쓰는 HTTP_* 설정 (같은 설정끼리 어댑터를 공유)"""
+    return (
+        bool(getattr(config, "HTTP2_ENABLED", False)),
+        getattr(config, "HTTP_POOL_CONNECTIONS", 10),
+        getattr(config, "HTTP_POOL_MAXSIZE", 32),
+        getattr(config, "HTTP_POOL_BLOCK", False),
+        getattr(config, "RECORD_SESSION_PATH", None),
+    )
+
+
+def get_http_adapter(config=None) -> BaseAdapter:
+    """
+    프로세스에서 공유하는 어댑터 (config의 HTTP_* 설정별로 처음 호출할 때 생성)
+
+    설정이 같은 config끼리 연결 풀을 공유하고, 설정이 다르면 그 설정으로 만든 어댑터를 따로 사용합니다.
+    HTTP2_ENABLED=True여도 httpx[http2]가 없으면 경고 후 HTTP/1.1 연결 풀을 사용합니다.
+    RECORD_SESSION_PATH가 있으면 연결 풀 어댑터를 녹화 어댑터로 감쌉니다 (쿠키/비밀번호는 지우고 기록).
+    """
+    settings = _adapter_settings(config)
+    http2_enabled, pool_connections, pool_maxsize, pool_block, record_path = settings
+    with _shared_lock:
+        adapter = _shared_adapters.get(settings)
+        if adapter is None:
+            if http2_enabled:
+                try:
+                    adapter = Http2Adapter(pool_maxsize=pool_maxsize)
+                except ImportError as e:
+                    print(f"⚠️  {e} (HTTP/1.1 사용)")
+            if adapter is None:
+                adapter = HTTPAdapter(
+                    pool_connections=pool_connections,
+                    pool_maxsize=pool_maxsize,
+                    max_retries=0,  # 재시도는 RetryPolicy가 담당
+                    pool_block=pool_block
+                )
+            if record_path:
+                adapter = RecordingAdapter(adapter, SessionRecorder(record_path))
+                print(f"📼 요청/응답 녹화: {record_path}")
+            _shared_adapters[settings] = adapter
+        return adapter
+
+
+def create_session(config=None) -> requests.Session:
+    """공유 연결 풀을 사용하고 압축 응답을 요청하는 세션 생성"""
+    session = requests.Session()
+    adapter = get_http_adapter(config)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING.replace(",", ", ")
+    return session
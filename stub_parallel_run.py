@@ -0,0 +1,63 @@
+"""
+스텁 서버로 다중 계정 병렬 실행 확인
+실제 잡코리아에 요청하지 않고 data/fixtures/result_page*.html을 응답으로 사용
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from main import run_all_accounts
+from src.stub_server import StubSearchServer
+
+
+def build_workbook(path: Path, account_count: int):
+    """계정 시트 + 계정별 검색조건 시트로 구성된 테스트용 엑셀 생성"""
+    accounts = [f"stub_user{i}" for i in range(1, account_count + 1)]
+
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"아이디": accounts, "비밀번호": ["pw"] * account_count}).to_excel(
+            writer, sheet_name="계정", index=False
+        )
+        for account in accounts:
+            pd.DataFrame({
+                "대분류": ["인사·HR"],
+                "지역": ["서울전지역"],
+                "중분류": ["인사담당자"],
+            }).to_excel(writer, sheet_name=account, index=False)
+
+
+def main():
+    account_count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    with tempfile.TemporaryDirectory() as tmp, StubSearchServer("data/fixtures", latency=0.05) as stub:
+        excel_path = Path(tmp) / "stub_accounts.xlsx"
+        build_workbook(excel_path, account_count)
+
+        summary = run_all_accounts(
+            excel_path=str(excel_path),
+            start_page=1,
+            end_page=3,
+            page_size=100,
+            delay=0.1,
+            output_dir=tmp,
+            workers=workers,
+            config_overrides={
+                "API_URL": stub.api_url,
+                "USE_AUTO_LOGIN": False,
+                "COOKIE_STR": "",
+            }
+        )
+
+        print(f"스텁 서버 요청 수: {stub.request_count}")
+        if summary is None:
+            print("❌ 실행할 계정이 없습니다")
+            return 1
+        print(summary.as_dict())
+        return 0 if summary.fail_count == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())